@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""
+Chrome 동시 사용 수 전역 제한 (admission control).
+
+드라이버 풀에서 드라이버를 빌리기 전에 acquire(source) 로 자리를 받아야 한다.
+  - BROWSER_BUDGET           : 프로세스 전체에서 동시에 쓰는 브라우저 수 상한
+  - BROWSER_BUDGETS          : 소스(풀 이름)별 상한, 예) "jobplanet_detail=3,inflearn=1"
+                               지정하지 않은 소스는 드라이버 풀 크기가 상한이다 (get_pool 이 register_source 로 등록).
+                               한 소스가 자기 풀에서 기다리면서 전역 자리를 모두 차지하지 못하게 한다.
+  - ADMISSION_QUEUE_MAX      : 자리를 기다릴 수 있는 요청 수. 넘으면 기다리지 않고 바로 거절
+  - ADMISSION_WAIT_SEC       : 최대 대기 시간. 넘으면 거절
+거절은 AdmissionRejected (status=503) 로 알린다. 호출자는 '잠시 후 다시 시도' 응답을 주면 된다.
+사이트 크롤링 도중(상세 페이지 등) 거절되면 스크래퍼는 그때까지 모은 결과를 partial 에 담아 올린다.
+
+driver_pool 은 살아있는 브라우저(대여중 + 유휴) 수도 BROWSER_BUDGET 안으로 유지한다:
+새로 띄워야 하는데 이미 BROWSER_BUDGET 개가 떠 있으면 다른 풀의 유휴 드라이버를 먼저 종료한다.
+"""
+import os
+import time
+import threading
+from typing import Dict
+
+BROWSER_BUDGET = int(os.getenv("BROWSER_BUDGET", "6"))
+ADMISSION_QUEUE_MAX = int(os.getenv("ADMISSION_QUEUE_MAX", "8"))
+ADMISSION_WAIT_SEC = float(os.getenv("ADMISSION_WAIT_SEC", "30"))
+
+
+def _parse_budgets(spec: str) -> Dict[str, int]:
+    budgets: Dict[str, int] = {}
+    for item in (spec or "").split(","):
+        key, sep, val = item.partition("=")
+        if not sep:
+            continue
+        try:
+            budgets[key.strip()] = int(val)
+        except ValueError:
+            continue
+    return budgets
+
+
+SOURCE_BUDGETS = _parse_budgets(os.getenv("BROWSER_BUDGETS", ""))
+
+
+class AdmissionRejected(RuntimeError):
+    status = 503
+
+    def __init__(self, source: str, reason: str):
+        super().__init__(f"browser capacity exceeded for '{source}': {reason}")
+        self.source = source
+        self.reason = reason
+        self.partial: list = []     # 거절 전까지 모은 결과 (스크래퍼가 채운다)
+
+
+_cond = threading.Condition()
+_in_use: Dict[str, int] = {}
+_total = 0
+_waiting = 0
+STATS = {"admitted": 0, "rejected_queue": 0, "rejected_timeout": 0, "waited": 0, "wait_total": 0.0, "wait_max": 0.0}
+
+
+def _has_room(source: str) -> bool:
+    limit = SOURCE_BUDGETS.get(source)
+    return _total < BROWSER_BUDGET and (limit is None or _in_use.get(source, 0) < limit)
+
+
+def register_source(source: str, budget: int):
+    """source 의 기본 상한 등록 (BROWSER_BUDGETS 에 명시된 값이 있으면 그쪽을 따른다)."""
+    with _cond:
+        SOURCE_BUDGETS.setdefault(source, max(1, int(budget)))
+
+
+def acquire(source: str, timeout: float = None) -> float:
+    """브라우저 1개 자리 확보. 기다린 초를 반환. 대기열이 꽉 찼거나 시간 초과면 AdmissionRejected."""
+    global _total, _waiting
+    timeout = ADMISSION_WAIT_SEC if timeout is None else timeout
+    with _cond:
+        waited = 0.0
+        if not _has_room(source):
+            if _waiting >= ADMISSION_QUEUE_MAX:
+                STATS["rejected_queue"] += 1
+                raise AdmissionRejected(source, f"wait queue full ({_waiting} waiting)")
+            _waiting += 1
+            start = time.monotonic()
+            try:
+                ok = _cond.wait_for(lambda: _has_room(source), timeout)
+            finally:
+                _waiting -= 1
+            waited = time.monotonic() - start
+            if not ok:
+                STATS["rejected_timeout"] += 1
+                raise AdmissionRejected(source, f"no slot within {timeout:.1f}s")
+            STATS["waited"] += 1
+            STATS["wait_total"] += waited
+            STATS["wait_max"] = max(STATS["wait_max"], waited)
+        _in_use[source] = _in_use.get(source, 0) + 1
+        _total += 1
+        STATS["admitted"] += 1
+        return waited
+
+
+def release(source: str):
+    global _total
+    with _cond:
+        if _in_use.get(source, 0) <= 0:
+            return
+        _in_use[source] -= 1
+        _total -= 1
+        _cond.notify_all()
+
+
+def admission_stats() -> dict:
+    with _cond:
+        stats = dict(STATS)
+        stats.update({
+            "budget": BROWSER_BUDGET,
+            "source_budgets": dict(SOURCE_BUDGETS),
+            "in_use": _total,
+            "in_use_by_source": {k: v for k, v in _in_use.items() if v},
+            "queue_depth": _waiting,
+            "queue_max": ADMISSION_QUEUE_MAX,
+        })
+    stats["wait_avg"] = stats["wait_total"] / stats["waited"] if stats["waited"] else 0.0
+    return stats
@@ -1,9 +1,11 @@
 # -*- coding: utf-8 -*-
 from dotenv import load_dotenv
 load_dotenv()
-from flask import Flask, render_template, request, redirect, url_for, flash, get_flashed_messages
+from flask import Flask, render_template, request, redirect, url_for, flash, get_flashed_messages, Response, stream_with_context
 import json
 import os
+import sys
+import time
 import traceback
 import threading
 from datetime import datetime, timedelta
@@ -19,11 +21,22 @@ from finance_api import (
     build_chart_bundle,
 )
 import re
-from typing import List, Dict
+from typing import List, Dict, Tuple
 from datetime import datetime, timedelta, date
 from zoneinfo import ZoneInfo
 from jk_crawler import search_jobs as jk_search_jobs
+from rate_limit import rate_stats
+from driver_pool import pool_stats
+from driver_watchdog import snapshot as driver_snapshot
+from load_profile import BLOCK_STATS
+from admission import AdmissionRejected, admission_stats
 import concurrent.futures
+import result_cache
+import result_store
+import dedup
+from single_flight import SingleFlight
+from crawl_jobs import CrawlJobQueue
+from deadline import Deadline
 
 if not os.path.exists("static"):
     os.mkdir("static")
@@ -31,13 +44,53 @@ if not os.path.exists("templates"):
     os.mkdir("templates")
 
 USER_FILE = "users.json"
-CACHE_DIR = "cache"
+CACHE_DIR = result_cache.CACHE_DIR
+SCRAPE_CACHE_SOURCE = "scrape"   # 사이트별 항목: scrape_jobplanet / scrape_jobkorea / scrape_incruit
+SCRAPE_SITES = ("jobplanet", "jobkorea", "incruit")
+SCRAPE_CACHE_MIN = os.getenv("SCRAPE_CACHE_MIN", "15")
+# 사이트별 신선 기간. 상세 페이지까지 도는 잡플래닛은 크롤링 비용이 커서 더 오래 둔다.
+SCRAPE_CACHE_LIFETIMES = {
+    "jobplanet": timedelta(minutes=int(os.getenv("SCRAPE_CACHE_MIN_JOBPLANET", "60"))),
+    "jobkorea": timedelta(minutes=int(os.getenv("SCRAPE_CACHE_MIN_JOBKOREA", SCRAPE_CACHE_MIN))),
+    "incruit": timedelta(minutes=int(os.getenv("SCRAPE_CACHE_MIN_INCRUIT", SCRAPE_CACHE_MIN))),
+}
+# 신선 기간이 지난 뒤에도 이 기간 동안은 이전 결과를 즉시 보여주고 백그라운드에서 갱신
+SCRAPE_STALE_GRACE = timedelta(minutes=int(os.getenv("SCRAPE_STALE_GRACE_MIN", "60")))
+# 검색 요청 하나의 시간 예산(초). 지나면 그때까지 모은 결과를 사이트별 완결 여부와 함께 돌려준다
+SCRAPE_DEADLINE_SEC = float(os.getenv("SCRAPE_DEADLINE_SEC", "90"))
+# 예산이 끝난 뒤 스크래퍼가 부분 결과를 정리해 돌려줄 때까지 더 기다리는 시간
+SCRAPE_DEADLINE_GRACE_SEC = float(os.getenv("SCRAPE_DEADLINE_GRACE_SEC", "3"))
 if not os.path.exists(CACHE_DIR):
     os.makedirs(CACHE_DIR)
+result_cache.start_sweeper()
 
 app = Flask(__name__)
 app.secret_key = os.getenv("FLASK_SECRET_KEY", "super-secret-key-for-flash")
 
+# 동일한 크롤링/조회가 동시에 들어오면 한 번만 실행하고 결과를 나눠 쓴다
+flight = SingleFlight()
+# /scrape 크롤링은 요청 스레드가 아니라 이 워커 풀에서 돈다
+crawl_queue = CrawlJobQueue()
+# 진행 상황 전달 방식: "1" SSE 스트리밍, "0" 폴링, "auto" 비동기 워커(gevent/eventlet)·개발 서버일 때만 스트리밍.
+# SSE 연결은 작업이 끝날 때까지 워커를 붙잡으므로 gunicorn sync 워커에서는 폴링으로 대신한다 (gunicorn.conf.py 참고).
+CRAWL_STREAMING = os.getenv("CRAWL_STREAMING", "auto")
+# 브라우저 수용량 초과(AdmissionRejected) 시 사용자 안내
+BUSY_MESSAGE = "지금은 검색 요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요."
+
+def _async_worker() -> bool:
+    """gevent/eventlet 이 소켓을 몽키패치한 워커인지 (이미 로드된 경우만 확인, 여기서 import 하지 않는다)."""
+    gevent_monkey = sys.modules.get("gevent.monkey")
+    if gevent_monkey is not None and gevent_monkey.is_module_patched("socket"):
+        return True
+    eventlet_patcher = sys.modules.get("eventlet.patcher")
+    return eventlet_patcher is not None and eventlet_patcher.is_monkey_patched("socket")
+
+def streaming_enabled() -> bool:
+    if CRAWL_STREAMING != "auto":
+        return CRAWL_STREAMING == "1"
+    # 개발 서버(app.run)는 요청마다 스레드를 만들므로 연결을 오래 잡아도 된다
+    return _async_worker() or request.environ.get("SERVER_SOFTWARE", "").startswith("Werkzeug")
+
 def load_users():
     if not os.path.exists(USER_FILE) or os.path.getsize(USER_FILE) == 0:
         return {}
@@ -124,14 +177,111 @@ def start_scrape():
     if 'user' not in request.cookies:
         return redirect(url_for('index'))
     keyword = request.args.get("keyword")
-    count = request.args.get("count")
-    if not keyword or not count:
+    count_str = request.args.get("count")
+    if not keyword or not count_str:
         flash("키워드와 개수를 모두 입력해주세요.")
         return redirect(url_for('crawler_page'))
-    return render_template("crawler_loading.html", keyword=keyword, count=count, username=login_id)
+    try:
+        count = int(count_str)
+        if count <= 0: raise ValueError
+    except ValueError:
+        flash("개수는 1 이상의 숫자여야 합니다.")
+        return redirect(url_for('crawler_page'))
+
+    # 크롤링은 백그라운드 워커 풀에서: 요청 스레드는 작업 id 만 받고 바로 응답
+    job = crawl_queue.submit(
+        ("scrape", result_cache.normalize_keyword(keyword), count), run_scrape, keyword, count,
+        meta={"keyword": keyword, "count": count},
+    )
+    if job is None:
+        flash("지금은 검색 요청이 많습니다. 잠시 후 다시 시도해주세요.")
+        return redirect(url_for('crawler_page'))
+    if not streaming_enabled():
+        # 스트리밍을 못 쓰면 로딩 화면이 /api/crawl_status 를 폴링하다 결과 페이지로 넘어간다
+        return redirect(url_for('scrape_result', job_id=job.id))
+    # 빈 결과 화면을 먼저 보여주고, /api/crawl_stream 으로 사이트/공고가 나오는 대로 채운다
+    return render_template("crawler_result.html", keyword=keyword, count=count, job_id=job.id,
+                             results={}, result_sets={}, from_cache=False, stale=False, complete={},
+                             active_page='crawler', username=login_id)
+
+@app.route("/api/crawl_status/<job_id>")
+def crawl_status(job_id):
+    if 'user' not in request.cookies:
+        return {"ok": False, "error": "auth"}, 401
+    job = crawl_queue.get(job_id)
+    if job is None:
+        return {"ok": False, "error": "unknown job"}, 404
+    reason = crawl_queue.lost(job_id)
+    if reason:
+        return {"ok": False, "error": reason}, 410
+    return {"ok": True, **job.status()}
+
+@app.route("/api/crawl_stream/<job_id>")
+def crawl_stream(job_id):
+    """
+    SSE: 작업 이벤트를 쌓인 순서대로 흘려보낸다.
+      site    {site, jobs, result_set, state, complete}  사이트 하나의 결과 (캐시 또는 크롤링 완료)
+      posting {site, job}                      상세 페이지 하나를 읽을 때마다 (잡플래닛)
+      done    {results, result_sets, ...}      중복을 합친 최종 결과 / error {error}
+    재접속 시 Last-Event-ID 다음 이벤트부터 보낸다.
+    이벤트 없이 15초가 지날 때마다 작업이 사라지거나 멈췄는지(crawl_queue.lost) 확인하고, 그렇다면 error 로 끝낸다.
+    스트리밍이 꺼져 있으면(sync 워커) 연결을 받지 않는다: /api/crawl_status 폴링을 쓴다.
+    """
+    if 'user' not in request.cookies:
+        return {"ok": False, "error": "auth"}, 401
+    if not streaming_enabled():
+        return {"ok": False, "error": "streaming disabled"}, 404
+    job = crawl_queue.get(job_id)
+    if job is None:
+        return {"ok": False, "error": "unknown job"}, 404
+    try:
+        start = int(request.headers.get("Last-Event-ID", "-1")) + 1
+    except ValueError:
+        start = 0
+
+    def stream():
+        i = start
+        while True:
+            events = job.wait_events(i, timeout=15)
+            if not events:
+                # 실행하던 워커가 죽었거나 작업이 만료되면 done/error 가 오지 않으므로 여기서 끝낸다
+                reason = crawl_queue.lost(job_id)
+                if reason:
+                    data = {"error": reason, "status": 410}
+                    yield f"id: {i}\nevent: error\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+                    return
+                yield ": keepalive\n\n"
+                continue
+            for event, data in events:
+                yield f"id: {i}\nevent: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+                i += 1
+                if event in ("done", "error"):
+                    return
+
+    return Response(stream_with_context(stream()), mimetype="text/event-stream",
+                    headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+@app.route("/scrape_result/<job_id>")
+def scrape_result(job_id):
+    login_id = request.cookies.get('user')
+    if not login_id:
+        flash("로그인이 필요합니다.")
+        return redirect(url_for('index'))
+    job = crawl_queue.get(job_id)
+    if job is None:
+        flash("검색 작업이 만료되었습니다. 다시 검색해주세요.")
+        return redirect(url_for('crawler_page'))
+    keyword, count = job.meta["keyword"], job.meta["count"]
+    if job.state in ("queued", "running"):
+        return render_template("crawler_loading.html", keyword=keyword, count=count, job_id=job.id, username=login_id)
+    if job.state == "error":
+        flash(BUSY_MESSAGE if job.error_status == 503 else f"동시 크롤링 중 오류가 발생했습니다: {job.error}")
+        return redirect(url_for('crawler_page'))
+    return render_scrape_result(job.result, keyword, count, login_id)
 
 @app.route("/scrape")
 def scrape():
+    """캐시만으로 보여줄 수 있으면 바로 렌더링, 아니면 백그라운드 작업으로 넘긴다."""
     login_id = request.cookies.get('user')
     if not login_id:
         flash("로그인이 필요합니다.")
@@ -147,60 +297,237 @@ def scrape():
         flash("개수는 1 이상의 숫자여야 합니다.")
         return redirect(url_for('crawler_page'))
 
-    safe_keyword = "".join(c if c.isalnum() else "_" for c in keyword)
-    cache_filename = os.path.join(CACHE_DIR, f"{login_id}_{safe_keyword}_{count}.json")
-    cache_lifetime = timedelta(minutes=15)
-
-    if os.path.exists(cache_filename):
-        mod_time = os.path.getmtime(cache_filename)
-        age = datetime.now() - datetime.fromtimestamp(mod_time)
-        if age < cache_lifetime:
-            print(f"Loading results from user cache: {cache_filename}")
-            with open(cache_filename, "r", encoding="utf-8") as f:
-                scraped_results = json.load(f)
-            return render_template("crawler_result.html", keyword=keyword, 
-                                     results=scraped_results, from_cache=True, 
-                                     count=count,active_page='crawler', username=login_id)
-
-    # 스레딩으로 동시 크롤링 실행
+    results, result_sets, stale_sites, missing_sites = lookup_scrape_cache(keyword, count)
+    if missing_sites:
+        return redirect(url_for('start_scrape', keyword=keyword, count=count))
+    if stale_sites:
+        schedule_scrape_refresh(keyword, count, stale_sites)
+    print(f"Loading results from shared cache: '{keyword}' (stale: {stale_sites})")
+    scraped = {"results": dedup.merge_results(results), "result_sets": result_sets,
+               "stale": bool(stale_sites), "from_cache": True, "complete": {site: True for site in results}}
+    return render_scrape_result(scraped, keyword, count, login_id)
+
+def render_scrape_result(scraped: dict, keyword: str, count: int, login_id: str):
+    # 3개 사이트 모두에서 결과가 하나도 없는지 확인
+    if not any(scraped["results"].values()):
+        flash(f"'{keyword}'에 대한 검색 결과가 없습니다.")
+        return redirect(url_for('crawler_page'))
+    return render_template("crawler_result.html", keyword=keyword, results=scraped["results"],
+                             from_cache=scraped["from_cache"], stale=scraped["stale"], result_sets=scraped["result_sets"],
+                             complete=scraped.get("complete", {}), count=count, active_page='crawler', username=login_id)
+
+def lookup_scrape_cache(keyword: str, count: int):
+    """
+    사용자와 무관한 공유 캐시를 사이트별로 조회: 같은 키워드를 더 많은 개수로 받아둔 결과가 있으면 잘라서 사용.
+    (사이트별 결과, 사이트별 result set id, 오래된 사이트, 없는 사이트) 반환.
+    """
+    results, result_sets, stale_sites, missing_sites = {}, {}, [], []
+    for site in SCRAPE_SITES:
+        site_results, cache_state, result_set = result_cache.lookup(
+            site_cache_source(site), keyword, count,
+            fresh_for=SCRAPE_CACHE_LIFETIMES[site].total_seconds(),
+            stale_for=SCRAPE_STALE_GRACE.total_seconds(),
+        )
+        if site_results is None:
+            missing_sites.append(site)
+            continue
+        results[site] = site_results.get(site, [])
+        result_sets[site] = result_set
+        if cache_state == "stale":
+            stale_sites.append(site)
+    return results, result_sets, stale_sites, missing_sites
+
+def run_scrape(keyword: str, count: int, progress=None, emit=None) -> dict:
+    """
+    백그라운드 작업 본체. 캐시에 없거나 완전히 만료된 사이트만 동시 크롤링하고,
+    신선 기간이 지났어도 유예 기간 안인 사이트는 이전 결과를 쓰면서 그 사이트만 백그라운드에서 갱신한다.
+    emit 으로 사이트/공고 단위 결과를 나오는 즉시 내보낸다 (SSE).
+    크롤링은 SCRAPE_DEADLINE_SEC 안에 끝내고, 못 끝낸 사이트는 모은 만큼만 complete[site]=False 로 돌려준다.
+    """
+    progress = progress or (lambda **_: None)
+    emit = emit or (lambda *_: None)
+    results, result_sets, stale_sites, missing_sites = lookup_scrape_cache(keyword, count)
+    complete = {site: True for site in results}
+    progress(**{site: "cached" for site in results})
+    for site, site_results in results.items():
+        emit("site", {"site": site, "jobs": site_results, "result_set": result_sets.get(site),
+                      "state": "cached", "complete": True})
+    if stale_sites:
+        schedule_scrape_refresh(keyword, count, stale_sites)
+
+    if missing_sites:
+        print(f"No valid cache for {missing_sites}. Starting concurrent scrape for '{keyword}'.")
+        progress(**{site: "running" for site in missing_sites})
+
+        def site_done(site, site_results, site_complete):
+            entry = save_site_results(site, keyword, count, site_results, site_complete)
+            if entry:
+                result_sets[site] = entry["id"]
+            progress(**{site: len(site_results) if site_complete else f"partial:{len(site_results)}"})
+            emit("site", {"site": site, "jobs": site_results, "result_set": result_sets.get(site),
+                          "state": "done", "complete": site_complete})
+
+        crawled, crawled_complete = crawl_sites(
+            keyword, count, missing_sites, on_done=site_done,
+            on_item=lambda site, job: emit("posting", {"site": site, "job": job}),
+            on_late=lambda site, site_results: save_site_results(site, keyword, count, site_results, False),
+            deadline=Deadline(SCRAPE_DEADLINE_SEC),
+        )
+        results.update(crawled)
+        complete.update(crawled_complete)
+
+    # 여러 사이트에 올라온 같은 공고는 하나로 합치고 사이트별 링크를 모두 남긴다
+    return {"results": dedup.merge_results(results), "result_sets": result_sets,
+            "stale": bool(stale_sites), "from_cache": not missing_sites, "complete": complete}
+
+def save_site_results(site: str, keyword: str, count: int, site_results: list, complete: bool):
+    """
+    사이트 결과를 공유 캐시에 저장하고 항목을 반환. 빈 결과(실패 포함)는 저장하지 않아 다음 요청에서 다시 시도한다.
+    시간 예산에 잘린 결과는 실제 개수로 저장한다: 상세 링크는 동작하고, 더 많이 원하는 요청은 다시 크롤링한다.
+    단, 신선한 기존 항목이 이미 그만큼 이상의 결과를 갖고 있으면 잘린 결과로 덮어쓰지 않는다 (None 반환).
+    """
+    if not site_results:
+        return None
+    if not complete:
+        entry = result_cache.read_entry(site_cache_source(site), keyword)
+        if (entry and time.time() - float(entry["saved_at"]) < SCRAPE_CACHE_LIFETIMES[site].total_seconds()
+                and len(entry["results"].get(site, [])) >= len(site_results)):
+            app.logger.info("[CACHE] '%s' %s 부분 결과(%d개)는 기존 항목보다 적어 저장하지 않음",
+                            keyword, site, len(site_results))
+            return None
+    saved_count = count if complete else len(site_results)
+    return result_cache.save(site_cache_source(site), keyword, saved_count, {site: site_results})
+
+def site_cache_source(site: str) -> str:
+    return f"{SCRAPE_CACHE_SOURCE}_{site}"
+
+SITE_SCRAPERS = {
+    "jobplanet": scrape_jobplanet,
+    "jobkorea": scrape_jobkorea_simple,
+    "incruit": scrape_incruit,
+}
+
+# 공고 하나씩 on_item 콜백을 지원하는 스크래퍼 (나머지는 목록 한 번에 끝나 사이트 단위로만 보고)
+ITEM_STREAMING_SITES = {"jobplanet"}
+
+def crawl_site(site: str, keyword: str, count: int, on_item=None, deadline=None) -> list:
+    """
+    사이트 1곳 크롤링 (single-flight: 같은 사이트/키워드/개수 동시 요청은 1회). 실패하면 빈 목록.
+    on_item 은 이 호출이 실제로 크롤링을 맡았을 때만 불린다 (합류한 호출은 결과만 받는다).
+    deadline 을 주면 스크래퍼가 그 안에서 대기를 줄이고, 지나면 모은 만큼만 반환한다.
+    """
+    key = ("scrape", site, result_cache.normalize_keyword(keyword), count)
+    kwargs = {"on_item": on_item} if on_item and site in ITEM_STREAMING_SITES else {}
+    if deadline is not None:
+        kwargs["deadline"] = deadline
     try:
-        print(f"No valid cache for user '{login_id}'. Starting new concurrent scrape for '{keyword}'.")
-        combined_results = {
-            "jobplanet": [],
-            "jobkorea": [],
-            "incruit": []
-        }
-
-        # ThreadPoolExecutor를 사용하여 각 함수를 별도의 스레드에서 동시에 실행
-        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
-            # 각 크롤링 함수를 executor에 제출(submit)하여 작업을 시작
-            future_jp = executor.submit(scrape_jobplanet, keyword, count)
-            future_jk = executor.submit(scrape_jobkorea_simple, keyword, count)
-            future_ic = executor.submit(scrape_incruit, keyword, count)
-            
-            # 각 작업(future)이 완료되면 결과를 가져와 딕셔너리에 저장
-            # .result()는 해당 작업이 끝날 때까지 기다렸다가 결과값을 반환합니다.
-            combined_results["jobplanet"] = future_jp.result()
-            combined_results["jobkorea"] = future_jk.result()
-            combined_results["incruit"] = future_ic.result()
-
-        # 3개 사이트 모두에서 결과가 하나도 없는지 확인
-        if not any(combined_results.values()):
-            flash(f"'{keyword}'에 대한 검색 결과가 없습니다.")
-            return redirect(url_for('crawler_page'))
+        return flight.do(key, SITE_SCRAPERS[site], keyword, count, **kwargs)
+    except AdmissionRejected:
+        # 수용량 초과는 빈 결과로 숨기지 않는다: 미완결로 둘지 503 으로 끝낼지는 crawl_sites 가 정한다
+        raise
+    except Exception:
+        app.logger.exception("[SCRAPE] %s 크롤링 실패", site)
+        return []
 
-        # 캐시 파일 저장
-        with open(cache_filename, "w", encoding="utf-8") as f:
-            json.dump(combined_results, f, ensure_ascii=False, indent=4)
-            print(f"Saved new combined results to user cache: {cache_filename}")
-            
-        return render_template("crawler_result.html", keyword=keyword, results=combined_results,
-                                 from_cache=False, count=count, username=login_id)
+def crawl_sites(keyword: str, count: int, sites=SCRAPE_SITES, on_done=None, on_item=None,
+                on_late=None, deadline=None) -> Tuple[Dict[str, list], Dict[str, bool]]:
+    """
+    지정한 사이트들을 동시에 크롤링해 (사이트별 결과, 사이트별 완결 여부)를 돌려준다.
+    on_done(site, 결과, 완결 여부)는 사이트가 끝나는 순서대로, on_item(site, 공고)는 공고 하나가 나올 때마다 호출.
 
-    except Exception as e:
-        print(f"An error occurred during concurrent scraping: {e}")
-        flash(f"동시 크롤링 중 오류가 발생했습니다: {e}")
-        return redirect(url_for('crawler_page'))
+    deadline 이 지나면 스크래퍼들이 모은 만큼 돌려주기를 SCRAPE_DEADLINE_GRACE_SEC 더 기다린 뒤,
+    그래도 안 끝난 사이트는 빈 결과(미완결)로 응답한다. 그 사이트가 나중에 끝나면 on_late(site, 결과).
+    deadline 안에 끝난 사이트만 완결로 본다.
+
+    사이트 크롤링 중 브라우저 자리를 못 받으면(AdmissionRejected) 그 사이트는 모은 만큼만 미완결로 둔다.
+    어느 사이트도 결과를 내지 못했을 때만 그 거절을 올려 작업 전체를 503 으로 끝낸다.
+    """
+    deadline = deadline or Deadline()
+    results, complete = {}, {}
+    rejected: Dict[str, AdmissionRejected] = {}
+
+    def run(site):
+        try:
+            site_results = crawl_site(site, keyword, count,
+                                      (lambda job: on_item(site, job)) if on_item else None, deadline=deadline)
+        except AdmissionRejected as e:
+            app.logger.warning("[SCRAPE] %s 수용량 초과로 %d개만 수집: %s", site, len(e.partial), e)
+            if not e.partial:
+                rejected[site] = e
+            return e.partial, False
+        return site_results, not deadline.expired()
+
+    # with 블록은 종료 시 늦은 사이트까지 기다리므로 직접 shutdown(wait=False)
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=len(sites))
+    futures = {executor.submit(run, site): site for site in sites}
+    timeout = deadline.timeout()
+    try:
+        for future in concurrent.futures.as_completed(
+                futures, timeout=None if timeout is None else timeout + SCRAPE_DEADLINE_GRACE_SEC):
+            site = futures[future]
+            results[site], complete[site] = future.result()
+            if on_done and site not in rejected:
+                on_done(site, results[site], complete[site])
+    except concurrent.futures.TimeoutError:
+        late = [site for site in sites if site not in results]
+        app.logger.warning("[SCRAPE] '%s' 시간 예산(%.0fs) 초과: %s 없이 응답", keyword, deadline.seconds, late)
+        for future, site in futures.items():
+            if site in results:
+                continue
+            results[site], complete[site] = [], False
+            if on_done:
+                on_done(site, [], False)
+            if on_late:
+                future.add_done_callback(lambda f, site=site: _late_site_done(site, f, on_late))
+    finally:
+        executor.shutdown(wait=False)
+    if rejected:
+        if not any(results.values()):
+            raise next(iter(rejected.values()))
+        # 다른 사이트 결과가 있으면 결과 없이 거절된 사이트도 미완결로 알린다
+        for site in rejected:
+            if on_done:
+                on_done(site, [], False)
+    return {site: results[site] for site in sites}, {site: complete[site] for site in sites}
+
+def _late_site_done(site: str, future, on_late):
+    """시간 예산 뒤에 끝난 사이트 결과 (다음 요청을 위해 캐시에 남긴다)."""
+    if future.cancelled() or future.exception() is not None:
+        return
+    try:
+        on_late(site, future.result()[0])
+    except Exception:
+        app.logger.exception("[SCRAPE] %s 늦은 결과 저장 실패", site)
+
+# --- stale-while-revalidate: 오래된 캐시의 백그라운드 갱신 (사이트 단위) ---
+_refresh_executor = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix="cache-refresh")
+_refreshing = set()
+_refreshing_lock = threading.Lock()
+
+def schedule_scrape_refresh(keyword: str, count: int, sites):
+    """같은 키워드/사이트 갱신이 이미 돌고 있으면 건너뛴다."""
+    for site in sites:
+        key = (result_cache.normalize_keyword(keyword), site)
+        with _refreshing_lock:
+            if key in _refreshing:
+                continue
+            _refreshing.add(key)
+        _refresh_executor.submit(_refresh_site, key, site, keyword, count)
+
+def _refresh_site(key, site: str, keyword: str, count: int):
+    try:
+        # 캐시에 저장된 개수 이상으로 받아야 더 큰 요청도 계속 캐시로 처리된다
+        entry = result_cache.read_entry(site_cache_source(site), keyword) or {}
+        want = max(count, int(entry.get("count", 0)))
+        site_results = crawl_site(site, keyword, want)
+        if site_results:
+            result_cache.save(site_cache_source(site), keyword, want, {site: site_results})
+            app.logger.info("[CACHE] '%s' %s 백그라운드 갱신 완료", keyword, site)
+    except Exception:
+        app.logger.exception("background cache refresh failed")
+    finally:
+        with _refreshing_lock:
+            _refreshing.discard(key)
 
 @app.route("/clear_cache")
 def clear_cache():
@@ -213,12 +540,12 @@ def clear_cache():
     if not keyword or not count_str:
         return redirect(url_for('crawler_page'))
     try:
-        safe_keyword = "".join(c if c.isalnum() else "_" for c in keyword)
-        cache_filename = os.path.join(CACHE_DIR, f"{login_id}_{safe_keyword}_{count_str}.json")
-        if os.path.exists(cache_filename):
-            os.remove(cache_filename)
+        # 사이트별 항목 + 예전 통합 항목
+        deleted = [source for source in [site_cache_source(site) for site in SCRAPE_SITES] + [SCRAPE_CACHE_SOURCE]
+                   if result_cache.delete(source, keyword)]
+        if deleted:
             flash(f"'{keyword}'에 대한 캐시가 성공적으로 삭제되었습니다.")
-            app.logger.info(f"Cache file deleted by user '{login_id}': {cache_filename}")
+            app.logger.info(f"Cache deleted by user '{login_id}': '{keyword}' {deleted}")
         else:
             flash("삭제할 캐시 파일이 존재하지 않습니다.")
     except Exception as e:
@@ -234,30 +561,34 @@ def job_detail():
         return redirect(url_for('index'))
     keyword = request.args.get("keyword")
     count = request.args.get("count")
+    result_set = request.args.get("rs")
+    source = request.args.get("source", "jobplanet")
+    job_id = request.args.get("job_id")
     job_index_str = request.args.get("job_index")
-    if not all([keyword, count, job_index_str]):
+    if not all([keyword, count]) or not (job_id or job_index_str):
         flash("잘못된 접근입니다.")
         return redirect(url_for('crawler_page'))
     try:
-        job_index = int(job_index_str)
-        safe_keyword = "".join(c if c.isalnum() else "_" for c in keyword)
-        cache_filename = os.path.join(CACHE_DIR, f"{login_id}_{safe_keyword}_{count}.json")
-        if os.path.exists(cache_filename):
-            with open(cache_filename, "r", encoding="utf-8") as f:
-                all_results = json.load(f)
-            
-            # (핵심 수정) 전체 결과(딕셔너리)에서 'jobplanet' 리스트를 추출합니다.
-            jobplanet_results = all_results.get("jobplanet", [])
-            
-            if 0 <= job_index < len(jobplanet_results):
-                job_data = jobplanet_results[job_index]
-                return render_template("job_detail.html", job=job_data, keyword=keyword, count=count, username=login_id)
-            else:
-                flash("해당 채용 공고를 찾을 수 없습니다.")
+        # 목록 화면이 보여준 result set 의 메모리 색인에서 바로 찾는다 (디스크 접근 없음)
+        job_data = result_store.find(result_set, source, job_id) if result_set and job_id else None
+        if job_data is None:
+            # 색인에서 밀려났거나 캐시가 갱신된 경우: 현재 캐시 항목을 한 번 읽어 색인하고 다시 찾는다
+            if source not in SCRAPE_SITES:
+                raise ValueError(source)
+            entry = result_cache.read_entry(site_cache_source(source), keyword)
+            if not entry:
+                flash("세션이 만료되었거나 캐시된 데이터가 없습니다. 다시 검색해주세요.")
                 return redirect(url_for('crawler_page'))
-        else:
-            flash("세션이 만료되었거나 캐시된 데이터가 없습니다. 다시 검색해주세요.")
-            return redirect(url_for('crawler_page'))
+            if job_id:
+                job_data = result_store.find(entry["id"], source, job_id)
+            elif int(job_index_str) < int(count):
+                # 예전 링크(job_index)는 이 사용자가 본 개수 안의 위치로 찾는다
+                job_data = result_store.at(entry["id"], source, int(job_index_str))
+
+        if job_data is not None:
+            return render_template("job_detail.html", job=job_data, keyword=keyword, count=count, username=login_id)
+        flash("해당 채용 공고를 찾을 수 없습니다.")
+        return redirect(url_for('crawler_page'))
     except (ValueError, IndexError, KeyError) as e:
         app.logger.exception("상세 페이지 접근 오류")
         flash("잘못된 요청입니다.")
@@ -274,6 +605,18 @@ def finance_page():
         return redirect(url_for('index'))
     
 
+def load_finance_data(company_name: str):
+    """회사명 → (crno, 요약재무 전건, 기업기본정보 목록). 기업이 없으면 crno=None."""
+    # 1) 회사명 → crno
+    crno = find_crno_by_name(company_name)
+    if not crno:
+        return None, [], []
+    # 2) crno → 요약재무 전건
+    finance_data = fetch_all_fin_summary_by_crno(crno)
+    # 3) 회사명 → 기업기본정보
+    outline_list = fetch_company_outline(company_name, page_no=1, num_rows=20, strict=True)
+    return crno, finance_data, outline_list
+
 @app.route("/get_finance_data", methods=["POST"])
 def get_finance_data():
     login_id = request.cookies.get('user')
@@ -287,17 +630,11 @@ def get_finance_data():
         return redirect(url_for('finance_page'))
 
     try:
-        # 1) 회사명 → crno
-        crno = find_crno_by_name(company_name)
+        # 1)~3) 같은 기업을 동시에 조회하면 API 호출은 한 번만
+        crno, finance_data, outline_list = flight.do(("finance", company_name), load_finance_data, company_name)
         if not crno:
             flash(f"'{company_name}'에 해당하는 기업을 찾을 수 없습니다. 정확한 기업명을 입력해주세요.")
             return redirect(url_for('finance_page'))
-
-        # 2) crno → 요약재무 전건
-        finance_data = fetch_all_fin_summary_by_crno(crno)
-
-        # 3) 회사명 → 기업기본정보
-        outline_list = fetch_company_outline(company_name, page_no=1, num_rows=20, strict=True)
         outline = outline_list[0] if outline_list else None
 
         # 4) 그래프 데이터 패키지
@@ -428,7 +765,7 @@ def search_inflearn():
         return redirect(url_for('inflearn_page'))
     
     try:
-        results = scrape_inflearn(keyword, limit)
+        results = flight.do(("inflearn", keyword.strip(), limit), scrape_inflearn, keyword, limit)
         if not results:
             flash(f"'{keyword}'에 대한 검색 결과가 없습니다.")
             return redirect(url_for('inflearn_page'))
@@ -436,6 +773,10 @@ def search_inflearn():
         return render_template("inflearn_result.html", keyword=keyword, results=results,active_page='inflearn',
                                username=login_id)
     
+    except AdmissionRejected as e:
+        app.logger.warning("search_inflearn rejected: %s", e)
+        flash(BUSY_MESSAGE)
+        return redirect(url_for('inflearn_page'))
     except Exception as e:
         print(f"인프런 크롤링 중 서버 오류 발생: {e}")
         flash(f"데이터를 조회하는 중 오류가 발생했습니다: {e}")
@@ -488,6 +829,7 @@ def news_page():
 # ---------------------- << 추가 블록: 카카오 전송/스케줄 >> ----------------------
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
+from scheduler_leader import LeaderElection
 
 PREF_FILE = "user_prefs.json"
 KST = ZoneInfo("Asia/Seoul")
@@ -505,6 +847,14 @@ scheduler = BackgroundScheduler(
         "misfire_grace_time": 600  # 최대 10분까지 놓쳐도 실행
     }
 )
+# 웹 워커가 여러 개여도 예약 전송은 리더 프로세스 한 곳에서만 실행된다 (scheduler_leader.py).
+# 1 이면 import 시 바로 선출에 참여. 기본은 0: 스크립트/REPL 에서 import 만 해도 예약이 돌지 않게 하고,
+# 서버는 __main__ 블록(개발 서버) 또는 gunicorn.conf.py 의 post_worker_init 훅에서 워커마다 start_scheduler() 를 부른다.
+# (--preload 로 마스터가 import 할 때 켜 두면 마스터 혼자 리더가 되므로 1 로 두지 않는다)
+SCHEDULER_AUTOSTART = os.getenv("SCHEDULER_AUTOSTART", "0") not in ("0", "false", "False")
+# 이 프로세스 스케줄러에 등록된 예약의 설정값 (login_id → schedule_job 인자). user_prefs.json 과 비교해 바뀐 것만 다시 등록
+_schedule_sigs: Dict[str, tuple] = {}
+_prefs_mtime = None
 
 def load_prefs() -> dict:
     if not os.path.exists(PREF_FILE) or os.path.getsize(PREF_FILE) == 0:
@@ -603,15 +953,27 @@ def scrape_and_send(keyword: str, count: int, only_fresher: bool = True,
         return {"ok": False, "sent": 0, "reason": "locked"}
     try:
         from kakao_send import send_jobposts_to_kakao
-        posts = jk_search_jobs(
-            keyword=keyword,
-            limit=count,
-            newbie_only=only_fresher,
-            dday_within=None,
-            as_dict=True
-        )
+        try:
+            posts = flight.do(
+                ("jk_search", keyword.strip(), count, bool(only_fresher)),
+                jk_search_jobs,
+                keyword=keyword,
+                limit=count,
+                newbie_only=only_fresher,
+                dday_within=None,
+                as_dict=True,
+                incremental=True,
+                deadline=Deadline(SCRAPE_DEADLINE_SEC),
+            )
+        except AdmissionRejected as e:
+            if not e.partial:
+                raise
+            # 수집 도중 브라우저 자리를 못 받음: 모은 공고만으로 보낸다
+            app.logger.warning("scrape_and_send: 수용량 초과로 %d개만 수집: %s", len(e.partial), e)
+            posts = e.partial
         # /// [확인용 로그 추가 1] ///
         print(f"✅ 스크랩된 원본 공고 수: {len(posts)}개")
+        posts = dedup.collapse(posts)
         
         posts = filter_posts(posts, only_fresher=only_fresher, max_dday=max_dday, edu_mode=edu_mode)
         # /// [확인용 로그 추가 2] ///
@@ -622,6 +984,9 @@ def scrape_and_send(keyword: str, count: int, only_fresher: bool = True,
         res = send_jobposts_to_kakao(keyword, posts, batch_size=batch_size)
         app.logger.info("[INFO] 카카오 전송 완료: %s", res)
         return {"ok": True, "sent": len(posts)}
+    except AdmissionRejected as e:
+        app.logger.warning("scrape_and_send rejected: %s", e)
+        return {"ok": False, "sent": 0, "reason": BUSY_MESSAGE, "status": 503}
     except Exception as e:
         app.logger.exception("scrape_and_send failed")
         return {"ok": False, "sent": 0, "error": str(e)}
@@ -642,6 +1007,13 @@ def next_run_kst_str(login_id: str) -> str | None:
         nrt_kst = nrt
     return nrt_kst.strftime("%Y-%m-%d %H:%M")
 
+def scheduled_scrape_and_send(*args):
+    """예약 실행 본체. 리더 자리를 잃은 직후 밀려 있던 실행이면 건너뛴다 (다른 워커와의 중복 전송 방지)."""
+    if not scheduler_leader.still_leader():
+        app.logger.warning("[SCHEDULER] 리더가 아니므로 예약 전송을 건너뜁니다: %s", args[:1])
+        return {"ok": False, "sent": 0, "reason": "not leader"}
+    return scrape_and_send(*args)
+
 def schedule_job(login_id: str, keyword: str, count: int,
                  only_fresher: bool, max_dday: int, batch_size: int,
                  send_time: str = "09:00", edu_mode: str = "exclude"):
@@ -657,7 +1029,7 @@ def schedule_job(login_id: str, keyword: str, count: int,
 
     trigger = CronTrigger(hour=h, minute=m, timezone=KST)
     scheduler.add_job(
-        func=scrape_and_send,
+        func=scheduled_scrape_and_send,
         trigger=trigger,
         next_run_time=first_run,
         args=[keyword, count, only_fresher, max_dday, batch_size, edu_mode],  # ← 추가
@@ -665,9 +1037,70 @@ def schedule_job(login_id: str, keyword: str, count: int,
         replace_existing=True,
         jitter=10
     )
+    _schedule_sigs[login_id] = (keyword, count, only_fresher, max_dday, batch_size, send_time, edu_mode)
     app.logger.info("[SCHEDULE] %s: 매일 %s '%s' 등록 (first_run=%s KST)",
                     login_id, send_time, keyword, first_run.isoformat())
 
+def sync_schedules_from_prefs(force: bool = False):
+    """
+    user_prefs.json 의 예약을 이 프로세스 스케줄러에 반영 (다른 워커에서 저장/해제한 예약 포함).
+    파일이 바뀌었을 때만 읽고, 설정이 그대로인 작업은 건드리지 않는다.
+    force=True 면 enabled 예약을 모두 지금 기준으로 다시 등록한다 (부팅/리더 교체 시).
+    """
+    global _prefs_mtime
+    try:
+        mtime = os.path.getmtime(PREF_FILE)
+    except OSError:
+        mtime = None
+    if not force and mtime == _prefs_mtime:
+        return
+    _prefs_mtime = mtime
+
+    prefs = load_prefs()
+    enabled = {login_id: p for login_id, p in prefs.items() if p.get("enabled")}
+    for login_id, p in enabled.items():
+        sig = (p.get("keyword", "python"), int(p.get("count", 30)), bool(p.get("only_fresher")),
+               int(p.get("max_dday", 7)), int(p.get("batch_size", 5)), p.get("send_time", "09:00"),
+               p.get("edu_mode", "exclude"))
+        if force or _schedule_sigs.get(login_id) != sig or not scheduler.get_job(f"daily_{login_id}"):
+            try:
+                schedule_job(login_id, *sig)
+            except (ValueError, TypeError):
+                app.logger.warning("[SCHEDULE] %s: 잘못된 예약 설정을 건너뜁니다: %s", login_id, p)
+    for job in scheduler.get_jobs():
+        login_id = job.id[len("daily_"):]
+        if job.id.startswith("daily_") and login_id not in enabled:
+            job.remove()
+            _schedule_sigs.pop(login_id, None)
+            app.logger.info("[SCHEDULE] %s: 예약 해제 반영", login_id)
+
+def _on_scheduler_elected():
+    # 이전 리더가 이미 보냈을 수 있는 지난 실행이 misfire 로 다시 돌지 않도록 지금 기준으로 다시 등록한 뒤 실행 재개
+    sync_schedules_from_prefs(force=True)
+    scheduler.resume()
+    app.logger.info("[SCHEDULER] 리더로 선출되어 예약 실행을 시작합니다 (%d개)", len(scheduler.get_jobs()))
+
+def _on_scheduler_demoted():
+    scheduler.pause()
+    app.logger.info("[SCHEDULER] 리더가 아니므로 예약 실행을 멈춥니다")
+
+scheduler_leader = LeaderElection(
+    on_elected=_on_scheduler_elected,
+    on_demoted=_on_scheduler_demoted,
+    on_heartbeat=lambda is_leader: sync_schedules_from_prefs(),
+)
+
+def start_scheduler():
+    """
+    이 프로세스의 스케줄러를 일시정지 상태로 띄우고, user_prefs.json 의 예약을 모두 등록한 뒤 리더 선출에 참여.
+    리더가 아닌 워커도 작업 목록을 갖고 있어 다음 실행 시각 표시(/api/schedule_status)는 그대로 동작한다.
+    """
+    if scheduler.running:
+        return
+    scheduler.start(paused=True)
+    sync_schedules_from_prefs(force=True)
+    scheduler_leader.start()
+
 # === 스케줄 상태 API (화면 갱신용) ===
 @app.route("/api/schedule_status")
 def api_schedule_status():
@@ -683,6 +1116,26 @@ def api_schedule_status():
         "edu_mode": prefs.get("edu_mode", "exclude"),
     }, 200
 
+# === 크롤링 지표 API (드라이버 풀 / 호스트별 속도 제한 대기 / 차단 요청 수) ===
+@app.route("/api/crawl_metrics")
+def api_crawl_metrics():
+    login_id = request.cookies.get('user')
+    if not login_id:
+        return {"ok": False, "error": "auth"}, 401
+    return {
+        "ok": True,
+        "driver_pools": pool_stats(),
+        "drivers": driver_snapshot(),
+        "rate_limits": rate_stats(),
+        "blocked_requests": BLOCK_STATS,
+        "cache": result_cache.cache_stats(),
+        "single_flight": flight.snapshot(),
+        "result_store": result_store.store_stats(),
+        "crawl_jobs": crawl_queue.snapshot(),
+        "admission": admission_stats(),
+        "scheduler": scheduler_leader.status(),
+    }, 200
+
 # --- 즉시 전송 ---
 @app.route("/send_kakao_now", methods=["POST", "GET"])
 def send_kakao_now():
@@ -705,7 +1158,7 @@ def send_kakao_now():
     try:
         result = scrape_and_send(keyword, count, only_fresher, max_dday, batch_size, edu_mode)
         if request.headers.get("X-Requested-With") == "XMLHttpRequest" or request.values.get("ajax") == "1":
-            status = 200 if result.get("ok") else 400
+            status = 200 if result.get("ok") else result.get("status", 400)
             return {
                 "ok": result.get("ok", False),
                 "sent": result.get("sent", 0),
@@ -785,9 +1238,11 @@ def subscribe_kakao():
     return redirect(url_for('main_page'))
 # ---------------------- << 추가 블록 끝 >> ----------------------
 
+if SCHEDULER_AUTOSTART:
+    start_scheduler()
+
 if __name__ == "__main__":
-    should_start = (os.environ.get("WERKZEUG_RUN_MAIN") == "true") or (os.environ.get("WERKZEUG_RUN_MAIN") is None)
-    if should_start and not scheduler.running:
-        scheduler.start()
-        app.logger.info("[SCHEDULER] started in this process")
+    # 리로더 감시 프로세스는 요청을 받지 않으므로 실제로 서버를 돌리는 자식(WERKZEUG_RUN_MAIN)에서만 시작
+    if os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+        start_scheduler()
     app.run(host="0.0.0.0", port=5000, use_reloader=True)
\ No newline at end of file
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+캐시 코덱 마이크로 벤치마크: 코덱별 인코딩/디코딩 시간과 디스크 크기 비교.
+
+    python bench_cache_codec.py                 # 합성 데이터 (잡플래닛 상세 텍스트 포함)
+    python bench_cache_codec.py cache/*.cache   # 실제 캐시 파일들로 측정
+
+'json-indent' 는 예전 저장 방식(json.dump indent=4)이다.
+"""
+import sys
+import json
+import time
+import random
+
+import cache_codec
+
+LOREM = "백엔드 API 설계 및 개발, 대용량 트래픽 처리, 코드 리뷰 참여, 테스트 자동화, 클라우드 인프라 운영 "
+
+
+def synthetic_entry(count: int = 50) -> dict:
+    rnd = random.Random(0)
+
+    def text(n):
+        return "\n".join(" ".join(rnd.sample(LOREM.split(), 6)) for _ in range(n))
+
+    jobplanet = [{
+        "company": f"회사{i}", "title": f"백엔드 개발자 {i}", "location": "서울 강남구",
+        "skills": "Python, Django, AWS", "deadline": "2026.12.31", "hiring_process": "서류 > 면접 > 최종합격",
+        "main_tasks": text(12), "qualifications": text(10), "preferred": text(8),
+        "link": f"https://www.jobplanet.co.kr/job/search?posting_ids%5B%5D={100000 + i}",
+    } for i in range(count)]
+    simple = [{"company": f"회사{i}", "title": f"개발자 {i}", "link": f"https://example.com/{i}"} for i in range(count)]
+    return {"count": count, "saved_at": time.time(), "id": "bench", "keyword": "python",
+            "results": {"jobplanet": jobplanet, "jobkorea": simple, "incruit": simple}}
+
+
+def bench(entry: dict, rounds: int = 50):
+    encoders = {"json-indent": lambda e: json.dumps(e, ensure_ascii=False, indent=4).encode("utf-8")}
+    for name in cache_codec.CODECS:
+        encoders[name] = lambda e, name=name: cache_codec.encode(e, name)
+
+    print(f"{'codec':<14}{'bytes':>10}{'encode ms':>12}{'decode ms':>12}")
+    for name, enc in encoders.items():
+        t0 = time.perf_counter()
+        for _ in range(rounds):
+            data = enc(entry)
+        t1 = time.perf_counter()
+        for _ in range(rounds):
+            cache_codec.decode(data)
+        t2 = time.perf_counter()
+        mark = "  (default)" if name == cache_codec.CACHE_CODEC else ""
+        print(f"{name:<14}{len(data):>10}{(t1 - t0) / rounds * 1000:>12.3f}{(t2 - t1) / rounds * 1000:>12.3f}{mark}")
+
+
+if __name__ == "__main__":
+    paths = sys.argv[1:]
+    if not paths:
+        bench(synthetic_entry())
+    for path in paths:
+        with open(path, "rb") as f:
+            print(f"\n# {path}")
+            bench(cache_codec.decode(f.read()))
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+캐시 파일 직렬화 코덱.
+
+    data = encode(entry)          # 헤더 + 압축된 바이너리
+    entry = decode(data)          # 헤더를 보고 코덱 선택, 헤더 없는 '{' 는 예전 JSON 파일
+
+파일 앞 4바이트 헤더 b"RC" + 버전 + 코덱 태그로 코덱을 구분하므로, 설정을 바꿔도
+이미 저장된 파일은 그대로 읽힌다.
+
+코덱 (CACHE_CODEC 환경변수, 기본 auto):
+  - msgpack-zstd : msgpack + zstandard  (둘 다 설치돼 있을 때 auto 의 1순위)
+  - msgpack-lz4  : msgpack + lz4.frame
+  - json-zlib    : 공백 없는 JSON + zlib, 표준 라이브러리만 사용 (auto 의 기본 폴백)
+  - json         : 예전 형식 (디버깅용, 사람이 읽을 수 있음)
+
+marshal 은 버전 간 호환이 보장되지 않고 손상/외부 데이터를 읽기에 안전하지 않아 쓰지 않는다.
+예전 marshal-zlib(태그 'm') 파일은 알 수 없는 코덱으로 읽기에 실패하고, 호출자는 캐시 미스로 처리한다.
+"""
+import os
+import json
+import zlib
+from typing import Callable, Dict, Tuple
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+try:
+    import lz4.frame as lz4frame
+except ImportError:
+    lz4frame = None
+
+MAGIC = b"RC\x01"
+ZLIB_LEVEL = int(os.getenv("CACHE_ZLIB_LEVEL", "1"))
+ZSTD_LEVEL = int(os.getenv("CACHE_ZSTD_LEVEL", "3"))
+
+
+def _json_dumps(obj) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _json_loads(data: bytes):
+    return json.loads(data.decode("utf-8"))
+
+
+# 이름 → (태그 1바이트, encode, decode)
+CODECS: Dict[str, Tuple[bytes, Callable[[object], bytes], Callable[[bytes], object]]] = {
+    "json": (b"j", _json_dumps, _json_loads),
+    "json-zlib": (
+        b"J",
+        lambda obj: zlib.compress(_json_dumps(obj), ZLIB_LEVEL),
+        lambda data: _json_loads(zlib.decompress(data)),
+    ),
+}
+if msgpack is not None and zstandard is not None:
+    CODECS["msgpack-zstd"] = (
+        b"z",
+        lambda obj: zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(msgpack.packb(obj, use_bin_type=True)),
+        lambda data: msgpack.unpackb(zstandard.ZstdDecompressor().decompress(data), raw=False),
+    )
+if msgpack is not None and lz4frame is not None:
+    CODECS["msgpack-lz4"] = (
+        b"l",
+        lambda obj: lz4frame.compress(msgpack.packb(obj, use_bin_type=True)),
+        lambda data: msgpack.unpackb(lz4frame.decompress(data), raw=False),
+    )
+
+_BY_TAG = {tag: (name, loads) for name, (tag, _, loads) in CODECS.items()}
+
+
+def _default_codec() -> str:
+    name = os.getenv("CACHE_CODEC", "auto")
+    if name in CODECS:
+        return name
+    if name != "auto":
+        print(f"[CACHE] 사용할 수 없는 코덱 '{name}', 자동 선택으로 대체합니다.")
+    for candidate in ("msgpack-zstd", "msgpack-lz4", "json-zlib"):
+        if candidate in CODECS:
+            return candidate
+    return "json"
+
+
+CACHE_CODEC = _default_codec()
+
+
+def encode(obj, codec: str = None) -> bytes:
+    tag, dumps, _ = CODECS[codec or CACHE_CODEC]
+    return MAGIC + tag + dumps(obj)
+
+
+def decode(data: bytes):
+    """헤더가 있으면 해당 코덱으로, 없으면 예전 JSON(indent 포함)으로 읽는다. 실패 시 ValueError."""
+    if data[:len(MAGIC)] != MAGIC:
+        return _json_loads(data)
+    tag = data[len(MAGIC):len(MAGIC) + 1]
+    if tag not in _BY_TAG:
+        raise ValueError(f"unknown cache codec tag {tag!r}")
+    try:
+        return _BY_TAG[tag][1](data[len(MAGIC) + 1:])
+    except Exception as e:
+        raise ValueError(f"cache decode failed ({_BY_TAG[tag][0]}): {e}") from e
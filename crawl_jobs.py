@@ -0,0 +1,301 @@
+# -*- coding: utf-8 -*-
+"""
+백그라운드 크롤링 작업 큐.
+
+요청 스레드는 submit() 으로 작업을 넣고 작업 id 만 받아 바로 응답한다.
+크롤링은 크기가 정해진 워커 풀(CRAWL_WORKERS)에서 돌고, 대기 작업이 CRAWL_QUEUE_MAX 를 넘으면
+submit() 이 None 을 돌려준다 (호출자가 '혼잡' 응답).
+
+같은 key 의 작업이 대기/실행 중이면 새로 만들지 않고 그 작업을 돌려준다 (프로세스 안에서).
+끝난 작업은 CRAWL_JOB_TTL_SEC 동안 결과 조회용으로 남겨 둔다.
+끝나지 못한 채 사라졌거나 멈춘 작업은 lost() 가 사유를 돌려준다 (스트리밍/폴링이 끝없이 기다리지 않게).
+
+작업 상태/진행/이벤트/결과는 공고 저장소와 같은 SQLite 파일(posting_store.POSTING_DB)에도 기록한다.
+gunicorn 워커가 여러 개여서 상태 조회/스트리밍 요청이 작업을 실행하지 않는 워커로 가도,
+get() 이 저장소에서 읽은 StoredCrawlJob 을 돌려주므로 같은 응답을 줄 수 있다.
+
+작업 함수는 키워드 인자로 콜백 두 개를 받는다:
+    def fn(..., progress, emit):
+        progress(jobplanet="running")          # 폴링용 요약 상태
+        emit("posting", {"site": ..., ...})    # 스트리밍(SSE)용 이벤트, 순서대로 쌓인다
+작업이 끝나면 큐가 "done" / "error" 이벤트를 마지막으로 붙인다.
+"""
+import os
+import json
+import time
+import uuid
+import sqlite3
+import threading
+import concurrent.futures
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+import posting_store
+
+CRAWL_WORKERS = int(os.getenv("CRAWL_WORKERS", "2"))
+CRAWL_QUEUE_MAX = int(os.getenv("CRAWL_QUEUE_MAX", "20"))
+CRAWL_JOB_TTL_SEC = float(os.getenv("CRAWL_JOB_TTL_SEC", "1800"))
+# 다른 워커가 실행 중인 작업의 이벤트를 저장소에서 다시 확인하는 간격
+CRAWL_EVENT_POLL_SEC = float(os.getenv("CRAWL_EVENT_POLL_SEC", "0.5"))
+# 실행 시작 후 이만큼 지나도 끝나지 않은 작업은 실행하던 워커가 죽은 것으로 본다 (크롤링 자체는 SCRAPE_DEADLINE_SEC 안에 끝난다)
+CRAWL_JOB_STALL_SEC = float(os.getenv("CRAWL_JOB_STALL_SEC", "600"))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS crawl_jobs (
+    id           TEXT PRIMARY KEY,
+    meta         TEXT NOT NULL,
+    state        TEXT NOT NULL,
+    progress     TEXT NOT NULL DEFAULT '{}',
+    result       TEXT,
+    error        TEXT,
+    error_status INTEGER,
+    created      REAL NOT NULL,
+    started      REAL,
+    finished     REAL
+);
+CREATE INDEX IF NOT EXISTS idx_crawl_jobs_created ON crawl_jobs(created);
+
+CREATE TABLE IF NOT EXISTS crawl_job_events (
+    job_id TEXT NOT NULL REFERENCES crawl_jobs(id),
+    seq    INTEGER NOT NULL,
+    event  TEXT NOT NULL,
+    data   TEXT,
+    PRIMARY KEY (job_id, seq)
+);
+"""
+
+_schema_lock = threading.Lock()
+_schema_ready = set()
+
+
+def _dumps(obj) -> str:
+    return json.dumps(obj, ensure_ascii=False)
+
+
+def _connect() -> sqlite3.Connection:
+    conn = posting_store.connect()
+    with _schema_lock:
+        if posting_store.POSTING_DB not in _schema_ready:
+            conn.executescript(SCHEMA)
+            _schema_ready.add(posting_store.POSTING_DB)
+    return conn
+
+
+def _write(sql: str, args=()):
+    """저장소 기록. 실패해도 크롤링은 계속한다 (이 워커에서의 조회는 메모리 상태로 동작)."""
+    try:
+        conn = _connect()
+        with conn:
+            conn.execute(sql, args)
+    except sqlite3.Error as e:
+        print(f"[JOB] 작업 상태 저장 실패: {e}")
+
+
+def _status(job_id, state, progress, error, error_status, created, started, finished, meta) -> dict:
+    now = time.time()
+    return {
+        "id": job_id,
+        "state": state,
+        "progress": progress,
+        "error": error,
+        "error_status": error_status,
+        "queued_sec": round((started or now) - created, 1),
+        "elapsed_sec": round((finished or now) - started, 1) if started else 0.0,
+        **meta,
+    }
+
+
+class CrawlJob:
+    def __init__(self, key: Hashable, meta: dict):
+        self.id = uuid.uuid4().hex[:12]
+        self.key = key
+        self.meta = meta
+        self.state = "queued"       # queued → running → done | error
+        self.progress: Dict[str, object] = {}
+        self.result = None
+        self.error: Optional[str] = None
+        self.error_status: Optional[int] = None   # 예외의 status 속성 (예: 수용량 초과 503)
+        self.created = time.time()
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+        self._lock = threading.Lock()
+        self.events: List[Tuple[str, object]] = []
+        self._events_cond = threading.Condition(self._lock)
+        _write("INSERT INTO crawl_jobs (id, meta, state, created) VALUES (?, ?, ?, ?)",
+               (self.id, _dumps(meta), self.state, self.created))
+
+    def report(self, **fields):
+        with self._lock:
+            self.progress.update(fields)
+            progress = _dumps(self.progress)
+        _write("UPDATE crawl_jobs SET progress = ? WHERE id = ?", (progress, self.id))
+
+    def emit(self, event: str, data=None):
+        with self._events_cond:
+            seq = len(self.events)
+            self.events.append((event, data))
+            self._events_cond.notify_all()
+        _write("INSERT INTO crawl_job_events (job_id, seq, event, data) VALUES (?, ?, ?, ?)",
+               (self.id, seq, event, _dumps(data)))
+
+    def wait_events(self, start: int, timeout: float) -> List[Tuple[str, object]]:
+        """start 번째 이후 이벤트. 아직 없으면 timeout 초까지 기다린다 (없으면 빈 목록)."""
+        with self._events_cond:
+            self._events_cond.wait_for(lambda: len(self.events) > start, timeout=timeout)
+            return self.events[start:]
+
+    def _finish(self, state: str, result=None, error: Optional[str] = None, error_status: Optional[int] = None):
+        with self._lock:
+            self.state, self.result = state, result
+            self.error, self.error_status = error, error_status
+            self.finished = time.time()
+        _write("UPDATE crawl_jobs SET state = ?, result = ?, error = ?, error_status = ?, finished = ? WHERE id = ?",
+               (state, _dumps(result), error, error_status, self.finished, self.id))
+
+    def status(self) -> dict:
+        """결과 본문을 뺀 가벼운 상태 (폴링용)."""
+        with self._lock:
+            return _status(self.id, self.state, dict(self.progress), self.error, self.error_status,
+                           self.created, self.started, self.finished, self.meta)
+
+
+class StoredCrawlJob:
+    """다른 워커 프로세스가 실행 중인(또는 실행한) 작업의 저장소 읽기 전용 보기. CrawlJob 과 같은 조회 인터페이스."""
+
+    def __init__(self, row: sqlite3.Row):
+        self.id = row["id"]
+        self.meta = json.loads(row["meta"])
+        self.state = row["state"]
+        self.progress = json.loads(row["progress"] or "{}")
+        self.result = json.loads(row["result"]) if row["result"] else None
+        self.error = row["error"]
+        self.error_status = row["error_status"]
+        self.created, self.started, self.finished = row["created"], row["started"], row["finished"]
+
+    @classmethod
+    def load(cls, job_id: str) -> Optional["StoredCrawlJob"]:
+        try:
+            row = _connect().execute("SELECT * FROM crawl_jobs WHERE id = ?", (job_id,)).fetchone()
+        except sqlite3.Error as e:
+            print(f"[JOB] 작업 상태 조회 실패: {e}")
+            return None
+        return cls(row) if row else None
+
+    def wait_events(self, start: int, timeout: float) -> List[Tuple[str, object]]:
+        """저장소를 CRAWL_EVENT_POLL_SEC 간격으로 확인. start 부터 빈틈 없이 이어지는 이벤트만 돌려준다."""
+        end = time.monotonic() + timeout
+        while True:
+            try:
+                rows = _connect().execute(
+                    "SELECT seq, event, data FROM crawl_job_events WHERE job_id = ? AND seq >= ? ORDER BY seq",
+                    (self.id, start),
+                ).fetchall()
+            except sqlite3.Error as e:
+                print(f"[JOB] 작업 이벤트 조회 실패: {e}")
+                rows = []
+            events = []
+            for row in rows:
+                if row["seq"] != start + len(events):
+                    break   # 아직 커밋되지 않은 앞 이벤트가 있으면 거기까지만
+                events.append((row["event"], json.loads(row["data"]) if row["data"] else None))
+            if events or time.monotonic() >= end:
+                return events
+            time.sleep(min(CRAWL_EVENT_POLL_SEC, max(0.0, end - time.monotonic())))
+
+    def status(self) -> dict:
+        return _status(self.id, self.state, self.progress, self.error, self.error_status,
+                       self.created, self.started, self.finished, self.meta)
+
+
+class CrawlJobQueue:
+    def __init__(self, workers: int = CRAWL_WORKERS, max_pending: int = CRAWL_QUEUE_MAX, ttl: float = CRAWL_JOB_TTL_SEC):
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="crawl-job")
+        self.max_pending = max_pending
+        self.ttl = ttl
+        self._jobs: Dict[str, CrawlJob] = {}
+        self._active: Dict[Hashable, CrawlJob] = {}
+        self._lock = threading.Lock()
+        self.stats = {"submitted": 0, "coalesced": 0, "rejected": 0, "done": 0, "failed": 0, "remote_reads": 0}
+
+    def submit(self, key: Hashable, fn: Callable, *args, meta: Optional[dict] = None, **kwargs) -> Optional[CrawlJob]:
+        with self._lock:
+            self._expire()
+            job = self._active.get(key)
+            if job is not None:
+                self.stats["coalesced"] += 1
+                return job
+            pending = sum(1 for j in self._active.values() if j.state == "queued")
+            if pending >= self.max_pending:
+                self.stats["rejected"] += 1
+                return None
+            job = CrawlJob(key, meta or {})
+            self._jobs[job.id] = job
+            self._active[key] = job
+            self.stats["submitted"] += 1
+        self._executor.submit(self._run, job, fn, args, kwargs)
+        return job
+
+    def _run(self, job: CrawlJob, fn: Callable, args, kwargs):
+        with job._lock:
+            job.state = "running"
+            job.started = time.time()
+        _write("UPDATE crawl_jobs SET state = ?, started = ? WHERE id = ?", (job.state, job.started, job.id))
+        try:
+            result = fn(*args, progress=job.report, emit=job.emit, **kwargs)
+        except Exception as e:
+            print(f"[JOB] {job.id} 실패: {e}")
+            job._finish("error", error=str(e), error_status=getattr(e, "status", 500))
+            job.emit("error", {"error": str(e), "status": job.error_status})
+            outcome = "failed"
+        else:
+            job._finish("done", result=result)
+            job.emit("done", result)
+            outcome = "done"
+        with self._lock:
+            self._active.pop(job.key, None)
+            self.stats[outcome] += 1
+
+    def _expire(self):
+        now = time.time()
+        for job_id in [j.id for j in self._jobs.values() if j.finished and now - j.finished > self.ttl]:
+            del self._jobs[job_id]
+        # 저장소: 끝난 지 ttl 지난 작업 + 실행하던 워커가 죽어 끝나지 못한 오래된 작업
+        cutoff = now - self.ttl
+        _write("DELETE FROM crawl_job_events WHERE job_id IN "
+               "(SELECT id FROM crawl_jobs WHERE COALESCE(finished, created) < ?)", (cutoff,))
+        _write("DELETE FROM crawl_jobs WHERE COALESCE(finished, created) < ?", (cutoff,))
+
+    def get(self, job_id: str):
+        """이 워커의 작업이면 CrawlJob, 다른 워커의 작업이면 저장소에서 읽은 StoredCrawlJob, 없으면 None."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                return job
+            self.stats["remote_reads"] += 1
+        return StoredCrawlJob.load(job_id)
+
+    def lost(self, job_id: str) -> Optional[str]:
+        """
+        끝나지 못할 작업이면 사유, 아니면 None. 저장소를 다시 읽어 판단한다.
+        - 행이 없음: ttl 이 지나 _expire 가 지웠거나 저장소가 바뀜
+        - 실행 시작 후 CRAWL_JOB_STALL_SEC, 또는 생성 후 ttl 이 지나도록 끝나지 않음: 실행하던 워커가 죽음
+        """
+        job = self.get(job_id)
+        if job is None:
+            return "검색 작업이 만료되었습니다. 다시 검색해주세요."
+        if job.finished:
+            return None
+        now = time.time()
+        if (job.started and now - job.started > CRAWL_JOB_STALL_SEC) or now - job.created > self.ttl:
+            return "검색 작업이 응답 없이 중단되었습니다. 다시 검색해주세요."
+        return None
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            states = [j.state for j in self._jobs.values()]
+            return {
+                **self.stats,
+                "queued": states.count("queued"),
+                "running": states.count("running"),
+                "kept": len(states),
+                "workers": self._executor._max_workers,
+            }
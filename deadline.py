@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""
+요청 단위 시간 예산 (deadline).
+
+요청 하나에서 Deadline 을 만들어 스크래퍼와 그 안의 모든 대기에 넘긴다.
+  - 대기 시간은 cap(기본값) 으로 남은 시간 이하로 줄인다 (WebDriverWait, 페이지 로드, HTTP, 풀 대여).
+  - 반복(스크롤, 상세 페이지, 목록 페이지)은 expired() 면 멈추고 그때까지 모은 결과를 돌려준다.
+Deadline() (초 미지정)은 제한 없음: 기존 호출처럼 각 함수의 기본 대기 시간을 그대로 쓴다.
+"""
+import math
+import time
+from typing import Optional
+
+# 남은 시간이 0 이어도 대기 API 에 넘길 최소값 (0 초 대기는 한 번만 확인하고 바로 포기)
+MIN_WAIT_SEC = 0.1
+
+
+class Deadline:
+    def __init__(self, seconds: Optional[float] = None):
+        self.seconds = seconds
+        self.expires_at = None if seconds is None else time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        """남은 초 (제한 없으면 inf)."""
+        if self.expires_at is None:
+            return math.inf
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def timeout(self) -> Optional[float]:
+        """concurrent.futures 등 None 을 '무제한'으로 받는 API 에 넘길 남은 초."""
+        return None if self.expires_at is None else self.remaining()
+
+    def cap(self, timeout: float) -> float:
+        """timeout 과 남은 시간 중 짧은 쪽 (최소 MIN_WAIT_SEC)."""
+        return max(MIN_WAIT_SEC, min(timeout, self.remaining()))
+
+    def __repr__(self) -> str:
+        return f"Deadline(remaining={self.remaining():.1f}s)"
+
+
+def ensure(deadline: Optional[Deadline]) -> Deadline:
+    """deadline 인자를 받지 않은 호출(기존 코드)은 제한 없는 Deadline 으로."""
+    return deadline if deadline is not None else Deadline()
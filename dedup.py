@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+사이트 간 중복 공고 합치기.
+
+지문(fingerprint) = 정규화한 회사명 + 정규화한 제목 의 해시 : 마감일(YYYY-MM-DD, 모르면 빈 값).
+회사+제목 해시 → 대표 공고 색인 하나로 세 사이트 결과를 한 번씩만 훑는다 (전체 공고 수에 선형).
+
+같은 사이트 안에서는 회사+제목이 같아도 (같은 회사가 같은 제목으로 낸 다른 공고일 수 있으므로)
+마감일이 둘 다 있고 같거나 링크가 같을 때만 합친다.
+중복은 먼저 나온 공고(SITE_ORDER 순: 상세 정보가 가장 많은 잡플래닛 우선) 하나로 합치고,
+대표 공고의 "sources" 에 모든 사이트의 원문 링크를 [{"site", "link"}] 로 남긴다.
+캐시/single-flight 로 공유되는 원본 dict 는 건드리지 않고 복사본을 만든다.
+"""
+import re
+import hashlib
+from typing import Dict, List, Tuple
+
+from job_text import sanitize_company, normalize_deadline
+
+SITE_ORDER = ("jobplanet", "jobkorea", "incruit")
+
+_CORP_RX = re.compile(r"\(\s*(주|유|재|사)\s*\)|㈜|주식회사|유한회사|\(\s*株\s*\)", re.I)
+_BRACKET_RX = re.compile(r"[\[\(【<].*?[\]\)】>]")
+_NON_WORD_RX = re.compile(r"[^0-9a-z가-힣]+")
+
+
+def normalize_company(name: str) -> str:
+    name = sanitize_company(name or "") or ""
+    name = _CORP_RX.sub("", name)
+    return _NON_WORD_RX.sub("", name.lower())
+
+
+def normalize_title(title: str) -> str:
+    """[회사명]·(경력무관) 같은 괄호 머리말/꼬리, 기호, 공백 차이는 무시."""
+    title = _BRACKET_RX.sub(" ", (title or "").lower())
+    return _NON_WORD_RX.sub("", title)
+
+
+def _identity(job: dict) -> Tuple[str, str]:
+    """(회사+제목 해시, 마감일). 회사/제목을 못 읽은 공고는 링크로만 구분."""
+    company, title = normalize_company(job.get("company")), normalize_title(job.get("title"))
+    base = f"{company}|{title}" if (company or title) else (job.get("link") or job.get("url") or repr(sorted(job.items())))
+    deadline = job.get("deadline_norm") or normalize_deadline(job.get("deadline") or "")[0]
+    return hashlib.blake2b(base.encode("utf-8"), digest_size=8).hexdigest(), deadline
+
+
+def fingerprint(job: dict) -> str:
+    base, deadline = _identity(job)
+    return f"{base}:{deadline}"
+
+
+def _same_posting(rep: dict, site: str, link: str, deadline: str) -> bool:
+    """회사+제목이 같은 대표 공고 rep 와 (site, link, deadline) 공고가 같은 공고인지."""
+    if any(s["link"] == link for s in rep["sources"] if link):
+        return True
+    if any(s["site"] == site for s in rep["sources"]):
+        # 같은 사이트 목록 안: 마감일까지 같아야 같은 공고
+        return bool(deadline) and rep["_deadline"] == deadline
+    # 다른 사이트: 마감일이 같거나 한쪽이 모르면 같은 공고 (잡코리아/인크루트 목록에는 마감일이 없는 경우가 많다)
+    return not deadline or not rep["_deadline"] or rep["_deadline"] == deadline
+
+
+def merge_results(results: Dict[str, List[dict]]) -> Dict[str, List[dict]]:
+    """{사이트: [공고]} → 중복을 합친 {사이트: [공고]} (각 공고는 첫 등장 사이트에만 남는다)."""
+    # 회사+제목 해시 → 대표 공고들
+    index: Dict[str, List[dict]] = {}
+    merged: Dict[str, List[dict]] = {}
+    sites = [s for s in SITE_ORDER if s in results] + [s for s in results if s not in SITE_ORDER]
+    for site in sites:
+        out = merged[site] = []
+        for job in results.get(site) or []:
+            source = {"site": site, "link": job.get("link") or job.get("url", "")}
+            base, deadline = _identity(job)
+            same = index.setdefault(base, [])
+            first = next((j for j in same if _same_posting(j, site, source["link"], deadline)), None)
+            if first is not None:
+                if source["link"] not in {s["link"] for s in first["sources"]}:
+                    first["sources"].append(source)
+                first["_deadline"] = first["_deadline"] or deadline
+                continue
+            job = {**job, "fingerprint": f"{base}:{deadline}", "sources": [source], "_deadline": deadline}
+            same.append(job)
+            out.append(job)
+    for jobs in merged.values():
+        for job in jobs:
+            job.pop("_deadline")
+    return merged
+
+
+def collapse(jobs: List[dict]) -> List[dict]:
+    """
+    한 목록 안의 중복 제거 (카카오 발송용). 순서 유지, 첫 공고를 남긴다.
+    한 사이트 목록이므로 마감일을 모르는 공고는 링크까지 같아야 중복으로 본다.
+    """
+    seen = set()
+    out = []
+    for job in jobs:
+        base, deadline = _identity(job)
+        key = (base, deadline) if deadline else (base, "", job.get("link") or job.get("url", ""))
+        if key not in seen:
+            seen.add(key)
+            out.append(job)
+    return out
@@ -0,0 +1,361 @@
+# -*- coding: utf-8 -*-
+"""
+프로세스 전역 Chrome 드라이버 풀.
+
+scraper / inflearn_scraper / jk_crawler 가 호출마다 Chrome 을 새로 띄우고 종료하던 것을,
+이미 떠 있는 드라이버를 빌려(acquire) 쓰고 반납(release)하는 방식으로 바꾼다.
+
+- size         : 풀(이름)별 최대 드라이버 수 (대여중 + 대기중 + 생성중)
+- idle_timeout : 이 시간(초) 이상 놀고 있는 드라이버는 종료 (idle eviction)
+- 대여 직전 헬스체크에 실패한 드라이버는 폐기하고 새로 띄운다.
+- 반납 시 여분 탭/쿠키를 정리하고 about:blank 로 돌려 다음 사용자에게 상태가 새지 않게 한다.
+- 반납/유휴 정리 시 이동 횟수·메모리 한도를 넘은 드라이버는 재활용(종료)한다 (driver_watchdog).
+- 대여는 admission 의 전역/소스별 자리를 받은 뒤에만 가능하고, 반납/폐기 때 자리를 돌려준다
+  (detach 한 드라이버는 quit_driver 때). 소스별 상한 기본값은 풀 크기다.
+  새 드라이버를 띄울 때 살아있는 드라이버가 BROWSER_BUDGET 이상이면 다른 풀의 유휴 드라이버를 먼저 종료한다.
+
+사용 예)
+    with lease_driver("scraper", build_scraper_driver) as driver:
+        driver.get(url)
+"""
+from __future__ import annotations
+
+import os
+import time
+import atexit
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Tuple
+
+import admission
+from driver_watchdog import register, should_recycle, quit_driver, hold_admission
+
+POOL_SIZE = int(os.getenv("DRIVER_POOL_SIZE", "3"))
+POOL_IDLE_TIMEOUT = float(os.getenv("DRIVER_POOL_IDLE_SEC", "300"))
+POOL_ACQUIRE_TIMEOUT = float(os.getenv("DRIVER_POOL_ACQUIRE_SEC", "180"))
+REAPER_INTERVAL = 30.0
+
+
+class DriverPool:
+    def __init__(
+        self,
+        name: str,
+        factory: Callable[[], object],
+        size: int = POOL_SIZE,
+        idle_timeout: float = POOL_IDLE_TIMEOUT,
+    ):
+        self.name = name
+        self.factory = factory
+        self.size = max(1, int(size))
+        self.idle_timeout = idle_timeout
+        self._idle: List[Tuple[object, float]] = []   # (driver, 반납 시각)
+        self._total = 0                               # 살아있는 드라이버 수
+        self._closed = False
+        self._cond = threading.Condition()
+        self.stats = {"created": 0, "reused": 0, "discarded": 0, "evicted": 0, "recycled": 0}
+
+    # ---------- 대여/반납 ----------
+    def acquire(self, timeout: Optional[float] = None):
+        """
+        admission 자리를 받은 뒤(못 받으면 AdmissionRejected) 드라이버 대여.
+        idle 드라이버를 우선 재사용, 없으면 size 한도 안에서 새로 생성, 한도면 대기.
+        자리를 쥔 채 풀에서 기다리는 시간은 자리 대기와 합쳐 ADMISSION_WAIT_SEC 을 넘지 않는다
+        (소스별 상한이 풀 크기라 보통은 기다리지 않는다).
+        """
+        limit = admission.ADMISSION_WAIT_SEC if timeout is None else min(timeout, admission.ADMISSION_WAIT_SEC)
+        start = time.monotonic()
+        admission.acquire(self.name, limit)
+        try:
+            return self._acquire_driver(max(0.0, limit - (time.monotonic() - start)))
+        except BaseException:
+            admission.release(self.name)
+            raise
+
+    def _acquire_driver(self, timeout: Optional[float]):
+        timeout = POOL_ACQUIRE_TIMEOUT if timeout is None else timeout
+        end = time.time() + timeout
+        while True:
+            driver = None
+            create = False
+            with self._cond:
+                if self._closed:
+                    raise RuntimeError(f"driver pool '{self.name}' is closed")
+                expired = self._pop_expired_locked()
+                while driver is None and not create:
+                    if self._idle:
+                        # LIFO: 가장 최근에 반납된(따뜻한) 드라이버부터
+                        driver, _ = self._idle.pop()
+                    elif self._total < self.size:
+                        self._total += 1
+                        create = True
+                    else:
+                        remaining = end - time.time()
+                        if remaining <= 0:
+                            raise TimeoutError(f"driver pool '{self.name}' exhausted (size={self.size})")
+                        self._cond.wait(remaining)
+            _quit_all(expired)
+
+            if create:
+                _reclaim_idle(exclude=self)
+                try:
+                    driver = register(self.factory())
+                except Exception:
+                    with self._cond:
+                        self._total -= 1
+                        self._cond.notify()
+                    raise
+                with self._cond:
+                    self.stats["created"] += 1
+                return driver
+
+            if _is_healthy(driver):
+                with self._cond:
+                    self.stats["reused"] += 1
+                return driver
+            self._drop(driver)
+
+    def release(self, driver, discard: bool = False):
+        """사용이 끝난 드라이버 반납. 상태 초기화에 실패하면 폐기."""
+        if driver is None:
+            return
+        try:
+            reason = None if discard else should_recycle(driver)
+            if reason:
+                print(f"[POOL] {self.name}: 드라이버 재활용 ({reason})")
+                with self._cond:
+                    self.stats["recycled"] += 1
+            if discard or reason or not _reset(driver):
+                self._drop(driver)
+                return
+            with self._cond:
+                if not self._closed:
+                    self._idle.append((driver, time.time()))
+                    self._cond.notify()
+                    return
+                self._total -= 1
+            _quit_all([driver])
+        finally:
+            admission.release(self.name)
+
+    def discard(self, driver):
+        """대여한 드라이버를 풀에서 빼고 종료 (고장/오염된 경우)."""
+        self._drop(driver)
+        admission.release(self.name)
+
+    def _drop(self, driver):
+        with self._cond:
+            self._total -= 1
+            self.stats["discarded"] += 1
+            self._cond.notify()
+        _quit_all([driver])
+
+    def detach(self, driver):
+        """
+        드라이버 소유권을 호출자에게 넘김 (풀 한도에서 제외, 종료는 호출자 몫).
+        Chrome 은 계속 떠 있으므로 브라우저 자리는 호출자가 quit_driver() 로 종료할 때 반납된다.
+        """
+        with self._cond:
+            self._total -= 1
+            self._cond.notify()
+        hold_admission(driver, self.name)
+        return driver
+
+    # ---------- 정리 ----------
+    def _pop_expired_locked(self) -> list:
+        if self.idle_timeout is None or self.idle_timeout <= 0:
+            return []
+        now = time.time()
+        keep, expired = [], []
+        for drv, ts in self._idle:
+            (expired if now - ts >= self.idle_timeout else keep).append((drv, ts))
+        self._idle = keep
+        self._total -= len(expired)
+        self.stats["evicted"] += len(expired)
+        if expired:
+            self._cond.notify_all()
+        return [drv for drv, _ in expired]
+
+    def evict_idle(self):
+        """
+        유휴 시간 초과 + 이동/메모리 한도 초과 드라이버 정리 (reaper 스레드가 주기 호출).
+        메모리 측정(psutil 프로세스 트리 순회)은 잠금 밖에서 하고, 그 사이 대여된 드라이버는 건드리지 않는다.
+        """
+        with self._cond:
+            expired = self._pop_expired_locked()
+            candidates = [drv for drv, _ in self._idle]
+        over = {id(drv) for drv in candidates if should_recycle(drv)}
+        recycled = []
+        if over:
+            with self._cond:
+                keep = []
+                for drv, ts in self._idle:
+                    (recycled if id(drv) in over else keep).append((drv, ts))
+                self._idle = keep
+                self._total -= len(recycled)
+                self.stats["recycled"] += len(recycled)
+                if recycled:
+                    self._cond.notify_all()
+        _quit_all(expired + [drv for drv, _ in recycled])
+
+    def pop_oldest_idle(self) -> Optional[Tuple[object, float]]:
+        with self._cond:
+            if not self._idle:
+                return None
+            i = min(range(len(self._idle)), key=lambda k: self._idle[k][1])
+            item = self._idle.pop(i)
+            self._total -= 1
+            self.stats["evicted"] += 1
+            self._cond.notify()
+            return item
+
+    def alive(self) -> int:
+        with self._cond:
+            return self._total
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            idle = [drv for drv, _ in self._idle]
+            self._idle = []
+            self._total -= len(idle)
+            self._cond.notify_all()
+        _quit_all(idle)
+
+    def snapshot(self) -> dict:
+        with self._cond:
+            return {
+                "name": self.name,
+                "size": self.size,
+                "alive": self._total,
+                "idle": len(self._idle),
+                "leased": self._total - len(self._idle),
+                **self.stats,
+            }
+
+
+# ------------------ 드라이버 상태 유틸 ------------------
+def _is_healthy(driver) -> bool:
+    try:
+        return driver.execute_script("return 1;") == 1 and len(driver.window_handles) >= 1
+    except Exception:
+        return False
+
+def _reset(driver) -> bool:
+    """여분 탭 닫기 → 첫 탭으로 → 쿠키 삭제 → about:blank."""
+    try:
+        handles = driver.window_handles
+        for h in handles[1:]:
+            driver.switch_to.window(h)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        driver.switch_to.default_content()
+        driver.delete_all_cookies()
+        driver.get("about:blank")
+        return True
+    except Exception:
+        return False
+
+def _quit_all(drivers):
+    for drv in drivers:
+        quit_driver(drv)
+
+
+def _reclaim_idle(exclude: Optional[DriverPool] = None):
+    """
+    살아있는 드라이버가 BROWSER_BUDGET 을 넘으면 (exclude 외) 풀들의 유휴 드라이버를
+    오래된 것부터 종료해 한도 안으로 맞춘다. 대여중 드라이버는 admission 이 이미 한도로 막는다.
+    """
+    with _pools_lock:
+        pools = list(_pools.values())
+    over = sum(p.alive() for p in pools) - admission.BROWSER_BUDGET
+    victims = []
+    while over > 0:
+        candidates = []
+        for p in pools:
+            if p is exclude:
+                continue
+            with p._cond:
+                if p._idle:
+                    candidates.append((min(ts for _, ts in p._idle), p))
+        if not candidates:
+            break
+        _, pool = min(candidates, key=lambda c: c[0])
+        item = pool.pop_oldest_idle()
+        if item:
+            victims.append(item[0])
+            over -= 1
+    if victims:
+        print(f"[POOL] 브라우저 한도({admission.BROWSER_BUDGET}) 유지를 위해 유휴 드라이버 {len(victims)}개 종료")
+    _quit_all(victims)
+
+
+# ------------------ 프로세스 전역 레지스트리 ------------------
+_pools: Dict[str, DriverPool] = {}
+_pools_lock = threading.Lock()
+_reaper: Optional[threading.Thread] = None
+
+
+def _reaper_loop():
+    while True:
+        time.sleep(REAPER_INTERVAL)
+        with _pools_lock:
+            pools = list(_pools.values())
+        for p in pools:
+            try:
+                p.evict_idle()
+            except Exception:
+                pass
+
+
+def get_pool(
+    name: str,
+    factory: Callable[[], object],
+    size: Optional[int] = None,
+    idle_timeout: Optional[float] = None,
+) -> DriverPool:
+    """이름별 풀을 하나만 만들어 공유. 최초 호출 시의 factory/size 가 사용된다."""
+    global _reaper
+    with _pools_lock:
+        pool = _pools.get(name)
+        if pool is None:
+            pool = DriverPool(
+                name,
+                factory,
+                size=POOL_SIZE if size is None else size,
+                idle_timeout=POOL_IDLE_TIMEOUT if idle_timeout is None else idle_timeout,
+            )
+            _pools[name] = pool
+            # 소스별 admission 상한 기본값 = 풀 크기 (풀이 꽉 찬 소스는 전역 자리를 더 받지 않고 바로 기다린다/거절된다)
+            admission.register_source(name, pool.size)
+        if _reaper is None:
+            _reaper = threading.Thread(target=_reaper_loop, name="driver-pool-reaper", daemon=True)
+            _reaper.start()
+        return pool
+
+
+@contextmanager
+def lease_driver(name: str, factory: Callable[[], object], timeout: Optional[float] = None):
+    """with 블록 동안 드라이버를 빌려 쓰고, 예외가 새어 나오면 해당 드라이버는 폐기."""
+    pool = get_pool(name, factory)
+    driver = pool.acquire(timeout=timeout)
+    try:
+        yield driver
+    except BaseException:
+        pool.release(driver, discard=True)
+        raise
+    else:
+        pool.release(driver)
+
+
+def pool_stats() -> List[dict]:
+    with _pools_lock:
+        pools = list(_pools.values())
+    return [p.snapshot() for p in pools]
+
+
+@atexit.register
+def shutdown_pools():
+    with _pools_lock:
+        pools = list(_pools.values())
+    for p in pools:
+        p.close()
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""
+Chrome 드라이버 메모리 감시 & 재활용.
+
+- 드라이버별 이동(navigation) 횟수와 chromedriver 이하 프로세스 트리 RSS 를 추적한다.
+- DRIVER_MAX_NAVS 회 이상 이동했거나 DRIVER_MAX_RSS_MB 를 넘은 드라이버는
+  should_recycle() 이 사유를 돌려주고, 드라이버 풀은 반납/유휴 정리 시 이를 폐기한다.
+- quit_driver() 는 드라이버 종료 직후 임시 프로필 디렉터리(--user-data-dir)를 바로 지운다.
+- 풀에서 떼어 낸(detach) 드라이버는 브라우저 자리(admission)를 quit_driver() 할 때 돌려준다.
+
+RSS 측정에는 psutil 이 필요하다 (없으면 이동 횟수 기준만 동작).
+"""
+import os
+import time
+import shutil
+import atexit
+import threading
+from typing import Dict, List, Optional
+
+import admission
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+DRIVER_MAX_NAVS = int(os.getenv("DRIVER_MAX_NAVS", "200"))
+DRIVER_MAX_RSS_MB = float(os.getenv("DRIVER_MAX_RSS_MB", "1500"))
+
+# id(driver) → {"navs", "profile", "created", "pid", "admission"(detach 된 드라이버가 쥔 자리의 소스)}
+_drivers: Dict[int, dict] = {}
+_lock = threading.Lock()
+
+
+def register(driver, profile_dir: Optional[str] = None):
+    """드라이버 추적 시작. 이미 등록돼 있으면 profile_dir 만 갱신."""
+    try:
+        pid = driver.service.process.pid
+    except Exception:
+        pid = None
+    with _lock:
+        info = _drivers.setdefault(id(driver), {"navs": 0, "profile": None, "created": time.time(), "pid": pid})
+        if profile_dir:
+            info["profile"] = profile_dir
+    return driver
+
+
+def hold_admission(driver, source: str):
+    """driver 가 살아 있는 동안 source 의 브라우저 자리를 유지하고, quit_driver() 에서 반납한다."""
+    with _lock:
+        info = _drivers.setdefault(id(driver), {"navs": 0, "profile": None, "created": time.time(), "pid": None})
+        info["admission"] = source
+
+
+def note_navigation(driver, n: int = 1):
+    """페이지 이동 1회 기록 (driver.get / refresh / window.open 직전에 호출)."""
+    with _lock:
+        info = _drivers.get(id(driver))
+        if info is not None:
+            info["navs"] += n
+
+
+def rss_mb(driver) -> Optional[float]:
+    """chromedriver + 하위 chrome 프로세스 전체 RSS(MB). 측정 불가면 None."""
+    with _lock:
+        pid = (_drivers.get(id(driver)) or {}).get("pid")
+    return _tree_rss_mb(pid)
+
+
+def _tree_rss_mb(pid: Optional[int]) -> Optional[float]:
+    if psutil is None or not pid:
+        return None
+    try:
+        root = psutil.Process(pid)
+        total = 0
+        for proc in [root] + root.children(recursive=True):
+            try:
+                total += proc.memory_info().rss
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+        return total / (1024 * 1024)
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        return None
+
+
+def should_recycle(driver) -> Optional[str]:
+    """재활용(종료 후 새로 생성)이 필요하면 사유 문자열, 아니면 None."""
+    with _lock:
+        navs = (_drivers.get(id(driver)) or {}).get("navs", 0)
+    if DRIVER_MAX_NAVS > 0 and navs >= DRIVER_MAX_NAVS:
+        return f"navigations {navs} >= {DRIVER_MAX_NAVS}"
+    mem = rss_mb(driver)
+    if mem is not None and DRIVER_MAX_RSS_MB > 0 and mem >= DRIVER_MAX_RSS_MB:
+        return f"rss {mem:.0f}MB >= {DRIVER_MAX_RSS_MB:.0f}MB"
+    return None
+
+
+def quit_driver(driver):
+    """드라이버 종료 후 임시 프로필을 즉시 삭제하고 추적에서 제외 (detach 된 드라이버면 자리도 반납)."""
+    try:
+        driver.quit()
+    except Exception:
+        pass
+    with _lock:
+        info = _drivers.pop(id(driver), None)
+    if info and info.get("admission"):
+        admission.release(info["admission"])
+    if info and info.get("profile"):
+        shutil.rmtree(info["profile"], ignore_errors=True)
+
+
+def snapshot() -> List[dict]:
+    with _lock:
+        items = [(drv_id, dict(info)) for drv_id, info in _drivers.items()]
+    out = []
+    for drv_id, info in items:
+        info["id"] = drv_id
+        info["age_sec"] = round(time.time() - info.pop("created"), 1)
+        info["rss_mb"] = _tree_rss_mb(info.get("pid"))
+        out.append(info)
+    return out
+
+
+@atexit.register
+def _cleanup_profiles():
+    """프로세스 종료 시 남은 임시 프로필 정리 (정상 경로에서는 quit_driver 가 이미 지움)."""
+    with _lock:
+        profiles = [info["profile"] for info in _drivers.values() if info.get("profile")]
+        _drivers.clear()
+    for path in profiles:
+        shutil.rmtree(path, ignore_errors=True)
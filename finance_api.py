@@ -1,9 +1,9 @@
 # -*- coding: utf-8 -*-
 import requests
-import time
 import math
 import json
 from typing import Optional, List, Dict, Tuple
+from rate_limit import throttle
 
 SERVICE_KEY = "jvcIVEG7hdytqIlJiB%2BfPbqM%2B3UDfa0JUss%2BMgh6GmqlNYMuzvkyS%2BHQ%2BY1JbWChr2tgVCui%2F%2FmE5rGAXo3d4g%3D%3D"
 RESULT_TYPE = "json"
@@ -14,6 +14,7 @@ FIN_SUM_URL = "http://apis.data.go.kr/1160100/service/GetFinaStatInfoService_V2/
 def req_json(url: str, params: dict) -> dict:
     full_url = f"{url}?serviceKey={SERVICE_KEY}"
     try:
+        throttle(url)
         r = requests.get(full_url, params=params, timeout=30)
         r.raise_for_status()
         data = r.json()
@@ -38,7 +39,7 @@ def find_crno_by_name(company_name: str, strict: bool = True) -> Optional[str]:
             if it.get("corpNm") == company_name and it.get("crno"): return it["crno"]
     return items[0].get("crno")
 
-def fetch_all_fin_summary_by_crno(crno: str, num_rows: int = 100, delay_sec: float = 0.2, fnclDcd: Optional[str] = None) -> List[Dict]:
+def fetch_all_fin_summary_by_crno(crno: str, num_rows: int = 100, fnclDcd: Optional[str] = None) -> List[Dict]:
     params = {"pageNo": "1","numOfRows": str(num_rows),"resultType": RESULT_TYPE,"crno": crno}
     if fnclDcd: params["fnclDcd"] = fnclDcd
     data = req_json(FIN_SUM_URL, params)
@@ -50,7 +51,7 @@ def fetch_all_fin_summary_by_crno(crno: str, num_rows: int = 100, delay_sec: flo
     all_rows: List[Dict] = []; all_rows.extend(items)
     total_pages = math.ceil(total_count / num_rows) if num_rows else 1
     for page_no in range(2, total_pages + 1):
-        time.sleep(delay_sec); params["pageNo"] = str(page_no)
+        params["pageNo"] = str(page_no)
         page_data = req_json(FIN_SUM_URL, params)
         page_items = (page_data.get("response", {}).get("body", {}).get("items") or {}).get("item")
         if not page_items: continue
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""
+gunicorn 설정 (gunicorn app:app 실행 시 현재 디렉터리의 이 파일을 자동으로 읽는다).
+
+/api/crawl_stream (SSE) 은 크롤링이 끝날 때까지 연결을 열어 두므로 sync 워커에서는 워커 하나를 통째로 붙잡는다.
+gevent 가 설치돼 있으면 gevent 워커로 띄워 연결 하나가 그린렛 하나만 쓰게 하고,
+없으면 gthread 워커로 띄운다. 이때 app.streaming_enabled() 가 꺼지므로 화면은 /api/crawl_status 폴링으로 동작한다.
+(CRAWL_STREAMING=1 로 강제하면 gthread 에서도 SSE 를 쓰지만, 연결마다 스레드 하나를 차지한다.)
+
+예약 스케줄러는 워커마다 post_worker_init 에서 시작해 리더 선출에 참여한다 (app.SCHEDULER_AUTOSTART 참고).
+--preload 여부와 관계없이 앱을 불러온 뒤의 워커 프로세스에서 불리므로 마스터가 리더를 독차지하지 않는다.
+"""
+import os
+import importlib.util
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(os.getenv("GUNICORN_WORKERS", "2"))
+worker_class = os.getenv(
+    "GUNICORN_WORKER_CLASS",
+    "gevent" if importlib.util.find_spec("gevent") is not None else "gthread",
+)
+# gevent: 워커당 동시 연결 수 / gthread: 워커당 스레드 수
+worker_connections = int(os.getenv("GUNICORN_WORKER_CONNECTIONS", "200"))
+threads = int(os.getenv("GUNICORN_THREADS", "8"))
+# 크롤링은 백그라운드 작업이라 요청 자체는 짧다. SSE 연결은 15초마다 keepalive 를 보낸다.
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "120"))
+
+
+def post_worker_init(worker):
+    import app
+    app.start_scheduler()
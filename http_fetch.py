@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+HTTP 우선 페이지 가져오기 (Selenium 은 폴백).
+
+인크루트 검색 목록, 잡코리아 /Search/ 결과처럼 서버에서 렌더링되는 페이지는
+헤드리스 Chrome 없이 requests + HTML 파서로 충분하다.
+fetch_soup() 가 기대 선택자(expect)를 min_count 개 이상 찾으면 soup 를 돌려주고,
+못 찾으면(= JS 렌더링이 필요한 페이지) None 을 돌려주어 호출자가 Selenium 경로로 내려가게 한다.
+단, 서버가 그린 '결과 없음' 문구/영역이나 결과 카드가 몇 개라도 보이면(rendered) 결과가 적거나 없는 것이지
+JS 가 필요한 것이 아니므로 soup 를 그대로 돌려준다 (호출자는 0~N 개로 처리하고 브라우저를 띄우지 않는다).
+"""
+import os
+import threading
+from typing import Dict, Iterable, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup
+
+from rate_limit import throttle
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+HTTP_FIRST = os.getenv("HTTP_FIRST", "1") not in ("0", "false", "False")
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "10"))
+
+# 검색 결과가 없을 때 서버 렌더링 페이지에 나오는 문구
+NO_RESULT_TEXTS = ("검색결과가 없습니다", "검색 결과가 없습니다", "일치하는 채용정보가 없습니다", "조건에 맞는 채용정보가 없습니다")
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.5",
+}
+
+# 호스트별 커넥션 풀(keep-alive) 세션
+_sessions: Dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+
+def get_session(host: str) -> requests.Session:
+    with _sessions_lock:
+        sess = _sessions.get(host)
+        if sess is None:
+            sess = requests.Session()
+            sess.headers.update(HEADERS)
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=1)
+            sess.mount("http://", adapter)
+            sess.mount("https://", adapter)
+            _sessions[host] = sess
+        return sess
+
+
+def fetch_soup(
+    url: str,
+    expect: Optional[str] = None,
+    min_count: int = 1,
+    timeout: float = HTTP_TIMEOUT,
+    rendered: Optional[str] = None,
+    empty_texts: Iterable[str] = NO_RESULT_TEXTS,
+) -> Tuple[Optional[BeautifulSoup], str]:
+    """
+    url 을 HTTP 로 받아 파싱. (soup, 최종 URL) 반환.
+    expect(CSS 선택자)가 min_count 개 미만이면 JS 가 필요한 페이지로 보고 soup=None.
+    단 rendered(CSS 선택자)가 하나라도 있거나 empty_texts 문구가 보이면 서버 렌더링된 짧은/빈 결과로 보고 soup 반환.
+    """
+    if not HTTP_FIRST:
+        return None, url
+    try:
+        throttle(url)
+        res = get_session(urlparse(url).netloc).get(url, timeout=timeout)
+        res.raise_for_status()
+    except requests.RequestException as e:
+        print(f"[HTTP] {url} 요청 실패, Selenium 으로 대체합니다: {e}")
+        return None, url
+
+    # bytes 를 넘겨 meta charset(EUC-KR 등)을 파서가 직접 판별하게 한다.
+    soup = BeautifulSoup(res.content, HTML_PARSER)
+    if expect and len(soup.select(expect)) < min_count:
+        if _server_rendered(soup, rendered, empty_texts):
+            return soup, res.url
+        print(f"[HTTP] {url} 에서 '{expect}' 를 찾지 못해 Selenium 으로 대체합니다.")
+        return None, res.url
+    return soup, res.url
+
+
+def _server_rendered(soup: BeautifulSoup, rendered: Optional[str], empty_texts: Iterable[str]) -> bool:
+    """결과가 적거나 없다는 것을 서버가 이미 그려 보냈는지 (rendered 요소 또는 '결과 없음' 문구)."""
+    if rendered and soup.select_one(rendered) is not None:
+        return True
+    text = soup.get_text(" ", strip=True)
+    return any(marker in text for marker in empty_texts)
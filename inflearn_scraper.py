@@ -8,6 +8,24 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
+from driver_pool import get_pool
+from load_profile import lean_options, apply_load_profile, report_blocked
+from rate_limit import throttle
+from driver_watchdog import note_navigation
+
+def build_inflearn_driver():
+    """인프런 전용 드라이버 (한국어 콘텐츠 강제) - 드라이버 풀의 factory."""
+    options = webdriver.ChromeOptions()
+    options.add_argument("headless")
+    options.add_argument("window-size=1920x1080")
+    options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
+    # ⭐️ 브라우저 언어 설정을 한국어로 강제하여 한국어 콘텐츠를 무조건 받도록 수정
+    options.add_argument("--lang=ko-KR")
+    # ⭐️ 선호 언어 설정도 한국어로 명시하여 안정성 강화
+    options.add_experimental_option('prefs', {'intl.accept_languages': 'ko,ko_KR'})
+    lean_options(options)
+    service = Service(ChromeDriverManager().install())
+    return webdriver.Chrome(service=service, options=options)
 
 # ⭐️ 함수가 limit 파라미터를 받도록 수정 (기본값은 10)
 def scrape_inflearn(keyword, limit=10):
@@ -26,16 +44,8 @@ def scrape_inflearn(keyword, limit=10):
     base_url = "https://www.inflearn.com"
     search_url = f"{base_url}/courses?s={keyword}"
     
-    options = webdriver.ChromeOptions()
-    options.add_argument("headless")
-    options.add_argument("window-size=1920x1080")
-    options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
-    # ⭐️ 브라우저 언어 설정을 한국어로 강제하여 한국어 콘텐츠를 무조건 받도록 수정
-    options.add_argument("--lang=ko-KR")
-    # ⭐️ 선호 언어 설정도 한국어로 명시하여 안정성 강화
-    options.add_experimental_option('prefs', {'intl.accept_languages': 'ko,ko_KR'})
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=options)
+    pool = get_pool("inflearn", build_inflearn_driver)
+    driver = pool.acquire()
     
     results = []
     seen_titles = set()
@@ -43,10 +53,14 @@ def scrape_inflearn(keyword, limit=10):
     print(f"Selenium으로 '{keyword}' 검색 페이지 로딩 시작: {search_url}")
 
     try:
+        apply_load_profile(driver, "inflearn")
+        throttle(search_url)
+        note_navigation(driver)
         driver.get(search_url)
         WebDriverWait(driver, 15).until(
             EC.presence_of_all_elements_located((By.CSS_SELECTOR, CARD_SELECTOR))
         )
+        report_blocked(driver, "inflearn")
         
         html = driver.page_source
         soup = BeautifulSoup(html, "html.parser")
@@ -109,7 +123,7 @@ def scrape_inflearn(keyword, limit=10):
         print(f"크롤링 중 오류 발생: {e}")
         return []
     finally:
-        driver.quit()
+        pool.release(driver)
 
 # --- 테스트를 위한 코드 예시 ---
 if __name__ == '__main__':
@@ -4,8 +4,10 @@
 from __future__ import annotations
 from dataclasses import dataclass, asdict
 from typing import List, Tuple, Optional, Iterable
-import time, tempfile, shutil, atexit, random, re, calendar
-from urllib.parse import urlencode
+import time, tempfile, shutil, re, json, os
+import concurrent.futures
+from collections import deque
+from urllib.parse import urlencode, urljoin
 from datetime import date, timedelta
 
 from selenium import webdriver as wb
@@ -15,13 +17,37 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from webdriver_manager.chrome import ChromeDriverManager
 
+from driver_pool import get_pool, POOL_ACQUIRE_TIMEOUT
+from load_profile import lean_options, apply_load_profile, report_blocked
+from http_fetch import fetch_soup, HTTP_FIRST, HTTP_TIMEOUT
+from rate_limit import throttle
+from driver_watchdog import register, note_navigation, quit_driver
+from deadline import Deadline, ensure
+from admission import AdmissionRejected
+from job_text import normalize_deadline, sanitize_company
+import posting_store
+
 __all__ = [
     "Job",
     "crawl_latest_newbie",
     "crawl_latest_all",
     "search_jobs",
+    "stored_jobs",
 ]
 
+# 리스트 수집 기본 모드: True 면 페이지당 스크립트 1회로 카드 전체를 수집
+BULK_EXTRACT = os.getenv("JK_BULK_EXTRACT", "1") not in ("0", "false", "False")
+# 여러 페이지 수집 시 동시에 로딩해 둘 최대 페이지 수 (1 이면 순차)
+PIPELINE_DEPTH = int(os.getenv("JK_PIPELINE_DEPTH", "2"))
+# 검색 결과 한 페이지의 공고 수. want 가 이보다 크거나 앞 페이지가 꽉 찼을 때만 다음 페이지를 미리 띄운다
+PAGE_SIZE = int(os.getenv("JK_PAGE_SIZE", "20"))
+# 증분 모드: 한 페이지에서 이미 본 공고 비율이 이 이상이면 다음 페이지로 넘어가지 않는다
+INCREMENTAL_KNOWN_RATIO = float(os.getenv("JK_INCREMENTAL_KNOWN_RATIO", "0.8"))
+# 페이지 로드 상한 (요청 deadline 이 더 짧으면 그쪽을 따른다)
+PAGE_LOAD_TIMEOUT = float(os.getenv("JK_PAGE_LOAD_TIMEOUT", "20"))
+# HTTP 응답이 서버 렌더링된 결과(짧은 마지막 페이지/결과 없음)인지 판단하는 선택자: 공고 앵커 1개 이상 또는 '결과 없음' 영역
+HTTP_RENDERED_SELECTOR = "a[href*='/Recruit/GI_Read/'], .list-empty, .list-none, [class*='noResult'], [class*='no-result']"
+
 # ------------------ 데이터 모델 ------------------
 @dataclass
 class Job:
@@ -122,7 +148,10 @@ def extract_deadline_text(scope) -> str:
             candidates.append(all_text)
     except Exception:
         pass
+    return deadline_from_texts(candidates)
 
+def deadline_from_texts(candidates: List[str]) -> str:
+    """후보 텍스트 목록(배지 → 카드 전체 순)에서 마감 표기를 고른다. 브라우저 호출 없음."""
     # 날짜 형식 우선 탐색
     date_res = [
         re.compile(r"\b20\d{2}\.\d{1,2}\.\d{1,2}\b"),
@@ -146,96 +175,8 @@ def extract_deadline_text(scope) -> str:
             return m.group(0)
     return ""
 
-def normalize_deadline(deadline_text: str) -> Tuple[str, Optional[int]]:
-    """
-    입력(날짜/D-day/문구) → (YYYY-MM-DD 또는 '', dday 또는 None)
-    """
-    if not deadline_text:
-        return "", None
-
-    raw = deadline_text.strip()
-    # 괄호(요일) 제거 & 공백 제거
-    s = re.sub(r"\([^)]*\)", "", raw).replace(" ", "")
-
-    # 이미 D-숫자
-    m = re.search(r"D\s*[-+]\s*(\d+)", s, re.I)
-    if m:
-        return "", int(m.group(1))
-
-    # 오늘/내일
-    if "오늘" in s:
-        return "", 0
-    if "내일" in s:
-        return "", 1
-
-    # 상시/채용시까지
-    if ("상시채용" in s) or ("채용시까지" in s):
-        return "", None
-
-    # 날짜 파싱
-    s2 = s.replace("/", ".")
-    now = time.localtime()
-    today_ts = time.mktime(time.strptime(time.strftime("%Y-%m-%d"), "%Y-%m-%d"))
-
-    y = None; mm = None; dd = None
-    explicit_year = False
-
-    # YYYY.MM.DD
-    m = re.search(r"(\d{4})\.(\d{1,2})\.(\d{1,2})", s2)
-    if m:
-        y, mm, dd = int(m.group(1)), int(m.group(2)), int(m.group(3))
-        explicit_year = True
-    else:
-        # YY.MM.DD
-        m = re.search(r"(^|[^0-9])(\d{2})\.(\d{1,2})\.(\d{1,2})", s2)
-        if m:
-            y, mm, dd = 2000 + int(m.group(2)), int(m.group(3)), int(m.group(4))
-            explicit_year = True
-        else:
-            # MM.DD
-            m = re.search(r"(\d{1,2})\.(\d{1,2})", s2)
-            if m:
-                mm, dd = int(m.group(1)), int(m.group(2))
-                y = now.tm_year
-                explicit_year = False
-            else:
-                # '8월 30일'
-                m = re.search(r"(\d{1,2})월\s*(\d{1,2})일", raw)
-                if m:
-                    mm, dd = int(m.group(1)), int(m.group(2))
-                    y = now.tm_year
-                    explicit_year = False
-
-    if y is None or mm is None or dd is None:
-        return "", None
-
-    # 범위 보정
-    mm = max(1, min(12, mm))
-    dd = max(1, min(calendar.monthrange(y, mm)[1], dd))
-
-    norm = f"{y:04d}-{mm:02d}-{dd:02d}"
-    try:
-        cand_ts = time.mktime(time.strptime(norm, "%Y-%m-%d"))
-        # 연도 없는 표기인데 이미 지났다면 내년으로 넘김
-        if (not explicit_year) and cand_ts < today_ts:
-            y += 1
-            norm = f"{y:04d}-{mm:02d}-{dd:02d}"
-            cand_ts = time.mktime(time.strptime(norm, "%Y-%m-%d"))
-        dday = int((cand_ts - today_ts) / 86400)
-    except Exception:
-        dday = None
-
-    return norm, dday
-
 
 # ------------------ 회사/제목/지역 탐색 ------------------
-def sanitize_company(name: str) -> str:
-    """회사명 끝의 '로고/기업로고/logo' 꼬리 제거."""
-    if not name: return name
-    name = re.sub(r"\s*(기업\s*)?로고$", "", name, flags=re.I)
-    name = re.sub(r"\s*logo$", "", name, flags=re.I)
-    return name.strip(" -∙·•—|")
-
 def find_company_text(driver, base) -> str:
     """
     base(카드/앵커) 주변에서 회사명 탐색
@@ -293,8 +234,11 @@ def find_title_text(driver, scope, anchor, company_hint: str = "") -> str:
     except Exception:
         pass
 
-    whole = smart_text(driver, scope)
-    lines = [ln.strip() for ln in whole.splitlines() if ln.strip()]
+    return title_from_lines(smart_text(driver, scope), company_hint)
+
+def title_from_lines(whole: str, company_hint: str = "") -> str:
+    """카드 전체 텍스트에서 배지/지역/회사명 줄을 빼고 제목다운 줄을 고른다."""
+    lines = [ln.strip() for ln in (whole or "").splitlines() if ln.strip()]
 
     def is_badge(s: str) -> bool:
         return bool(re.search(r"(조회수|오늘마감|내일마감|상시채용|채용시까지|즉시지원|원클릭|관심기업|D\s*[-+]\s*\d+)", s))
@@ -334,26 +278,43 @@ def build_driver(gui: bool = False) -> wb.Chrome:
     opts.add_experimental_option("excludeSwitches", ["enable-automation"])
     opts.add_experimental_option("useAutomationExtension", False)
     opts.page_load_strategy = "eager"
+    lean_options(opts)
 
+    # 임시 프로필은 driver_watchdog.quit_driver() 가 드라이버 종료 직후 지운다.
     tmp = tempfile.mkdtemp(prefix="selenium_jobkorea_")
     opts.add_argument(f"--user-data-dir={tmp}")
-    atexit.register(lambda: shutil.rmtree(tmp, ignore_errors=True))
 
-    driver = wb.Chrome(service=Service(ChromeDriverManager().install()), options=opts)
-    driver.set_page_load_timeout(20)
-    return driver
+    try:
+        driver = wb.Chrome(service=Service(ChromeDriverManager().install()), options=opts)
+    except Exception:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+    driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+    return register(driver, profile_dir=tmp)
+
+
+def driver_pool():
+    """헤드리스 build_driver 를 factory 로 쓰는 잡코리아 전용 드라이버 풀."""
+    return get_pool("jobkorea", build_driver)
 
 
 # ------------------ 검색/대기 ------------------
-def goto_search_with_params(driver, keyword: str, page: int = 1, latest: bool = True, newbie: bool = True):
-    """잡코리아 검색 결과로 바로 이동."""
+def search_url(keyword: str, page: int = 1, latest: bool = True, newbie: bool = True) -> str:
+    """잡코리아 검색 결과 URL."""
     base = "https://www.jobkorea.co.kr/Search/"
     params = {"stext": keyword, "tabType": "recruit", "page": str(page)}
     if latest:
         params["ord"] = "EditDtDesc"
     if newbie:
         params["careerType"] = "1"
-    driver.get(base + "?" + urlencode(params))
+    return base + "?" + urlencode(params)
+
+def goto_search_with_params(driver, keyword: str, page: int = 1, latest: bool = True, newbie: bool = True):
+    """잡코리아 검색 결과로 바로 이동."""
+    url = search_url(keyword, page=page, latest=latest, newbie=newbie)
+    throttle(url)
+    note_navigation(driver)
+    driver.get(url)
 
 def wait_results(driver, min_links: int = 5, timeout: float = 10.0) -> bool:
     """GI_Read 앵커가 충분히 로드될 때까지 폴링."""
@@ -408,6 +369,15 @@ def extract_career_text(driver, scope) -> str:
         whole = smart_text(driver, scope)
     except Exception:
         whole = (scope.text or "")
+    return career_from_texts([], whole)
+
+def career_from_texts(el_texts: List[str], whole: str) -> str:
+    """요소 텍스트 후보 → 카드 전체 텍스트 순으로 경력 표기를 찾는다. 브라우저 호출 없음."""
+    for t in el_texts:
+        t = (t or "").strip()
+        if t and re.search(r"(신입|경력|경력무관|인턴)", t) and len(t) <= 30:
+            return t
+
     lines = [ln.strip() for ln in (whole or "").splitlines() if ln.strip()]
 
     rx = re.compile(
@@ -429,7 +399,19 @@ def extract_career_text(driver, scope) -> str:
 
 
 # ------------------ 리스트 수집(제목/회사/지역/마감/경력) ------------------
-def collect_from_list(driver, want: int) -> List[Job]:
+def collect_from_list(driver, want: int, bulk: Optional[bool] = None) -> List[Job]:
+    """
+    bulk=True(기본, BULK_EXTRACT)면 collect_from_list_bulk 로 한 번에 수집하고,
+    스크립트가 실패하거나 카드를 못 찾으면 아래의 요소 단위 탐색으로 내려간다.
+    """
+    if BULK_EXTRACT if bulk is None else bulk:
+        try:
+            jobs = collect_from_list_bulk(driver, want)
+            if jobs:
+                return jobs
+        except Exception:
+            pass
+
     jobs: List[Job] = []
     seen = set()
 
@@ -514,15 +496,375 @@ def collect_from_list(driver, want: int) -> List[Job]:
                 dday=dday,
                 career=career
             ))
+        except Exception:
+            continue
+
+    return jobs
 
-            time.sleep(0.05 + random.random() * 0.05)
+
+# ------------------ 리스트 일괄 수집(스크립트 1회 호출) ------------------
+# 결과 페이지의 모든 카드를 브라우저 안에서 한 번에 훑어 원시 텍스트만 JSON 으로 돌려준다.
+# 카드 scope/회사명 탐색 규칙은 collect_from_list / find_company_text 와 동일하게 맞춘다.
+CARD_SCRIPT = r"""
+const want = arguments[0];
+const ANCHOR_SELS = arguments[1];
+const COMPANY_XPS = arguments[2];
+const LOC_SELS = arguments[3];
+const CAREER_SELS = arguments[4];
+const BADGE_SELS = arguments[5];
+
+const txt = (el) => ((el && (el.innerText || el.textContent)) || "").trim();
+const xpFirst = (node, xp) => {
+  try {
+    return document.evaluate(xp, node, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+  } catch (e) { return null; }
+};
+const texts = (scope, sels) => {
+  const out = [];
+  for (const sel of sels) {
+    try { scope.querySelectorAll(sel).forEach(el => { const t = txt(el); if (t) out.push(t); }); } catch (e) {}
+  }
+  return out;
+};
+const companyOf = (base) => {
+  let node = base;
+  for (let i = 0; i < 10 && node; i++) {
+    for (const xp of COMPANY_XPS) {
+      const t = txt(xpFirst(node, xp));
+      if (t) return t;
+    }
+    const img = xpFirst(node, ".//img[@alt and normalize-space(@alt)!=''][1]");
+    if (img && (img.getAttribute("alt") || "").trim()) return img.getAttribute("alt").trim();
+    node = node.parentElement;
+  }
+  return "";
+};
+
+const seen = new Set();
+const cards = [];
+for (const sel of ANCHOR_SELS) {
+  let found = [];
+  try { found = document.querySelectorAll(sel); } catch (e) {}
+  for (const a of found) {
+    if (cards.length >= want) break;
+    const href = a.href || "";
+    if (!href.includes("/Recruit/GI_Read/") || seen.has(href)) continue;
+    seen.add(href);
+
+    let scope = a;
+    for (let i = 0; i < 8; i++) {
+      let p = scope.parentElement;
+      while (p && !["LI", "ARTICLE", "DIV"].includes(p.tagName)) p = p.parentElement;
+      if (!p) break;
+      scope = p;
+      if (txt(scope).length > 40) break;
+    }
+
+    const locs = [];
+    for (const s of LOC_SELS) {
+      let t = "";
+      try { t = txt(scope.querySelector(s)); } catch (e) {}
+      locs.push(t);
+    }
+
+    cards.push({
+      href: href,
+      scope_text: txt(scope),
+      anchor_text: txt(a),
+      aria_label: (a.getAttribute("aria-label") || "").trim(),
+      anchor_parts: Array.from(a.querySelectorAll("span,em,strong")).map(txt).filter(Boolean),
+      company: companyOf(scope) || companyOf(a),
+      locations: locs,
+      careers: texts(scope, CAREER_SELS),
+      badges: texts(scope, BADGE_SELS),
+    });
+  }
+}
+return JSON.stringify(cards);
+"""
+
+ANCHOR_SELECTORS = [
+    "a[href*='/Recruit/GI_Read/']",
+    "div a[href*='GI_Read']",
+    "li a[href*='GI_Read']",
+    "article a[href*='GI_Read']",
+]
+COMPANY_XPATHS = [
+    ".//a[contains(@href,'/Company/')][normalize-space()][1]",
+    ".//*[@role='label'][normalize-space()][1]",
+    ".//*[contains(@class,'company')][normalize-space()][1]",
+    ".//*[contains(@class,'coName')]//a[normalize-space()][1]",
+    ".//*[contains(@class,'corpName')][normalize-space()][1]",
+]
+LOCATION_SELECTORS = [
+    "[class*='workplace']", "[class*='loc']", "[class*='area']",
+    "[class*='region']", "[class*='지역']",
+]
+CAREER_SELECTORS = [
+    "[class*='career']", "[class*='exp']", "[class*='경력']",
+    "span", "em", "strong",
+]
+BADGE_SELECTORS = [
+    "[class*='dday']", "[class*='Dday']", "[class*='deadline']",
+    "[class*='badge']", "[class*='chip']",
+    "button", "span", "em", "strong",
+]
+LOC_RX = re.compile(r"(서울|경기|인천|부산|대구|대전|광주|세종|울산|강원|충북|충남|전북|전남|경북|경남|제주)")
+
+
+def fetch_raw_cards(driver, want: int) -> List[dict]:
+    """결과 페이지 카드들의 원시 필드를 스크립트 1회로 가져온다 (WebDriver 왕복 1번)."""
+    raw = driver.execute_script(
+        CARD_SCRIPT, int(want), ANCHOR_SELECTORS, COMPANY_XPATHS,
+        LOCATION_SELECTORS, CAREER_SELECTORS, BADGE_SELECTORS,
+    )
+    return json.loads(raw or "[]")
+
+
+def job_from_raw(card: dict, newbie_filter: bool = False) -> Job:
+    """fetch_raw_cards 의 한 항목 → Job. 순수 파이썬(브라우저 호출 없음)."""
+    whole = card.get("scope_text") or ""
+
+    company = sanitize_company(card.get("company") or "") or "회사 미상"
+
+    title = ""
+    for cand in (card.get("anchor_text"), card.get("aria_label"), " ".join(card.get("anchor_parts") or [])):
+        cand = (cand or "").strip()
+        if len(cand) >= 2:
+            title = cand
+            break
+    if not title:
+        title = title_from_lines(whole, company_hint=company)
+
+    location = next((t for t in card.get("locations") or [] if t), "")
+    if not location:
+        location = next((ln.strip() for ln in whole.splitlines() if ln.strip() and LOC_RX.search(ln)), "")
+
+    career = career_from_texts(card.get("careers") or [], whole)
+    if not career and newbie_filter:
+        career = "신입(필터)"
+
+    deadline = deadline_from_texts((card.get("badges") or []) + ([whole] if whole else []))
+    deadline_norm, dday = normalize_deadline(deadline)
+
+    return Job(
+        title=title or "제목 없음",
+        company=company,
+        url=card.get("href") or "",
+        location=location,
+        deadline=deadline,
+        deadline_norm=deadline_norm,
+        dday=dday,
+        career=career,
+    )
+
+
+def collect_from_list_bulk(driver, want: int) -> List[Job]:
+    """collect_from_list 의 일괄 버전: 페이지당 스크립트 1회 + 파이썬 파싱."""
+    cards = fetch_raw_cards(driver, want)
+    newbie_filter = "careerType=1" in (driver.current_url or "")
+    jobs: List[Job] = []
+    for card in cards[:want]:
+        try:
+            jobs.append(job_from_raw(card, newbie_filter=newbie_filter))
         except Exception:
             continue
+    return jobs
+
+
+# ------------------ HTTP 우선 수집(서버 렌더링 결과) ------------------
+# find_company_text 의 XPath 들을 CSS 로 옮긴 것 (BeautifulSoup 용)
+COMPANY_CSS = [
+    "a[href*='/Company/']",
+    "[role='label']",
+    "[class*='company']",
+    "[class*='coName'] a",
+    "[class*='corpName']",
+]
+
+def _soup_text(el) -> str:
+    return el.get_text("\n", strip=True) if el is not None else ""
+
+def _soup_company(base) -> str:
+    node = base
+    for _ in range(10):
+        if node is None or not hasattr(node, "select"):
+            break
+        for sel in COMPANY_CSS:
+            for el in node.select(sel):
+                t = _soup_text(el)
+                if t:
+                    return t
+        for img in node.select("img[alt]"):
+            alt = (img.get("alt") or "").strip()
+            if alt:
+                return alt
+        node = node.parent
+    return ""
 
+def raw_cards_from_soup(soup, base_url: str, want: int) -> List[dict]:
+    """CARD_SCRIPT 와 같은 형태의 원시 카드 목록을 정적 HTML 에서 만든다."""
+    cards: List[dict] = []
+    seen = set()
+    for sel in ANCHOR_SELECTORS:
+        for a in soup.select(sel):
+            if len(cards) >= want:
+                return cards
+            href = urljoin(base_url, a.get("href") or "")
+            if "/Recruit/GI_Read/" not in href or href in seen:
+                continue
+            seen.add(href)
+
+            scope = a
+            for _ in range(8):
+                parent = scope.find_parent(["li", "article", "div"])
+                if parent is None:
+                    break
+                scope = parent
+                if len(_soup_text(scope)) > 40:
+                    break
+
+            cards.append({
+                "href": href,
+                "scope_text": _soup_text(scope),
+                "anchor_text": _soup_text(a),
+                "aria_label": (a.get("aria-label") or "").strip(),
+                "anchor_parts": [t for t in (_soup_text(el) for el in a.select("span, em, strong")) if t],
+                "company": _soup_company(scope) or _soup_company(a),
+                "locations": [_soup_text(scope.select_one(ls)) for ls in LOCATION_SELECTORS],
+                "careers": [t for cs in CAREER_SELECTORS for t in (_soup_text(el) for el in scope.select(cs)) if t],
+                "badges": [t for bs in BADGE_SELECTORS for t in (_soup_text(el) for el in scope.select(bs)) if t],
+            })
+    return cards
+
+def collect_from_http(keyword: str, page: int, want: int, *, latest: bool = True, newbie: bool = True,
+                      deadline: Optional[Deadline] = None) -> Optional[List[Job]]:
+    """
+    검색 결과 한 페이지를 HTTP 로 수집. 결과 앵커가 충분하지 않으면(JS 필요) None.
+    결과 앵커가 1~2개뿐인 마지막 페이지나 '결과 없음' 페이지는 그대로 파싱해 0~2개를 돌려준다
+    (빈 목록이면 _pipelined_pages 가 브라우저 없이 멈춘다).
+    """
+    url = search_url(keyword, page=page, latest=latest, newbie=newbie)
+    soup, final_url = fetch_soup(url, expect="a[href*='/Recruit/GI_Read/']", min_count=3,
+                                 timeout=ensure(deadline).cap(HTTP_TIMEOUT), rendered=HTTP_RENDERED_SELECTOR)
+    if soup is None:
+        return None
+    jobs: List[Job] = []
+    for card in raw_cards_from_soup(soup, final_url, want):
+        try:
+            jobs.append(job_from_raw(card, newbie_filter=newbie))
+        except Exception:
+            continue
     return jobs
 
 
 # ------------------ 공통 코어 & 모드별 함수 ------------------
+def load_results_page(driver, keyword: str, page: int, *, latest: bool = True, newbie: bool = True,
+                      deadline: Optional[Deadline] = None) -> bool:
+    """
+    검색 결과 페이지로 이동해 결과 앵커가 뜰 때까지 대기 (실패 시 1회 새로고침).
+    모든 대기는 deadline 의 남은 시간으로 줄이고, 시간이 없으면 새로고침하지 않는다.
+    """
+    deadline = ensure(deadline)
+    driver.set_page_load_timeout(deadline.cap(PAGE_LOAD_TIMEOUT))
+    goto_search_with_params(driver, keyword, page=page, latest=latest, newbie=newbie)
+    close_popups(driver)
+
+    try:
+        WebDriverWait(driver, deadline.cap(12)).until(EC.presence_of_element_located(
+            (By.CSS_SELECTOR, "form#AKCFrm input#stext, form#AKCFrm input[name='stext']")
+        ))
+    except Exception:
+        pass
+
+    if not wait_results(driver, min_links=3, timeout=deadline.cap(8)):
+        if deadline.expired():
+            return False
+        throttle("jobkorea")
+        note_navigation(driver)
+        driver.refresh()
+        close_popups(driver)
+        if not wait_results(driver, min_links=3, timeout=deadline.cap(8)):
+            return False
+    report_blocked(driver, "jobkorea")
+    return True
+
+
+def _collect_page_pooled(pool, keyword: str, page: int, want: int, *, latest: bool, newbie: bool,
+                         deadline: Optional[Deadline] = None) -> Optional[List[Job]]:
+    """
+    풀에서 드라이버를 빌려 결과 페이지 하나를 수집. 결과 앵커가 끝내 안 뜨면(결과 없음) None.
+    그 밖의 오류는 드라이버를 폐기하고 호출자에게 그대로 올린다 (결과 끝으로 오인하지 않게).
+    """
+    deadline = ensure(deadline)
+    driver = pool.acquire(timeout=deadline.cap(POOL_ACQUIRE_TIMEOUT))
+    try:
+        apply_load_profile(driver, "jobkorea")
+        if not load_results_page(driver, keyword, page, latest=latest, newbie=newbie, deadline=deadline):
+            return None
+        return collect_from_list(driver, want)
+    except Exception:
+        pool.release(driver, discard=True)
+        driver = None
+        raise
+    finally:
+        if driver is not None:
+            pool.release(driver)
+
+
+def _pipelined_pages(fetch_page, want: int, start_page: int = 1, depth: int = 2, stop_after=None,
+                     deadline: Optional[Deadline] = None) -> Tuple[List[Job], int, bool]:
+    """
+    fetch_page(page) 를 최대 depth 페이지까지 미리 띄워 두고(page N 추출 중 N+1 로딩),
+    결과는 페이지 순서대로 소비한다. want 를 채우거나 stop_after(이번 페이지 Job) 가 True 면 남은 작업은 취소.
+    미리 띄우기는 want 가 한 페이지(PAGE_SIZE)보다 크거나 앞 페이지가 꽉 찼을 때만 한다
+    (한 페이지로 끝나는 검색에 HTTP 요청/드라이버를 하나 더 쓰지 않게).
+    deadline 이 지나면 로딩 중인 페이지를 기다리지 않고 그때까지 모은 결과로 멈춘다.
+    fetch_page 가 예외를 내면 로그를 남기고, 이미 모은 결과가 있으면 거기서 멈추고 없으면 예외를 올린다.
+    AdmissionRejected 는 모은 결과를 partial 에 담아 항상 올린다 (호출자가 미완결로 표시).
+
+    Returns:
+        (수집한 Job, 멈춘 페이지 번호, fetch_page 가 None 을 돌려줘 멈췄는지)
+    """
+    deadline = ensure(deadline)
+    out: List[Job] = []
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=max(1, depth))
+    inflight: deque = deque()
+    next_page = start_page
+    page = start_page
+    prefetch = want > PAGE_SIZE
+    try:
+        while True:
+            if deadline.expired():
+                return out, page, False
+            while len(inflight) < (max(1, depth) if prefetch else 1):
+                inflight.append(executor.submit(fetch_page, next_page))
+                next_page += 1
+            try:
+                jobs = inflight.popleft().result(timeout=deadline.timeout())
+            except concurrent.futures.TimeoutError:
+                return out, page, False
+            except Exception as e:
+                print(f"[JK] {page} 페이지 수집 실패 ({len(out)}개 수집 후): {e!r}")
+                if isinstance(e, AdmissionRejected):
+                    e.partial = out
+                    raise
+                if not out:
+                    raise
+                return out, page, False
+            if jobs is None:
+                return out, page, True
+            if not jobs:
+                return out, page, False
+            prefetch = prefetch or len(jobs) >= PAGE_SIZE
+            out.extend(jobs[:want - len(out)])
+            page += 1
+            if len(out) >= want or (stop_after and stop_after(jobs)):
+                return out, page, False
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
 def _crawl_core(
     keyword: str,
     want: int = 20,
@@ -531,53 +873,116 @@ def _crawl_core(
     *,
     latest: bool = True,
     newbie: bool = True,
+    depth: Optional[int] = None,
+    stop_after=None,
+    deadline: Optional[Deadline] = None,
 ) -> Tuple[List[Job], Optional[wb.Chrome]]:
-    driver = build_driver(gui=gui)
-    wait = WebDriverWait(driver, 12)
+    """
+    stop_after(페이지의 Job 목록) 가 True 를 돌려주면 want 를 못 채워도 그 페이지에서 멈춘다.
+    deadline 이 지나면 어느 경로든 그때까지 모은 결과를 반환한다.
+    브라우저 자리를 못 받으면(AdmissionRejected) 그때까지 모은 결과를 partial 에 담아 올린다.
+    순차 수집 중 다른 오류는 모은 결과가 있으면 거기서 멈추고 반환한다.
+    """
+    deadline = ensure(deadline)
+    depth = PIPELINE_DEPTH if depth is None else depth
     out: List[Job] = []
+    if want <= 0:
+        return out, None
     page = 1
 
-    while len(out) < want:
-        goto_search_with_params(driver, keyword, page=page, latest=latest, newbie=newbie)
-        close_popups(driver)
-
+    # 1) 서버 렌더링 결과는 HTTP 로 먼저 (다음 페이지를 미리 받아두는 파이프라인)
+    #    gui/keep_open 은 브라우저 자체가 목적이므로 처음부터 Selenium
+    if HTTP_FIRST and not gui and not keep_open:
+        fetch = lambda p: collect_from_http(keyword, p, want, latest=latest, newbie=newbie, deadline=deadline)
+        out, page, need_js = _pipelined_pages(fetch, want, start_page=1, depth=depth, stop_after=stop_after, deadline=deadline)
+        if not need_js or deadline.expired():
+            return out, None
+        # JS 가 필요하다고 판단된 페이지부터 Selenium 으로 이어서 수집
+
+    # 2) 헤드리스 + 반환 불필요: 풀 드라이버 여러 개로 페이지 파이프라인
+    if not gui and not keep_open and depth > 1:
+        pool = driver_pool()
+        fetch = lambda p: _collect_page_pooled(pool, keyword, p, want, latest=latest, newbie=newbie, deadline=deadline)
         try:
-            wait.until(EC.presence_of_element_located(
-                (By.CSS_SELECTOR, "form#AKCFrm input#stext, form#AKCFrm input[name='stext']")
-            ))
-        except Exception:
-            pass
+            more, _, _ = _pipelined_pages(fetch, want - len(out), start_page=page, depth=depth, stop_after=stop_after,
+                                          deadline=deadline)
+        except AdmissionRejected as e:
+            e.partial = out + e.partial
+            raise
+        out.extend(more)
+        return out, None
 
-        if not wait_results(driver, min_links=3, timeout=8):
-            driver.refresh()
-            close_popups(driver)
-            if not wait_results(driver, min_links=3, timeout=8):
+    # 3) 드라이버 하나로 순차 수집
+    # 헤드리스 기본 경로는 프로세스 전역 드라이버 풀에서 빌려 쓰고 반납한다.
+    # gui=True 는 풀과 다른 옵션이라 직접 생성, keep_open=True 는 호출자에게 소유권을 넘긴다.
+    pool = None if gui else driver_pool()
+    try:
+        driver = pool.acquire(timeout=deadline.cap(POOL_ACQUIRE_TIMEOUT)) if pool else build_driver(gui=gui)
+    except AdmissionRejected as e:
+        e.partial = out
+        raise
+    try:
+        apply_load_profile(driver, "jobkorea")
+        while len(out) < want and not deadline.expired():
+            if not load_results_page(driver, keyword, page, latest=latest, newbie=newbie, deadline=deadline):
                 break
 
-        out.extend(collect_from_list(driver, want - len(out)))
+            jobs = collect_from_list(driver, want - len(out))
+            out.extend(jobs)
 
-        if len(out) >= want:
-            break
-        page += 1
+            if len(out) >= want or (stop_after and stop_after(jobs)):
+                break
+            page += 1
+    except BaseException as e:
+        if pool:
+            pool.release(driver, discard=True)
+        else:
+            quit_driver(driver)
+        if not out or not isinstance(e, Exception):
+            raise
+        print(f"[JK] {page} 페이지 수집 실패 ({len(out)}개 수집 후): {e!r}")
+        return out, None
 
     if keep_open:
+        if pool:
+            pool.detach(driver)
         return out, driver
+    if pool:
+        pool.release(driver)
     else:
-        driver.quit()
-        return out, None
+        quit_driver(driver)
+    return out, None
 
 
-def crawl_latest_newbie(keyword: str, want: int = 20, gui: bool = False, keep_open: bool = False) -> List[Job]:
+def crawl_latest_newbie(keyword: str, want: int = 20, gui: bool = False, keep_open: bool = False,
+                        deadline: Optional[Deadline] = None) -> List[Job]:
     """신입 필터 ON + 최신업데이트순"""
-    items, drv = _crawl_core(keyword, want, gui, keep_open, latest=True, newbie=True)
-    if drv: drv.quit()
+    items, drv = _crawl_core(keyword, want, gui, keep_open, latest=True, newbie=True, deadline=deadline)
+    if drv: quit_driver(drv)
     return items
 
 
-def crawl_latest_all(keyword: str, want: int = 20, gui: bool = False, keep_open: bool = False) -> List[Job]:
+def crawl_latest_all(keyword: str, want: int = 20, gui: bool = False, keep_open: bool = False,
+                     deadline: Optional[Deadline] = None) -> List[Job]:
     """신입 필터 OFF + 최신업데이트순"""
-    items, drv = _crawl_core(keyword, want, gui, keep_open, latest=True, newbie=False)
-    if drv: drv.quit()
+    items, drv = _crawl_core(keyword, want, gui, keep_open, latest=True, newbie=False, deadline=deadline)
+    if drv: quit_driver(drv)
+    return items
+
+
+def crawl_incremental(keyword: str, want: int = 20, newbie: bool = True,
+                      deadline: Optional[Deadline] = None) -> List[Job]:
+    """
+    최신업데이트순 목록을 앞에서부터 보다가, 이전에 같은 검색으로 저장해 둔 공고가
+    한 페이지의 INCREMENTAL_KNOWN_RATIO 이상이면 더 넘기지 않는다 (그 뒤는 이미 본 공고).
+    반환: 이번에 목록에서 본 공고 (새 공고 + 다시 본 공고)
+    """
+    def mostly_known(jobs: List[Job]) -> bool:
+        known = posting_store.known(keyword, newbie, [j.url for j in jobs])
+        return bool(jobs) and len(known) >= INCREMENTAL_KNOWN_RATIO * len(jobs)
+
+    items, drv = _crawl_core(keyword, want, latest=True, newbie=newbie, stop_after=mostly_known, deadline=deadline)
+    if drv: quit_driver(drv)
     return items
 
 
@@ -601,6 +1006,8 @@ def search_jobs(
     newbie_only: bool = False,
     dday_within: Optional[int] = None,
     as_dict: bool = True,
+    incremental: bool = False,
+    deadline: Optional[Deadline] = None,
 ) -> List[dict] | List[Job]:
     """
     서버(웹폼)에서 바로 호출하기 위한 통합 함수.
@@ -611,14 +1018,44 @@ def search_jobs(
         newbie_only: True면 '신입/경력무관 공고만 보기' 체크와 유사 (careerType=1)
         dday_within: D-이내 필터 (예: 7 -> D-7 이내 공고만)
         as_dict: True면 list[dict]로 반환 (JSON 직렬화 편의)
+        incremental: True면 이미 저장된 공고가 대부분인 페이지에서 수집을 멈추고,
+                     모자란 개수는 저장소의 같은 검색 공고(최근 본 순)로 채운다
+        deadline: 요청 시간 예산. 지나면 그때까지 수집한 공고만 반환 (incremental 이면 저장소로 채움)
 
     Returns:
         list[Job] 또는 list[dict]
+        브라우저 자리를 못 받아 멈추면 AdmissionRejected 를 올리고, 그때까지 모은 공고는
+        같은 후처리(저장, 필터, 변환)를 거쳐 그 partial 에 담긴다.
     """
-    if newbie_only:
-        items = crawl_latest_newbie(keyword=keyword, want=limit, gui=False, keep_open=False)
-    else:
-        items = crawl_latest_all(keyword=keyword, want=limit, gui=False, keep_open=False)
+    try:
+        if incremental:
+            items = crawl_incremental(keyword, want=limit, newbie=newbie_only, deadline=deadline)
+        elif newbie_only:
+            items = crawl_latest_newbie(keyword=keyword, want=limit, gui=False, keep_open=False, deadline=deadline)
+        else:
+            items = crawl_latest_all(keyword=keyword, want=limit, gui=False, keep_open=False, deadline=deadline)
+    except AdmissionRejected as e:
+        if e.partial:
+            e.partial = _finish_search(e.partial, keyword, limit, newbie_only, dday_within, as_dict, incremental)
+        raise
+    return _finish_search(items, keyword, limit, newbie_only, dday_within, as_dict, incremental)
+
+
+def _finish_search(items: List[Job], keyword: str, limit: int, newbie_only: bool,
+                   dday_within: Optional[int], as_dict: bool, incremental: bool) -> List[dict] | List[Job]:
+    """search_jobs 후처리: 저장소 upsert, incremental 이면 저장소로 채우기, D-day 필터, dict 변환."""
+    # 영구 저장소에 upsert (실패해도 검색 결과는 그대로 반환)
+    try:
+        posting_store.upsert(items, keyword, newbie=newbie_only)
+    except Exception as e:
+        print(f"[STORE] 공고 저장 실패: {e}")
+
+    if incremental and len(items) < limit:
+        seen = {posting_store.posting_key(it.url) for it in items}
+        cached = [j for j in stored_jobs(keyword, limit=limit, newbie_only=newbie_only, as_dict=False)
+                  if posting_store.posting_key(j.url) not in seen and (j.dday is None or j.dday >= 0)]
+        print(f"[INCR] '{keyword}': 목록에서 {len(items)}개, 저장소에서 {min(len(cached), limit - len(items))}개")
+        items += cached[:limit - len(items)]
 
     items = _filter_by_dday(items, dday_within)
     if as_dict:
@@ -626,6 +1063,26 @@ def search_jobs(
     return items
 
 
+def stored_jobs(
+    keyword: str,
+    *,
+    limit: int = 20,
+    newbie_only: bool = False,
+    dday_within: Optional[int] = None,
+    seen_within_sec: Optional[float] = None,
+    as_dict: bool = True,
+) -> List[dict] | List[Job]:
+    """
+    브라우저 없이 저장소에서 조회 (search_jobs 로 수집해 둔 공고, 최근 본 순).
+    seen_within_sec: 이 시간(초) 안에 검색 결과에서 본 공고만
+    """
+    rows = posting_store.find(keyword, newbie=newbie_only, dday_within=dday_within,
+                              seen_within_sec=seen_within_sec, limit=limit)
+    if as_dict:
+        return rows
+    return [Job(**{f: r[f] for f in posting_store.FIELDS}) for r in rows]
+
+
 # ------------------ 유틸: D-day 포맷 (옵션) ------------------
 def dday_with_abs_date(dday: Optional[int], norm: str) -> str:
     """D-n (YYYY-MM-DD) 형태로 표기. norm 없으면 dday로 계산."""
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""
+공고 텍스트 정규화 (마감일, 회사명). 브라우저 없이 쓰는 순수 함수만 둔다.
+
+jk_crawler(셀레니움)와 dedup(셀레니움 없이 import 돼야 함)이 함께 쓴다.
+"""
+import re
+import time
+import calendar
+from typing import Optional, Tuple
+
+
+def normalize_deadline(deadline_text: str) -> Tuple[str, Optional[int]]:
+    """
+    입력(날짜/D-day/문구) → (YYYY-MM-DD 또는 '', dday 또는 None)
+    """
+    if not deadline_text:
+        return "", None
+
+    raw = deadline_text.strip()
+    # 괄호(요일) 제거 & 공백 제거
+    s = re.sub(r"\([^)]*\)", "", raw).replace(" ", "")
+
+    # 이미 D-숫자
+    m = re.search(r"D\s*[-+]\s*(\d+)", s, re.I)
+    if m:
+        return "", int(m.group(1))
+
+    # 오늘/내일
+    if "오늘" in s:
+        return "", 0
+    if "내일" in s:
+        return "", 1
+
+    # 상시/채용시까지
+    if ("상시채용" in s) or ("채용시까지" in s):
+        return "", None
+
+    # 날짜 파싱
+    s2 = s.replace("/", ".")
+    now = time.localtime()
+    today_ts = time.mktime(time.strptime(time.strftime("%Y-%m-%d"), "%Y-%m-%d"))
+
+    y = None; mm = None; dd = None
+    explicit_year = False
+
+    # YYYY.MM.DD
+    m = re.search(r"(\d{4})\.(\d{1,2})\.(\d{1,2})", s2)
+    if m:
+        y, mm, dd = int(m.group(1)), int(m.group(2)), int(m.group(3))
+        explicit_year = True
+    else:
+        # YY.MM.DD
+        m = re.search(r"(^|[^0-9])(\d{2})\.(\d{1,2})\.(\d{1,2})", s2)
+        if m:
+            y, mm, dd = 2000 + int(m.group(2)), int(m.group(3)), int(m.group(4))
+            explicit_year = True
+        else:
+            # MM.DD
+            m = re.search(r"(\d{1,2})\.(\d{1,2})", s2)
+            if m:
+                mm, dd = int(m.group(1)), int(m.group(2))
+                y = now.tm_year
+                explicit_year = False
+            else:
+                # '8월 30일'
+                m = re.search(r"(\d{1,2})월\s*(\d{1,2})일", raw)
+                if m:
+                    mm, dd = int(m.group(1)), int(m.group(2))
+                    y = now.tm_year
+                    explicit_year = False
+
+    if y is None or mm is None or dd is None:
+        return "", None
+
+    # 범위 보정
+    mm = max(1, min(12, mm))
+    dd = max(1, min(calendar.monthrange(y, mm)[1], dd))
+
+    norm = f"{y:04d}-{mm:02d}-{dd:02d}"
+    try:
+        cand_ts = time.mktime(time.strptime(norm, "%Y-%m-%d"))
+        # 연도 없는 표기인데 이미 지났다면 내년으로 넘김
+        if (not explicit_year) and cand_ts < today_ts:
+            y += 1
+            norm = f"{y:04d}-{mm:02d}-{dd:02d}"
+            cand_ts = time.mktime(time.strptime(norm, "%Y-%m-%d"))
+        dday = int((cand_ts - today_ts) / 86400)
+    except Exception:
+        dday = None
+
+    return norm, dday
+
+
+def sanitize_company(name: str) -> str:
+    """회사명 끝의 '로고/기업로고/logo' 꼬리 제거."""
+    if not name: return name
+    name = re.sub(r"\s*(기업\s*)?로고$", "", name, flags=re.I)
+    name = re.sub(r"\s*logo$", "", name, flags=re.I)
+    return name.strip(" -∙·•—|")
@@ -3,6 +3,7 @@ import json
 import requests
 import os
 from textwrap import shorten
+from rate_limit import throttle
 
 KAKAO_TOKEN_PATH = os.getenv("KAKAO_TOKEN_PATH", "/home/ubuntu/aws_test1/kakaotalk.json")
 KAKAO_MEMO_URL = "https://kapi.kakao.com/v2/api/talk/memo/default/send"
@@ -29,6 +30,7 @@ def _save_tokens(tokens: dict):
 
 def _check_token(access_token: str) -> bool:
     try:
+        throttle(KAKAO_TOKEN_INFO_URL)
         res = requests.get(
             KAKAO_TOKEN_INFO_URL,
             headers={"Authorization": "Bearer " + access_token},
@@ -51,6 +53,7 @@ def _refresh_access_token(tokens: dict) -> dict:
     if KAKAO_CLIENT_SECRET:
         data["client_secret"] = KAKAO_CLIENT_SECRET
 
+    throttle(KAKAO_TOKEN_URL)
     res = requests.post(KAKAO_TOKEN_URL, data=data, timeout=5)
     res.raise_for_status()
     new_tokens = res.json()
@@ -100,11 +103,13 @@ def send_to_me_text(text: str, web_url: str = None) -> dict:
     data = {"template_object": json.dumps(template, ensure_ascii=False)}
 
     try:
+        throttle(KAKAO_MEMO_URL)
         res = requests.post(KAKAO_MEMO_URL, headers=headers, data=data, timeout=8)
         if res.status_code == 401:
             try:
                 tokens = _refresh_access_token(_load_tokens())
                 headers["Authorization"] = "Bearer " + tokens["access_token"]
+                throttle(KAKAO_MEMO_URL)
                 res = requests.post(KAKAO_MEMO_URL, headers=headers, data=data, timeout=8)
             except Exception as inner:
                 return {"error": "unauthorized", "detail": str(inner), "body": res.text}
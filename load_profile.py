@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""
+가벼운 페이지 로드 프로필 (리소스 차단).
+
+크롤러는 텍스트와 href 만 읽으므로 이미지/폰트/미디어/광고·분석 스크립트는 받을 필요가 없다.
+DevTools(CDP) Network.setBlockedURLs 로 URL 패턴을 차단하고,
+결과 목록 렌더링에 필요한 리소스는 사이트별 허용 목록(SITE_ALLOW)으로 차단에서 뺀다.
+
+- lean_options(options)            : 드라이버 생성 시 옵션에 성능 로그(차단 카운트용) 활성화
+- apply_load_profile(driver, site) : 해당 사이트로 이동하기 직전에 호출
+- report_blocked(driver, site)     : 페이지 로드 후 호출 → 이번 페이지에서 차단된 요청 수
+"""
+import os
+import json
+import threading
+from typing import Dict, List
+
+LEAN_LOAD = os.getenv("LEAN_LOAD", "1") not in ("0", "false", "False")
+
+# 리소스 종류(확장자) 패턴: 쿼리스트링이 붙어도 걸리도록 끝에 * 를 둔다.
+BLOCK_IMAGES = ["*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.svg*", "*.ico*", "*.avif*"]
+BLOCK_FONTS = ["*.woff*", "*.woff2*", "*.ttf*", "*.otf*", "*.eot*"]
+BLOCK_MEDIA = ["*.mp4*", "*.webm*", "*.mp3*", "*.m3u8*"]
+BLOCK_CSS = ["*.css*"]
+# 광고/분석/트래킹 호스트
+BLOCK_TRACKERS = [
+    "*google-analytics.com*", "*googletagmanager.com*", "*googlesyndication.com*",
+    "*doubleclick.net*", "*adservice.google.*", "*facebook.net*", "*connect.facebook.*",
+    "*criteo.*", "*hotjar.*", "*clarity.ms*", "*amplitude.com*", "*braze.com*",
+    "*mixpanel.com*", "*branch.io*", "*t1.daumcdn.net/kas*", "*wcs.naver.net*",
+    "*analytics.tiktok.com*", "*ads-twitter.com*", "*channel.io*",
+]
+DEFAULT_BLOCK = BLOCK_IMAGES + BLOCK_FONTS + BLOCK_MEDIA + BLOCK_CSS + BLOCK_TRACKERS
+
+# 사이트별 허용(차단 제외) 패턴.
+# 무한 스크롤 목록은 레이아웃(스크롤 높이)이 있어야 다음 카드가 로드되므로 CSS 를 살려둔다.
+SITE_ALLOW: Dict[str, List[str]] = {
+    "jobplanet": BLOCK_CSS,
+    "jobkorea": BLOCK_CSS,
+    "incruit": [],
+    "inflearn": [],
+}
+
+# 사이트별 누적 통계 {"site": {"pages": n, "blocked": n}}
+BLOCK_STATS: Dict[str, Dict[str, int]] = {}
+_stats_lock = threading.Lock()
+
+
+def lean_options(options):
+    """ChromeOptions 에 성능 로그를 켠다 (차단된 요청 카운트용)."""
+    if LEAN_LOAD:
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    return options
+
+
+def blocked_patterns(site: str) -> List[str]:
+    allow = set(SITE_ALLOW.get(site, []))
+    return [p for p in DEFAULT_BLOCK if p not in allow]
+
+
+def apply_load_profile(driver, site: str) -> List[str]:
+    """site 에 맞는 차단 목록을 드라이버에 적용. 실패해도 크롤링은 계속한다."""
+    if not LEAN_LOAD:
+        return []
+    patterns = blocked_patterns(site)
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+    except Exception as e:
+        print(f"[LEAN] {site}: 리소스 차단 적용 실패 ({e})")
+        return []
+    _drain_log(driver)  # 이전 페이지 로그는 버린다
+    return patterns
+
+
+def report_blocked(driver, site: str) -> int:
+    """직전 apply_load_profile/report_blocked 이후 차단된 요청 수를 세고 누적 통계에 반영."""
+    if not LEAN_LOAD:
+        return 0
+    n = 0
+    for entry in _drain_log(driver):
+        try:
+            msg = json.loads(entry.get("message", "{}")).get("message", {})
+        except (ValueError, AttributeError):
+            continue
+        if msg.get("method") == "Network.loadingFailed" and msg.get("params", {}).get("blockedReason"):
+            n += 1
+    with _stats_lock:
+        st = BLOCK_STATS.setdefault(site, {"pages": 0, "blocked": 0})
+        st["pages"] += 1
+        st["blocked"] += n
+    print(f"[LEAN] {site}: 이번 페이지에서 차단된 요청 {n}건")
+    return n
+
+
+def _drain_log(driver) -> list:
+    try:
+        return driver.get_log("performance")
+    except Exception:
+        return []
@@ -11,6 +11,7 @@ from selenium.webdriver.support import expected_conditions as EC
 import time
 from datetime import datetime, timedelta
 import re
+from rate_limit import throttle
 
 def parse_date(date_str):
     """
@@ -78,6 +79,7 @@ def scrape_nate_news(keyword=None, page=1):
         print("네이트 IT/과학 최신 뉴스를 가져옵니다.")
 
     headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'}
+    throttle(url)
     response = requests.get(url, headers=headers)
     response.encoding = 'euc-kr'
     if response.status_code != 200:
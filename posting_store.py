@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+"""
+잡코리아 공고 영구 저장소 (SQLite, WAL).
+
+search_jobs() 가 수집한 공고를 GI_Read URL 기준으로 upsert 해 두고,
+이후 조회/필터/발송은 브라우저 없이 디스크에서 바로 처리한다.
+
+테이블
+  postings         : url(PK) + Job 필드 + first_seen / last_seen (epoch)
+  posting_keywords : (keyword, newbie, url) — 어떤 검색에서 본 공고인지, 검색별 first/last_seen
+
+D-day 는 수집 시점 기준 값이라 시간이 지나면 틀려진다. 조회 시에는 deadline_norm 으로 다시 계산하고,
+'D-3' 처럼 날짜 없이 D-day 만 있던 공고는 저장할 때 deadline_norm 을 (수집일 + D-day)로 채운다.
+"""
+import os
+import re
+import time
+import sqlite3
+import threading
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional
+
+POSTING_DB = os.getenv("POSTING_DB", "postings.db")
+UPSERT_BATCH = int(os.getenv("POSTING_UPSERT_BATCH", "200"))
+
+FIELDS = ("title", "company", "url", "location", "career", "deadline", "deadline_norm", "dday")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS postings (
+    url           TEXT PRIMARY KEY,
+    title         TEXT NOT NULL,
+    company       TEXT NOT NULL,
+    location      TEXT NOT NULL DEFAULT '',
+    career        TEXT NOT NULL DEFAULT '',
+    deadline      TEXT NOT NULL DEFAULT '',
+    deadline_norm TEXT NOT NULL DEFAULT '',
+    dday          INTEGER,
+    first_seen    REAL NOT NULL,
+    last_seen     REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_postings_deadline_norm ON postings(deadline_norm);
+CREATE INDEX IF NOT EXISTS idx_postings_dday ON postings(dday);
+CREATE INDEX IF NOT EXISTS idx_postings_last_seen ON postings(last_seen);
+
+CREATE TABLE IF NOT EXISTS posting_keywords (
+    keyword    TEXT NOT NULL,
+    newbie     INTEGER NOT NULL,
+    url        TEXT NOT NULL REFERENCES postings(url),
+    first_seen REAL NOT NULL,
+    last_seen  REAL NOT NULL,
+    PRIMARY KEY (keyword, newbie, url)
+);
+CREATE INDEX IF NOT EXISTS idx_posting_keywords_last_seen ON posting_keywords(keyword, newbie, last_seen);
+"""
+
+_local = threading.local()
+_init_lock = threading.Lock()
+_initialized = set()
+
+GI_READ_RX = re.compile(r"/Recruit/GI_Read/(\d+)", re.I)
+
+
+def posting_key(url: str) -> str:
+    """GI_Read URL 정규화: 추적용 쿼리스트링 등을 떼고 공고 번호만으로 식별."""
+    m = GI_READ_RX.search(url or "")
+    if m:
+        return f"https://www.jobkorea.co.kr/Recruit/GI_Read/{m.group(1)}"
+    return (url or "").split("#", 1)[0]
+
+
+def normalize_keyword(keyword: str) -> str:
+    return " ".join((keyword or "").split()).lower()
+
+
+def connect(path: str = None) -> sqlite3.Connection:
+    """스레드별 커넥션 (sqlite3 커넥션은 스레드 간 공유하지 않는다)."""
+    path = path or POSTING_DB
+    conns = getattr(_local, "conns", None)
+    if conns is None:
+        conns = _local.conns = {}
+    conn = conns.get(path)
+    if conn is None:
+        conn = sqlite3.connect(path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        with _init_lock:
+            if path not in _initialized:
+                conn.executescript(SCHEMA)
+                _initialized.add(path)
+        conns[path] = conn
+    return conn
+
+
+def _row(job, seen_day: date) -> Dict:
+    d = job.to_dict() if hasattr(job, "to_dict") else dict(job)
+    row = {f: d.get(f) for f in FIELDS}
+    row["url"] = posting_key(row["url"])
+    for f in ("location", "career", "deadline", "deadline_norm"):
+        row[f] = row[f] or ""
+    if not row["deadline_norm"] and row["dday"] is not None:
+        row["deadline_norm"] = (seen_day + timedelta(days=int(row["dday"]))).isoformat()
+    return row
+
+
+def upsert(jobs: Iterable, keyword: str, newbie: bool = False, path: str = None) -> int:
+    """공고들을 UPSERT_BATCH 개씩 한 트랜잭션으로 저장. 저장한 개수를 반환."""
+    conn = connect(path)
+    now = time.time()
+    today = date.today()
+    kw = normalize_keyword(keyword)
+    rows = [_row(j, today) for j in jobs]
+    rows = [r for r in rows if r["url"]]
+    for i in range(0, len(rows), UPSERT_BATCH):
+        batch = rows[i:i + UPSERT_BATCH]
+        with conn:
+            conn.executemany(
+                """
+                INSERT INTO postings (url, title, company, location, career, deadline, deadline_norm, dday, first_seen, last_seen)
+                VALUES (:url, :title, :company, :location, :career, :deadline, :deadline_norm, :dday, :now, :now)
+                ON CONFLICT(url) DO UPDATE SET
+                    title=excluded.title, company=excluded.company, location=excluded.location,
+                    career=excluded.career, deadline=excluded.deadline,
+                    deadline_norm=CASE WHEN excluded.deadline_norm != '' THEN excluded.deadline_norm ELSE deadline_norm END,
+                    dday=excluded.dday, last_seen=excluded.last_seen
+                """,
+                [{**r, "now": now} for r in batch],
+            )
+            conn.executemany(
+                """
+                INSERT INTO posting_keywords (keyword, newbie, url, first_seen, last_seen)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(keyword, newbie, url) DO UPDATE SET last_seen=excluded.last_seen
+                """,
+                [(kw, int(bool(newbie)), r["url"], now, now) for r in batch],
+            )
+    return len(rows)
+
+
+def known(keyword: str, newbie: bool, urls: Iterable[str], path: str = None) -> set:
+    """urls 중 이 검색(keyword, newbie)에서 이미 저장된 것 (정규화된 URL 집합)."""
+    keys = list({posting_key(u) for u in urls if u})
+    if not keys:
+        return set()
+    marks = ",".join("?" * len(keys))
+    rows = connect(path).execute(
+        f"SELECT url FROM posting_keywords WHERE keyword = ? AND newbie = ? AND url IN ({marks})",
+        [normalize_keyword(keyword), int(bool(newbie)), *keys],
+    )
+    return {r[0] for r in rows}
+
+
+def find(
+    keyword: Optional[str] = None,
+    *,
+    newbie: Optional[bool] = None,
+    dday_within: Optional[int] = None,
+    seen_within_sec: Optional[float] = None,
+    limit: Optional[int] = None,
+    path: str = None,
+) -> List[Dict]:
+    """
+    저장된 공고 조회 (최근 본 순). dday 는 오늘 기준으로 다시 계산해서 돌려준다.
+    dday_within 을 주면 오늘~오늘+N 마감 공고만 (마감일 미상 제외, 지난 공고 제외).
+    """
+    where, args = [], []
+    table = "postings p"
+    seen_col = "p.last_seen"
+    if keyword is not None:
+        table += " JOIN posting_keywords k ON k.url = p.url"
+        where.append("k.keyword = ?")
+        args.append(normalize_keyword(keyword))
+        if newbie is not None:
+            where.append("k.newbie = ?")
+            args.append(int(bool(newbie)))
+        seen_col = "k.last_seen"
+    if seen_within_sec is not None:
+        where.append(f"{seen_col} >= ?")
+        args.append(time.time() - seen_within_sec)
+    today = date.today()
+    if dday_within is not None:
+        where.append("p.deadline_norm BETWEEN ? AND ?")
+        args += [today.isoformat(), (today + timedelta(days=dday_within)).isoformat()]
+    sql = f"SELECT DISTINCT p.*, {seen_col} AS seen FROM {table}"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    sql += " ORDER BY seen DESC"
+    if limit:
+        sql += " LIMIT ?"
+        args.append(int(limit))
+
+    out = []
+    for r in connect(path).execute(sql, args):
+        d = {f: r[f] for f in FIELDS}
+        d["first_seen"], d["last_seen"] = r["first_seen"], r["last_seen"]
+        if r["deadline_norm"]:
+            d["dday"] = (date.fromisoformat(r["deadline_norm"]) - today).days
+        out.append(d)
+    return out
+
+
+def stats(path: str = None) -> Dict:
+    conn = connect(path)
+    return {
+        "postings": conn.execute("SELECT COUNT(*) FROM postings").fetchone()[0],
+        "keywords": conn.execute("SELECT COUNT(DISTINCT keyword) FROM posting_keywords").fetchone()[0],
+    }
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""
+호스트별 공유 토큰 버킷 속도 제한기.
+
+크롤러/외부 API 의 모든 요청 경로가 요청 직전에 throttle(url 또는 키)을 호출한다.
+스레드/동시 요청이 같은 버킷을 공유하므로 사이트별 요청 속도가 프로세스 전체에서 지켜진다.
+
+설정: 환경변수 RATE_LIMITS="jobkorea=2:4,jobplanet=1:3" (키=초당요청수:버스트)
+"""
+import os
+import time
+import threading
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+# 호스트(도메인 일부) → 버킷 키
+HOST_KEYS = [
+    ("jobkorea.co.kr", "jobkorea"),
+    ("jobplanet.co.kr", "jobplanet"),
+    ("incruit.com", "incruit"),
+    ("inflearn.com", "inflearn"),
+    ("nate.com", "nate"),
+    ("data.go.kr", "data.go.kr"),
+    ("kakao.com", "kakao"),
+]
+
+# 키 → (초당 요청 수, 버스트)
+DEFAULT_RATES: Dict[str, Tuple[float, int]] = {
+    "jobkorea": (2.0, 4),
+    "jobplanet": (2.0, 3),
+    "incruit": (2.0, 3),
+    "inflearn": (1.0, 2),
+    "nate": (2.0, 4),
+    "data.go.kr": (5.0, 5),
+    "kakao": (2.0, 2),
+}
+
+
+def _parse_rates(spec: str) -> Dict[str, Tuple[float, int]]:
+    rates: Dict[str, Tuple[float, int]] = {}
+    for item in (spec or "").split(","):
+        if "=" not in item:
+            continue
+        key, val = item.split("=", 1)
+        try:
+            rate, _, burst = val.partition(":")
+            rates[key.strip()] = (float(rate), int(burst or 1))
+        except ValueError:
+            continue
+    return rates
+
+
+RATES = {**DEFAULT_RATES, **_parse_rates(os.getenv("RATE_LIMITS", ""))}
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: int):
+        self.rate = max(rate, 1e-6)
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.stats = {"calls": 0, "waited": 0, "wait_total": 0.0, "wait_max": 0.0}
+
+    def acquire(self) -> float:
+        """토큰 1개 사용. 부족하면 예약(음수 잔량) 후 그만큼 대기. 대기한 초를 반환."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            self.stats["calls"] += 1
+            if wait > 0:
+                self.stats["waited"] += 1
+                self.stats["wait_total"] += wait
+                self.stats["wait_max"] = max(self.stats["wait_max"], wait)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+_buckets: Dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def host_key(url_or_key: str) -> Optional[str]:
+    """URL 또는 키를 버킷 키로. 모르는 호스트면 None (제한 없음)."""
+    if url_or_key in RATES:
+        return url_or_key
+    host = urlparse(url_or_key).netloc or url_or_key
+    for needle, key in HOST_KEYS:
+        if needle in host:
+            return key
+    return None
+
+
+def throttle(url_or_key: str) -> float:
+    """요청 직전에 호출. 해당 호스트의 속도 한도에 맞춰 필요하면 대기한다."""
+    key = host_key(url_or_key)
+    if key is None:
+        return 0.0
+    with _buckets_lock:
+        bucket = _buckets.get(key)
+        if bucket is None:
+            rate, burst = RATES[key]
+            bucket = _buckets[key] = TokenBucket(rate, burst)
+    return bucket.acquire()
+
+
+def rate_stats() -> Dict[str, dict]:
+    """키별 호출 수 / 대기 횟수 / 누적·최대 대기 시간(초)."""
+    with _buckets_lock:
+        items = list(_buckets.items())
+    out = {}
+    for key, b in items:
+        with b._lock:
+            st = dict(b.stats)
+        st["wait_avg"] = st["wait_total"] / st["calls"] if st["calls"] else 0.0
+        st["rate"], st["burst"] = b.rate, b.capacity
+        out[key] = st
+    return out
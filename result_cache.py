@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+"""
+크롤링 결과 공유 캐시.
+
+키는 (source, 정규화된 키워드) 뿐이다. 사용자/개수와 무관하게 한 항목을 공유하고,
+count 개를 요청했을 때 count 이상으로 저장된 항목이 있으면 앞에서부터 잘라서 돌려준다.
+(같은 키워드를 20개로 먼저 검색했다면, 이후 10개 요청은 크롤링 없이 처리)
+
+항목: {"count": 저장 시 요청 개수, "saved_at": epoch, "id": result set id, "results": {사이트: [공고...]}}
+파일: {source}_{정규화한 키워드의 해시}.cache, cache_codec 으로 직렬화 (기본은 압축 바이너리).
+      기호만 다른 키워드('node.js' / 'node_js')도 서로 다른 파일을 쓰고, 읽을 때 저장된 keyword 가
+      요청한 키워드와 다르면 버린다.
+      예전 이름({source}_{키워드}.cache / .json) 파일도 keyword 가 맞으면 읽고, 새 이름으로 저장되면 지운다.
+읽거나 저장한 항목은 result_store 에 색인되어 상세 페이지가 디스크 없이 조회한다.
+
+용량 관리: 백그라운드 sweeper 가 주기적으로
+  1) CACHE_TTL_SEC 보다 오래된 항목(과거 사용자별 캐시 파일 포함)을 지우고
+  2) 항목 수(CACHE_MAX_ENTRIES) / 총 용량(CACHE_MAX_MB)을 넘으면 가장 오래 안 쓰인 것부터(LRU) 지운다.
+"""
+import os
+import time
+import uuid
+import hashlib
+import threading
+from typing import Dict, List, Optional
+
+import cache_codec
+import result_store
+
+CACHE_DIR = os.getenv("CACHE_DIR", "cache")
+CACHE_TTL_SEC = float(os.getenv("CACHE_TTL_SEC", str(6 * 3600)))
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "500"))
+CACHE_MAX_BYTES = int(float(os.getenv("CACHE_MAX_MB", "200")) * 1024 * 1024)
+SWEEP_INTERVAL_SEC = float(os.getenv("CACHE_SWEEP_SEC", "300"))
+CACHE_EXT = ".cache"
+LEGACY_EXT = ".json"
+
+_write_lock = threading.Lock()
+_stats_lock = threading.Lock()
+_last_access: Dict[str, float] = {}   # path → 마지막 사용 시각 (LRU 용, 없으면 mtime)
+STATS = {"hits": 0, "stale_hits": 0, "misses": 0, "writes": 0, "expired_evictions": 0, "lru_evictions": 0, "sweeps": 0}
+_sweeper: Optional[threading.Thread] = None
+
+
+def _count(name: str, n: int = 1):
+    with _stats_lock:
+        STATS[name] += n
+
+
+def _touch(path: str):
+    with _stats_lock:
+        _last_access[path] = time.time()
+
+
+def normalize_keyword(keyword: str) -> str:
+    """대소문자/앞뒤 공백/연속 공백 차이는 같은 검색으로 본다."""
+    return " ".join((keyword or "").split()).lower()
+
+
+def cache_path(source: str, keyword: str) -> str:
+    digest = hashlib.sha1(normalize_keyword(keyword).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(CACHE_DIR, f"{source}_{digest}{CACHE_EXT}")
+
+
+def _legacy_paths(source: str, keyword: str) -> List[str]:
+    """키워드의 영숫자 외 문자를 '_' 로 바꿔 쓰던 예전 파일 이름들 (.cache, 그 이전 .json)."""
+    safe_keyword = "".join(c if c.isalnum() else "_" for c in normalize_keyword(keyword))
+    base = os.path.join(CACHE_DIR, f"{source}_{safe_keyword}")
+    return [base + CACHE_EXT, base + LEGACY_EXT]
+
+
+def slice_results(results: Dict[str, List], count: int) -> Dict[str, List]:
+    return {site: (items or [])[:count] for site, items in (results or {}).items()}
+
+
+def read_entry(source: str, keyword: str) -> Optional[dict]:
+    path = cache_path(source, keyword)
+    kw = normalize_keyword(keyword)
+    for candidate in [path] + _legacy_paths(source, keyword):
+        try:
+            with open(candidate, "rb") as f:
+                data = f.read()
+            entry = cache_codec.decode(data)
+        except FileNotFoundError:
+            continue
+        except (OSError, ValueError):
+            continue
+        # 다른 키워드의 항목(예전 이름 충돌)은 쓰지 않는다
+        if isinstance(entry, dict) and "results" in entry and entry.get("keyword") == kw:
+            break
+    else:
+        return None
+    entry.setdefault("saved_at", os.path.getmtime(candidate))
+    if "id" not in entry:  # id 이전 형식: 경로+저장 시각으로 고정 id 부여
+        entry["id"] = hashlib.sha1(f"{candidate}:{entry['saved_at']}".encode()).hexdigest()[:16]
+    result_store.put(entry["id"], path, entry["results"])
+    _touch(path)
+    return entry
+
+
+def load(source: str, keyword: str, count: int, max_age: float) -> Optional[Dict[str, List]]:
+    """count 이상으로 저장된 max_age(초) 이내 항목이 있으면 count 개로 잘라 반환."""
+    entry = read_entry(source, keyword)
+    if not entry or int(entry.get("count", 0)) < count or time.time() - float(entry["saved_at"]) >= max_age:
+        _count("misses")
+        return None
+    _count("hits")
+    return slice_results(entry["results"], count)
+
+
+def lookup(source: str, keyword: str, count: int, fresh_for: float, stale_for: float = 0.0):
+    """
+    stale-while-revalidate 조회. (결과, 상태, result set id) 반환.
+      - "fresh": 나이 < fresh_for
+      - "stale": fresh_for <= 나이 < fresh_for + stale_for → 바로 보여주고 백그라운드에서 갱신
+      - None   : 없음/개수 부족/완전 만료 → 호출자가 기다려서 새로 크롤링
+    """
+    entry = read_entry(source, keyword)
+    if entry and int(entry.get("count", 0)) >= count:
+        age = time.time() - float(entry["saved_at"])
+        state = "fresh" if age < fresh_for else ("stale" if age < fresh_for + stale_for else None)
+        if state:
+            _count("hits" if state == "fresh" else "stale_hits")
+            return slice_results(entry["results"], count), state, entry["id"]
+    _count("misses")
+    return None, None, None
+
+
+def save(source: str, keyword: str, count: int, results: Dict[str, List]) -> dict:
+    """임시 파일에 쓴 뒤 교체(os.replace)하여 읽는 쪽이 반쯤 쓰인 파일을 보지 않게 한다. 저장한 항목을 반환."""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    path = cache_path(source, keyword)
+    entry = {"count": int(count), "saved_at": time.time(), "id": uuid.uuid4().hex[:16],
+             "keyword": normalize_keyword(keyword), "results": results}
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    data = cache_codec.encode(entry)
+    with _write_lock:
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+        for legacy in _legacy_paths(source, keyword):
+            if os.path.exists(legacy):
+                os.remove(legacy)
+    result_store.put(entry["id"], path, results)
+    _touch(path)
+    _count("writes")
+    return entry
+
+
+def delete(source: str, keyword: str) -> bool:
+    path = cache_path(source, keyword)
+    removed = False
+    for candidate in [path] + _legacy_paths(source, keyword):
+        if os.path.exists(candidate):
+            os.remove(candidate)
+            removed = True
+    if removed:
+        with _stats_lock:
+            _last_access.pop(path, None)
+        result_store.invalidate(path)
+    return removed
+
+
+# ------------------ 용량 관리 ------------------
+def sweep() -> dict:
+    """만료 항목 삭제 → 개수/용량 한도 초과분을 LRU 순으로 삭제. 이번에 지운 개수를 반환."""
+    now = time.time()
+    removed = {"expired": 0, "lru": 0}
+    files = []
+    try:
+        names = os.listdir(CACHE_DIR)
+    except OSError:
+        return removed
+    for name in names:
+        path = os.path.join(CACHE_DIR, name)
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        # 쓰다가 죽은 임시 파일
+        if name.endswith(".tmp"):
+            if now - st.st_mtime > 600:
+                _remove(path)
+            continue
+        if not name.endswith((CACHE_EXT, LEGACY_EXT)):
+            continue
+        if CACHE_TTL_SEC > 0 and now - st.st_mtime >= CACHE_TTL_SEC:
+            if _remove(path):
+                removed["expired"] += 1
+            continue
+        with _stats_lock:
+            used = _last_access.get(path, st.st_mtime)
+        files.append((used, st.st_size, path))
+
+    files.sort()  # 오래 안 쓰인 것부터
+    total = sum(size for _, size, _ in files)
+    count = len(files)
+    for _, size, path in files:
+        if count <= CACHE_MAX_ENTRIES and total <= CACHE_MAX_BYTES:
+            break
+        if _remove(path):
+            removed["lru"] += 1
+            count -= 1
+            total -= size
+
+    _count("expired_evictions", removed["expired"])
+    _count("lru_evictions", removed["lru"])
+    _count("sweeps")
+    return removed
+
+
+def _remove(path: str) -> bool:
+    try:
+        os.remove(path)
+    except OSError:
+        return False
+    if path.endswith(LEGACY_EXT):
+        path = path[:-len(LEGACY_EXT)] + CACHE_EXT
+    with _stats_lock:
+        _last_access.pop(path, None)
+    result_store.invalidate(path)
+    return True
+
+
+def _sweeper_loop(interval: float):
+    while True:
+        try:
+            sweep()
+        except Exception as e:
+            print(f"[CACHE] sweep 실패: {e}")
+        time.sleep(interval)
+
+
+def start_sweeper(interval: float = SWEEP_INTERVAL_SEC):
+    """백그라운드 sweeper 스레드 시작 (프로세스당 1개, 시작 직후 1회 정리)."""
+    global _sweeper
+    if _sweeper is None:
+        _sweeper = threading.Thread(target=_sweeper_loop, args=(interval,), name="cache-sweeper", daemon=True)
+        _sweeper.start()
+
+
+def cache_stats() -> dict:
+    with _stats_lock:
+        stats = dict(STATS)
+    lookups = stats["hits"] + stats["stale_hits"] + stats["misses"]
+    stats["hit_ratio"] = round((stats["hits"] + stats["stale_hits"]) / lookups, 3) if lookups else None
+    return stats
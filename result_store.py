@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""
+크롤링 결과 메모리 색인 (job_detail 조회용).
+
+캐시 항목(result set) 하나를 처음 읽거나 저장할 때 한 번만 색인해 두고,
+상세 페이지는 (result set id, 사이트, 공고 키) 로 디스크 접근 없이 O(1) 조회한다.
+
+- result set id 는 캐시 항목을 저장할 때마다 새로 발급된다. 파일이 다시 쓰이면
+  이전 result set 은 버려지고, 상세 페이지는 새 result set 에서 같은 공고 키를 찾는다.
+- 공고 키는 원문 링크(없으면 회사|제목).
+- 최근 RESULT_STORE_MAX_SETS 개 result set 만 LRU 로 유지한다.
+"""
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+RESULT_STORE_MAX_SETS = int(os.getenv("RESULT_STORE_MAX_SETS", "64"))
+
+
+def posting_key(job: dict) -> str:
+    return job.get("link") or f"{job.get('company', '')}|{job.get('title', '')}"
+
+
+class ResultSet:
+    def __init__(self, set_id: str, path: str, results: Dict[str, List[dict]]):
+        self.id = set_id
+        self.path = path
+        self.results = results
+        self.by_key: Dict[tuple, dict] = {}
+        for site, items in (results or {}).items():
+            for job in items or []:
+                # 같은 키가 여러 번 나오면 목록에서 먼저 나온 공고를 가리킨다
+                self.by_key.setdefault((site, posting_key(job)), job)
+
+
+_sets: "OrderedDict[str, ResultSet]" = OrderedDict()
+_lock = threading.Lock()
+STATS = {"indexed": 0, "hits": 0, "misses": 0, "invalidated": 0}
+
+
+def put(set_id: str, path: str, results: Dict[str, List[dict]]) -> str:
+    """result set 등록. 이미 색인된 id 면 다시 색인하지 않는다."""
+    with _lock:
+        if set_id in _sets:
+            _sets.move_to_end(set_id)
+            return set_id
+    rs = ResultSet(set_id, path, results)   # 색인은 잠금 밖에서
+    with _lock:
+        # 같은 파일이 다시 쓰였으면 이전 result set 은 무효
+        for sid in [sid for sid, old in _sets.items() if old.path == path]:
+            del _sets[sid]
+            STATS["invalidated"] += 1
+        _sets[set_id] = rs
+        STATS["indexed"] += 1
+        while len(_sets) > RESULT_STORE_MAX_SETS:
+            _sets.popitem(last=False)
+    return set_id
+
+
+def find(set_id: str, site: str, job_id: str) -> Optional[dict]:
+    with _lock:
+        rs = _sets.get(set_id)
+        job = rs.by_key.get((site, job_id)) if rs else None
+        if job is None:
+            STATS["misses"] += 1
+            return None
+        _sets.move_to_end(set_id)
+        STATS["hits"] += 1
+        return job
+
+
+def at(set_id: str, site: str, index: int) -> Optional[dict]:
+    """예전 링크(job_index) 호환용 위치 조회."""
+    with _lock:
+        rs = _sets.get(set_id)
+        items = (rs.results.get(site) or []) if rs else []
+        return items[index] if 0 <= index < len(items) else None
+
+
+def invalidate(path: str):
+    """캐시 파일이 삭제되면 그 파일에서 나온 result set 을 모두 버린다."""
+    with _lock:
+        stale = [sid for sid, rs in _sets.items() if rs.path == path]
+        for sid in stale:
+            del _sets[sid]
+        STATS["invalidated"] += len(stale)
+
+
+def store_stats() -> dict:
+    with _lock:
+        return {**STATS, "sets": len(_sets)}
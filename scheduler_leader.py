@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+"""
+예약 스케줄러 리더 선출 (여러 웹 워커 프로세스 / 파일시스템을 공유하는 여러 노드).
+
+모든 프로세스가 스케줄러를 일시정지 상태로 띄워 두고, 리더 한 곳만 실제로 실행한다.
+리더는 공유 파일시스템의 임대(lease) 파일로 정한다:
+  - 각 프로세스는 SCHEDULER_HEARTBEAT_SEC 마다 잠금 파일(flock)을 잡고 lease 를 읽는다.
+  - lease 가 없거나, 내 것이거나, SCHEDULER_LEASE_SEC 넘게 갱신되지 않았으면(리더가 죽음) 내 것으로 쓴다.
+  - 쓴 뒤 다시 읽어 내 것인지 확인한다 (노드 간에 flock 이 보장되지 않는 파일시스템 대비).
+    이 확인은 '나중에 쓴 쪽이 이긴다'를 좁힐 뿐 막지는 못한다: flock 이 노드 간에 공유되지 않으면
+    두 노드가 같은 heartbeat 에 각자 쓰고 각자 자기 것을 읽어 둘 다 리더가 될 수 있다.
+    그 겹침에서 중복 실행을 막는 것은 실행 직전의 still_leader() 확인뿐이다 (파일은 결국 한쪽 것으로 남는다).
+    flock 이 노드 간에 동작하지 않는 공유 파일시스템에서는 확인과 실행 사이 짧은 틈의 중복이 남는다.
+  - lease 파일을 읽거나 쓰지 못하면 리더에서 내려온다 (중복 전송보다 한 번 놓치는 쪽을 택한다).
+정상 종료 시에는 lease 를 지워 다른 프로세스가 다음 heartbeat 에 바로 이어받는다.
+
+콜백: on_elected() 리더가 됐을 때, on_demoted() 리더를 잃었을 때, on_heartbeat(is_leader) 매 heartbeat.
+"""
+import os
+import json
+import time
+import uuid
+import atexit
+import socket
+import threading
+from contextlib import contextmanager
+from typing import Callable, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: 잠금 없이 '쓰고 다시 읽기'만으로 선출
+    fcntl = None
+
+SCHEDULER_LEASE_FILE = os.getenv("SCHEDULER_LEASE_FILE", "scheduler_leader.json")
+SCHEDULER_HEARTBEAT_SEC = float(os.getenv("SCHEDULER_HEARTBEAT_SEC", "10"))
+SCHEDULER_LEASE_SEC = float(os.getenv("SCHEDULER_LEASE_SEC", "30"))
+
+
+class LeaderElection:
+    def __init__(
+        self,
+        path: str = SCHEDULER_LEASE_FILE,
+        lease: float = SCHEDULER_LEASE_SEC,
+        heartbeat: float = SCHEDULER_HEARTBEAT_SEC,
+        on_elected: Optional[Callable[[], None]] = None,
+        on_demoted: Optional[Callable[[], None]] = None,
+        on_heartbeat: Optional[Callable[[bool], None]] = None,
+    ):
+        self.path = path
+        self.lease = lease
+        self.heartbeat = heartbeat
+        self.on_elected = on_elected
+        self.on_demoted = on_demoted
+        self.on_heartbeat = on_heartbeat
+        self.owner: Optional[str] = None
+        self.is_leader = False
+        self.current: dict = {}     # 마지막으로 읽은 lease
+        self.stats = {"elected": 0, "demoted": 0, "heartbeats": 0, "errors": 0}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # ---------- 시작/종료 ----------
+    def start(self):
+        """heartbeat 스레드 시작. owner 는 여기서 정한다 (import 후 fork 된 워커도 자기 pid 로 참여)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="scheduler-leader", daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def stop(self):
+        """heartbeat 를 멈추고, 리더였으면 lease 를 내려놓는다."""
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=self.heartbeat + 5)
+        if self.is_leader:
+            try:
+                with self._file_lock():
+                    if self._read().get("owner") == self.owner:
+                        os.remove(self.path)
+            except OSError as e:
+                print(f"[LEADER] lease 해제 실패: {e}")
+            self._set_leader(False)
+
+    def _loop(self):
+        while not self._stop.is_set():
+            self.tick()
+            self._stop.wait(self.heartbeat)
+
+    # ---------- 선출 ----------
+    def tick(self) -> bool:
+        """heartbeat 1회: lease 를 갱신하거나 빼앗을 수 있는지 확인. 이번 결과(리더 여부)를 반환."""
+        try:
+            leader = self._claim()
+        except OSError as e:
+            print(f"[LEADER] lease 파일 접근 실패, 리더에서 내려옵니다: {e}")
+            self.stats["errors"] += 1
+            leader = False
+        self.stats["heartbeats"] += 1
+        self._set_leader(leader)
+        if self.on_heartbeat:
+            try:
+                self.on_heartbeat(leader)
+            except Exception as e:
+                print(f"[LEADER] heartbeat 콜백 실패: {e}")
+        return leader
+
+    def _claim(self) -> bool:
+        with self._file_lock():
+            now = time.time()
+            lease = self._read()
+            if lease.get("owner") not in (None, self.owner) and now - float(lease.get("heartbeat", 0)) < self.lease:
+                self.current = lease
+                return False
+            self._write({
+                "owner": self.owner,
+                "host": socket.gethostname(),
+                "pid": os.getpid(),
+                "since": lease.get("since", now) if lease.get("owner") == self.owner else now,
+                "heartbeat": now,
+            })
+            self.current = self._read()
+            return self.current.get("owner") == self.owner
+
+    def still_leader(self) -> bool:
+        """지금 이 순간에도 lease 가 내 것이고 만료 전인지 (실행 직전 확인용, 쓰지 않고 읽기만)."""
+        if not self.is_leader:
+            return False
+        try:
+            lease = self._read()
+        except OSError:
+            return False
+        return lease.get("owner") == self.owner and time.time() - float(lease.get("heartbeat", 0)) < self.lease
+
+    def _set_leader(self, leader: bool):
+        if leader == self.is_leader:
+            return
+        self.is_leader = leader
+        self.stats["elected" if leader else "demoted"] += 1
+        print(f"[LEADER] {self.owner} {'리더가 되었습니다' if leader else '리더에서 내려왔습니다'}")
+        callback = self.on_elected if leader else self.on_demoted
+        if callback:
+            try:
+                callback()
+            except Exception as e:
+                print(f"[LEADER] 리더 전환 콜백 실패: {e}")
+
+    # ---------- lease 파일 ----------
+    @contextmanager
+    def _file_lock(self):
+        if fcntl is None:
+            yield
+            return
+        with open(f"{self.path}.lock", "a") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _read(self) -> dict:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (json.JSONDecodeError, ValueError):
+            # 반쯤 쓰인/깨진 lease 는 없는 것으로 본다
+            return {}
+
+    def _write(self, lease: dict):
+        tmp = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(lease, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+
+    def status(self) -> dict:
+        return {
+            "is_leader": self.is_leader,
+            "owner": self.owner,
+            "leader": dict(self.current),
+            "lease_sec": self.lease,
+            "heartbeat_sec": self.heartbeat,
+            **self.stats,
+        }
@@ -6,63 +6,239 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-import time, urllib.parse
-
-def get_section_text(driver, section_title):
-    try:
-        xpath = f"//h3[text()='{section_title}']/following-sibling::*[1]"
-        # 상세 페이지 로딩이 느릴 수 있으므로 짧은 대기 추가
-        element = WebDriverWait(driver, 5).until(
-            EC.presence_of_element_located((By.XPATH, xpath))
-        )
-        return element.text
-    except TimeoutException:
-        return "정보 없음"
-
-def get_summary_text(driver, summary_title):
-    try:
-        xpath = f"//dt[contains(text(), '{summary_title}')]/following-sibling::dd[1]"
-        element = WebDriverWait(driver, 5).until(
-            EC.presence_of_element_located((By.XPATH, xpath))
-        )
-        return element.text
-    except TimeoutException:
-        return "정보 없음"
+import time, urllib.parse, os
+from driver_pool import get_pool, POOL_ACQUIRE_TIMEOUT
+from load_profile import lean_options, apply_load_profile, report_blocked
+from http_fetch import fetch_soup, HTTP_TIMEOUT
+from rate_limit import throttle
+from driver_watchdog import note_navigation
+from deadline import Deadline, ensure
+from admission import AdmissionRejected
 
+UA = "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
 
-# --- 잡플래닛 크롤링 함수 (URL 직접 접속 방식으로 수정) ---
-def scrape_jobplanet(keyword, count):
-    scraped_data = []
+def build_scraper_driver():
+    """잡플래닛/잡코리아/인크루트 공용 헤드리스 드라이버 (드라이버 풀의 factory)."""
     options = wb.ChromeOptions()
     print("헤드리스 모드로 실행합니다.")
     options.add_argument("--headless")
+    # 창 크기는 여기서만 정한다: 풀에서 공유하는 드라이버라 스크래퍼가 바꾸면 다음 대여로 새어 나간다
     options.add_argument("--window-size=1920,1080")
     options.add_argument("--disable-gpu")
     options.add_argument("--no-sandbox")
     options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
-    
-    driver = wb.Chrome(options=options)
+    options.add_argument(UA)
+    lean_options(options)
+    return wb.Chrome(options=options)
+
+def driver_pool():
+    return get_pool("scraper", build_scraper_driver)
+
+# 잡플래닛 상세 페이지 동시 수집 설정 (1 이하면 기존처럼 탭 하나로 순차 수집)
+JOBPLANET_DETAIL_CONCURRENCY = int(os.getenv("JOBPLANET_DETAIL_CONCURRENCY", "3"))
+JOBPLANET_DETAIL_DEADLINE = float(os.getenv("JOBPLANET_DETAIL_DEADLINE", "15"))
+# 목록 페이지 로드 상한 (요청 deadline 이 더 짧으면 그쪽을 따른다)
+SCRAPER_PAGE_LOAD_TIMEOUT = float(os.getenv("SCRAPER_PAGE_LOAD_TIMEOUT", "30"))
+
+# 바닥까지 스크롤한 뒤, 카드 수가 늘어나는 DOM 변화(MutationObserver)가 오면 즉시,
+# 아니면 timeoutMs 후에 현재 카드 수를 돌려주는 비동기 스크립트
+SCROLL_SCRIPT = """
+const [mode, sel, before, timeoutMs, done] = arguments;
+const count = () => mode === "xpath"
+  ? document.evaluate(sel, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null).snapshotLength
+  : document.querySelectorAll(sel).length;
+const h0 = document.body.scrollHeight;
+let mutated = false, finished = false, timer = null, obs = null;
+const finish = () => {
+  if (finished) return;
+  finished = true;
+  if (obs) obs.disconnect();
+  clearTimeout(timer);
+  done({count: count(), mutated: mutated, grown: document.body.scrollHeight > h0});
+};
+obs = new MutationObserver(() => { mutated = true; if (count() > before) finish(); });
+obs.observe(document.body, {childList: true, subtree: true});
+timer = setTimeout(finish, timeoutMs);
+window.scrollTo(0, document.body.scrollHeight);
+if (count() > before) finish();
+"""
+
+def scroll_until_count(driver, by, selector, want, step_timeout=2.0, patience=3, deadline=None):
+    """
+    무한 스크롤 목록을 카드가 want 개 이상이 될 때까지 내린다. 최종 카드 수를 반환.
+    - 새 카드가 렌더링되는 즉시 다음 스크롤로 넘어간다 (고정 sleep 없음).
+    - step_timeout 동안 DOM 변화도, 페이지 높이 변화도 없으면 목록 끝으로 판단.
+    - 변화는 있는데(로딩 스피너 등) 카드가 안 늘면 patience 번까지 다시 기다린다.
+    - deadline 이 지나면 그때까지 로드된 카드 수로 멈춘다.
+    """
+    deadline = ensure(deadline)
+    mode = "xpath" if by == By.XPATH else "css"
+    count = len(driver.find_elements(by, selector))
+    driver.set_script_timeout(step_timeout + 5)
+    stalls = 0
+    while count < want:
+        if deadline.expired():
+            print(f"시간 예산이 끝나 {count}개에서 스크롤을 중단합니다.")
+            return count
+        step = deadline.cap(step_timeout)
+        res = driver.execute_async_script(SCROLL_SCRIPT, mode, selector, count, int(step * 1000)) or {}
+        new_count = int(res.get("count", count))
+        if new_count > count:
+            count = new_count
+            stalls = 0
+            continue
+        stalls += 1
+        if not (res.get("mutated") or res.get("grown")) or stalls >= patience:
+            print("페이지의 끝에 도달하여 더 이상 스크롤할 수 없습니다.")
+            return count
+    print(f"요청한 {want}개 이상의 공고를 로드하여 스크롤을 중단합니다.")
+    return count
+
+# 상세 페이지 전체(h3→다음 형제, dt→dd)를 한 번에 읽어오는 스크립트
+DETAIL_SCRIPT = """
+const txt = (el) => ((el && (el.innerText || el.textContent)) || "").trim();
+const out = {title: "", company: "", sections: {}, summary: {}};
+const h1 = document.querySelector("h1.ttl");
+if (h1) out.title = txt(h1);
+const co = document.querySelector("span.company_name a");
+if (co) out.company = txt(co);
+document.querySelectorAll("h3").forEach(h => {
+  const key = txt(h);
+  const sib = h.nextElementSibling;
+  if (key && sib && !(key in out.sections)) out.sections[key] = txt(sib);
+});
+document.querySelectorAll("dt").forEach(dt => {
+  const key = txt(dt);
+  let dd = dt.nextElementSibling;
+  while (dd && dd.tagName !== "DD") dd = dd.nextElementSibling;
+  if (key && dd && !(key in out.summary)) out.summary[key] = txt(dd);
+});
+return out;
+"""
+
+def _pick_summary(summary, title):
+    """dt 라벨에 title 이 포함된 첫 항목 (기존 contains(text(), ...) 와 동일)."""
+    for key, val in summary.items():
+        if title in key:
+            return val
+    return "정보 없음"
+
+def read_jobplanet_detail(driver, link, timeout=10):
+    """
+    현재 탭에 열린 잡플래닛 상세 페이지에서 필드를 읽는다.
+    recruitment-summary 를 한 번만 기다린 뒤 스크립트 1회로 전 섹션을 가져오므로
+    없는 섹션이 있어도 추가 대기가 없다.
+    """
+    WebDriverWait(driver, timeout).until(EC.presence_of_element_located((By.CLASS_NAME, "recruitment-summary")))
+    page = driver.execute_script(DETAIL_SCRIPT) or {}
+    if not page.get("title") or not page.get("company"):
+        raise NoSuchElementException("h1.ttl / span.company_name a not found")
+    sections = page.get("sections") or {}
+    summary = page.get("summary") or {}
+    return {
+        "link": link,
+        "title": page["title"],
+        "company": page["company"],
+        "deadline": _pick_summary(summary, "마감일"),
+        "skills": _pick_summary(summary, "스킬"),
+        "location": sections.get("회사위치", "정보 없음"),
+        "main_tasks": sections.get("주요 업무", "정보 없음"),
+        "qualifications": sections.get("자격 요건", "정보 없음"),
+        "preferred": sections.get("우대사항", "정보 없음"),
+        "hiring_process": sections.get("채용 절차", "정보 없음"),
+    }
+
+def _fetch_jobplanet_detail(link, page_deadline, deadline=None):
+    """
+    상세 전용 풀에서 드라이버를 빌려 상세 페이지 하나를 page_deadline(초) 안에 가져온다.
+    요청 deadline 이 먼저 끝나면 그 안에서 끊고, 이미 끝났으면 열지 않는다(None).
+    """
+    deadline = ensure(deadline)
+    if deadline.expired():
+        return None
+    pool = get_pool("jobplanet_detail", build_scraper_driver, size=JOBPLANET_DETAIL_CONCURRENCY)
+    driver = pool.acquire(timeout=deadline.cap(POOL_ACQUIRE_TIMEOUT))
+    try:
+        page = Deadline(deadline.cap(page_deadline))
+        driver.set_page_load_timeout(page.cap(page_deadline))
+        apply_load_profile(driver, "jobplanet")
+        throttle(link)
+        note_navigation(driver)
+        driver.get(link)
+        return read_jobplanet_detail(driver, link, timeout=page.cap(page_deadline))
+    finally:
+        pool.release(driver)
+
+def fetch_jobplanet_details(links, concurrency=None, page_deadline=None, on_item=None, deadline=None):
+    """
+    상세 페이지들을 최대 concurrency 개씩 동시에 수집.
+    결과는 links 순서를 유지하고, 실패/타임아웃된 페이지는 빠진다.
+    on_item(공고) 은 상세 페이지 하나를 읽을 때마다(끝나는 순서대로) 호출된다.
+    deadline 이 지나면 남은 페이지는 기다리지 않고 그때까지 읽은 공고만 반환한다.
+    상세 드라이버 자리를 못 받은 페이지가 있으면(AdmissionRejected) 나머지를 다 받은 뒤
+    읽은 공고를 partial 에 담아 그 예외를 올린다 (호출자가 미완결로 표시).
+    """
+    deadline = ensure(deadline)
+    concurrency = concurrency or JOBPLANET_DETAIL_CONCURRENCY
+    page_deadline = page_deadline or JOBPLANET_DETAIL_DEADLINE
+    results = [None] * len(links)
+    rejected = None
+    # with 블록은 종료 시 실행 중인 작업을 기다리므로 직접 shutdown(wait=False)
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=max(1, concurrency))
+    try:
+        futures = {
+            executor.submit(_fetch_jobplanet_detail, link, page_deadline, deadline): i
+            for i, link in enumerate(links)
+        }
+        done = 0
+        for future in concurrent.futures.as_completed(futures, timeout=deadline.timeout()):
+            i = futures[future]
+            done += 1
+            try:
+                results[i] = future.result()
+                print(f"Scraping JobPlanet... {done}/{len(links)}")
+                if on_item and results[i]:
+                    on_item(results[i])
+            except AdmissionRejected as e:
+                print(f"브라우저 자리가 없어 상세 페이지를 건너뜁니다: {links[i]}")
+                rejected = e
+            except Exception as e:
+                print(f"Error scraping details for {links[i]}: {e}")
+    except concurrent.futures.TimeoutError:
+        print(f"시간 예산이 끝나 잡플래닛 상세 {sum(1 for r in results if r)}/{len(links)}개만 반환합니다.")
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    if rejected is not None:
+        rejected.partial = [r for r in results if r]
+        raise rejected
+    return [r for r in results if r]
+
+
+# --- 잡플래닛 크롤링 함수 (URL 직접 접속 방식으로 수정) ---
+def scrape_jobplanet(keyword, count, concurrency=None, page_deadline=None, on_item=None, deadline=None):
+    deadline = ensure(deadline)
+    scraped_data = []
+    pool = driver_pool()
+    driver = pool.acquire(timeout=deadline.cap(POOL_ACQUIRE_TIMEOUT))
     
     try:
         # [수정] 검색 URL을 직접 생성하여 접속
         encoded_keyword = urllib.parse.quote(keyword)
         search_url = f"https://www.jobplanet.co.kr/search/job?query={encoded_keyword}"
+        apply_load_profile(driver, "jobplanet")
+        driver.set_page_load_timeout(deadline.cap(SCRAPER_PAGE_LOAD_TIMEOUT))
+        throttle(search_url)
+        note_navigation(driver)
         driver.get(search_url)
         print(f"잡플래닛 접속: {search_url}")
 
-        if count > 7:
-            driver.maximize_window()
-
-        wait = WebDriverWait(driver, 10)
-        
         # 팝업창 처리
         try:
-            popup_iframe = WebDriverWait(driver, 5).until(
+            popup_iframe = WebDriverWait(driver, deadline.cap(5)).until(
                 EC.presence_of_element_located((By.XPATH, "//iframe[@title='Modal Message']"))
             )
             driver.switch_to.frame(popup_iframe)
-            close_button = WebDriverWait(driver, 5).until(
+            close_button = WebDriverWait(driver, deadline.cap(5)).until(
                 EC.element_to_be_clickable((By.XPATH, "//button[text()='닫기']"))
             )
             close_button.click()
@@ -77,99 +253,78 @@ def scrape_jobplanet(keyword, count):
         # ... (이하 스크롤 및 데이터 수집 로직은 기존과 동일)
         title_class_name = "line-clamp-2 break-all text-h7 text-gray-800 group-[.small]:text-h8"
         job_post_xpath = f"//a[.//h4[@class='{title_class_name}']]"
-        wait.until(EC.presence_of_element_located((By.XPATH, job_post_xpath)))
+        WebDriverWait(driver, deadline.cap(10)).until(EC.presence_of_element_located((By.XPATH, job_post_xpath)))
+        report_blocked(driver, "jobplanet")
 
-        while True:
-            job_post_elements = driver.find_elements(By.XPATH, job_post_xpath)
-            if len(job_post_elements) >= count:
-                print(f"요청한 {count}개 이상의 공고를 로드하여 스크롤을 중단합니다.")
-                break
-            
-            before_scroll_count = len(job_post_elements)
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(1.5)
-
-            after_scroll_count = len(driver.find_elements(By.XPATH, job_post_xpath))
-            if after_scroll_count == before_scroll_count:
-                print("페이지의 끝에 도달하여 더 이상 스크롤할 수 없습니다.")
-                break
+        scroll_until_count(driver, By.XPATH, job_post_xpath, count, deadline=deadline)
 
         final_job_elements = driver.find_elements(By.XPATH, job_post_xpath)
-        links_to_visit = [post.get_attribute('href') for post in final_job_elements[:count]]
-        
+        # 같은 공고가 목록에 두 번(추천/일반) 나와도 상세 페이지는 한 번만 연다
+        links_to_visit = list(dict.fromkeys(post.get_attribute('href') for post in final_job_elements[:count]))
+
+        concurrency = concurrency or JOBPLANET_DETAIL_CONCURRENCY
+        if concurrency > 1:
+            # 목록 드라이버는 바로 반납하고, 상세 페이지는 별도 풀의 드라이버들로 동시에 수집
+            pool.release(driver)
+            driver = None
+            scraped_data = fetch_jobplanet_details(links_to_visit, concurrency, page_deadline, on_item, deadline)
+            links_to_visit = []
+
         for i, link in enumerate(links_to_visit):
+            if deadline.expired():
+                print(f"시간 예산이 끝나 잡플래닛 상세 {len(scraped_data)}/{len(links_to_visit)}개만 반환합니다.")
+                break
             print(f"Scraping JobPlanet... {i+1}/{len(links_to_visit)}")
+            throttle(link)
+            note_navigation(driver)
             driver.execute_script(f"window.open('{link}');")
             driver.switch_to.window(driver.window_handles[1])
             
-            job_details = {"link": link}
             try:
-                WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.CLASS_NAME, "recruitment-summary")))
-                job_details["title"] = driver.find_element(By.CSS_SELECTOR, "h1.ttl").text
-                job_details["company"] = driver.find_element(By.CSS_SELECTOR, "span.company_name a").text
-                job_details["deadline"] = get_summary_text(driver, "마감일")
-                job_details["skills"] = get_summary_text(driver, "스킬")
-                job_details["location"] = get_section_text(driver, "회사위치")
-                job_details["main_tasks"] = get_section_text(driver, "주요 업무")
-                job_details["qualifications"] = get_section_text(driver, "자격 요건")
-                job_details["preferred"] = get_section_text(driver, "우대사항")
-                job_details["hiring_process"] = get_section_text(driver, "채용 절차")
-                scraped_data.append(job_details)
+                scraped_data.append(read_jobplanet_detail(driver, link, timeout=deadline.cap(10)))
+                if on_item:
+                    on_item(scraped_data[-1])
             except Exception as e:
                 print(f"Error scraping details for {link}: {e}")
             
             driver.close()
             driver.switch_to.window(driver.window_handles[0])
-            time.sleep(1)
 
+    except AdmissionRejected as e:
+        # 빈 결과로 숨기지 않는다: 모은 만큼을 담아 올려 호출자가 미완결로 표시
+        e.partial = e.partial or scraped_data
+        raise
     except Exception as e:
         print(f"An unexpected error occurred in scrape_jobplanet: {e}")
     finally:
-        if 'driver' in locals() and driver:
-            driver.quit()
-        return scraped_data
+        pool.release(driver)
+    return scraped_data
 
 # --- 잡코리아 크롤링 함수 (새롭게 구현) ---
-def scrape_jobkorea_simple(keyword, count):
+def scrape_jobkorea_simple(keyword, count, deadline=None):
     print(f"잡코리아에서 '{keyword}'에 대한 공고 {count}개를 검색합니다.")
+    deadline = ensure(deadline)
     scraped_data = []
 
-    options = wb.ChromeOptions()
-    print("헤드리스 모드로 실행합니다.")
-    options.add_argument("--headless")
-    options.add_argument("--window-size=1920,1080")
-    options.add_argument("--disable-gpu")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
-    driver = wb.Chrome(options=options)
+    pool = driver_pool()
+    driver = pool.acquire(timeout=deadline.cap(POOL_ACQUIRE_TIMEOUT))
     
     try:
+        apply_load_profile(driver, "jobkorea")
+        driver.set_page_load_timeout(deadline.cap(SCRAPER_PAGE_LOAD_TIMEOUT))
+        throttle("jobkorea")
+        note_navigation(driver)
         driver.get("https://www.jobkorea.co.kr/")
-        driver.maximize_window()
-        wait = WebDriverWait(driver, 10)
 
-        search_input = wait.until(EC.presence_of_element_located((By.ID, "stext")))
+        search_input = WebDriverWait(driver, deadline.cap(10)).until(EC.presence_of_element_located((By.ID, "stext")))
         search_input.send_keys(keyword)
         search_input.send_keys(Keys.ENTER)
 
         job_container_class = "h7nnv10"
-        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, f"div[class*='{job_container_class}']")))
+        WebDriverWait(driver, deadline.cap(10)).until(EC.presence_of_element_located((By.CSS_SELECTOR, f"div[class*='{job_container_class}']")))
+        report_blocked(driver, "jobkorea")
         
-        while True:
-            job_postings = driver.find_elements(By.CSS_SELECTOR, f"div[class*='{job_container_class}']")
-            if len(job_postings) >= count:
-                print(f"요청한 {count}개 이상의 공고를 로드하여 스크롤을 중단합니다.")
-                break
-            
-            before_scroll_count = len(job_postings)
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(1.5)
-
-            after_scroll_count = len(driver.find_elements(By.CSS_SELECTOR, f"div[class*='{job_container_class}']"))
-            if after_scroll_count == before_scroll_count:
-                print("페이지의 끝에 도달하여 더 이상 스크롤할 수 없습니다.")
-                break
+        scroll_until_count(driver, By.CSS_SELECTOR, f"div[class*='{job_container_class}']", count, deadline=deadline)
 
         job_postings = driver.find_elements(By.CSS_SELECTOR, f"div[class*='{job_container_class}']")
 
@@ -191,38 +346,75 @@ def scrape_jobkorea_simple(keyword, count):
     except Exception as e:
         print(f"An unexpected error occurred in scrape_jobkorea: {e}")
     finally:
-        if 'driver' in locals() and driver:
-            driver.quit()
+        pool.release(driver)
         return scraped_data
     
 # 인크루트 크롤링 함수
-def scrape_incruit(keyword: str, count: int):
+def incruit_search_url(keyword: str) -> str:
+    encoded_keyword = urllib.parse.quote(keyword)
+    return f"https://search.incruit.com/list/search.asp?col=job&kw={encoded_keyword}&memty=2000"
+
+# 인크루트 검색 결과 없음 영역
+INCRUIT_NO_RESULT_SELECTOR = "[class*='no_result'], [class*='result_none'], [class*='noResult']"
+
+def scrape_incruit_http(keyword: str, count: int, deadline=None):
+    """
+    인크루트 목록은 서버 렌더링이므로 HTTP 로 먼저 시도한다.
+    목록(ul.c_row)을 찾지 못하면 None 을 반환 → 호출자가 Selenium 경로로 대체.
+    서버가 '결과 없음'을 그려 보냈으면 브라우저를 띄우지 않고 빈 목록을 반환한다.
+    """
+    soup, base_url = fetch_soup(incruit_search_url(keyword), expect="ul[class*='c_row']",
+                                timeout=ensure(deadline).cap(HTTP_TIMEOUT), rendered=INCRUIT_NO_RESULT_SELECTOR)
+    if soup is None:
+        return None
+
+    scraped_data = []
+    job_postings = soup.select("ul[class*='c_row']")
+    print(f"인크루트(HTTP)에서 총 {len(job_postings)}개의 공고를 찾았습니다. {count}개를 수집합니다.")
+    for post in job_postings[:count]:
+        company_tag = post.select_one("a.cpname")
+        title_tag = post.select_one("div.cell_mid > div.cl_top > a")
+        if not company_tag or not title_tag:
+            print("인크루트 공고 처리 중 일부 요소를 찾을 수 없어 건너뜁니다.")
+            continue
+        details_spans = [sp.get_text(" ", strip=True) for sp in post.select("div.cl_md > span")]
+        scraped_data.append({
+            "company": company_tag.get_text(" ", strip=True),
+            "title": title_tag.get_text(" ", strip=True),
+            "link": urllib.parse.urljoin(base_url, title_tag.get("href", "")),
+            "location": details_spans[0] if len(details_spans) > 0 else "정보 없음",
+            "experience": details_spans[1] if len(details_spans) > 1 else "정보 없음",
+            "education": details_spans[2] if len(details_spans) > 2 else "정보 없음",
+        })
+    return scraped_data
+
+def scrape_incruit(keyword: str, count: int, deadline=None):
     """
     주어진 키워드로 인크루트 채용 정보를 스크래핑하는 함수.
+    HTTP 로 먼저 가져오고, 실패할 때만 헤드리스 Chrome 을 쓴다.
     """
     print(f"인크루트에서 '{keyword}' 키워드로 {count}개 검색을 시작합니다.")
+    deadline = ensure(deadline)
+    scraped_data = scrape_incruit_http(keyword, count, deadline)
+    if scraped_data is not None or deadline.expired():
+        return scraped_data or []
     scraped_data = []
     
-    options = wb.ChromeOptions()
-    options.add_argument("--headless")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("user-agent=Mozilla/5.0 (Windows NT 1.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
-    
-    #service = Service(ChromeDriverManager().install())
-    #driver = wb.Chrome(service=service, options=options)
-    driver = wb.Chrome(options=options)
+    pool = driver_pool()
+    driver = pool.acquire(timeout=deadline.cap(POOL_ACQUIRE_TIMEOUT))
     
     try:
-        encoded_keyword = urllib.parse.quote(keyword)
-        url_incruit = f"https://search.incruit.com/list/search.asp?col=job&kw={encoded_keyword}&memty=2000"
+        url_incruit = incruit_search_url(keyword)
         
+        apply_load_profile(driver, "incruit")
+        driver.set_page_load_timeout(deadline.cap(SCRAPER_PAGE_LOAD_TIMEOUT))
+        throttle(url_incruit)
+        note_navigation(driver)
         driver.get(url_incruit)
-        driver.maximize_window()
         
-        wait = WebDriverWait(driver, 10)
         job_list_container_xpath = "//ul[contains(@class, 'c_row')]"
-        wait.until(EC.presence_of_element_located((By.XPATH, job_list_container_xpath)))
+        WebDriverWait(driver, deadline.cap(10)).until(EC.presence_of_element_located((By.XPATH, job_list_container_xpath)))
+        report_blocked(driver, "incruit")
         
         job_postings = driver.find_elements(By.XPATH, job_list_container_xpath)
         
@@ -258,7 +450,6 @@ def scrape_incruit(keyword: str, count: int):
         print(f"인크루트 크롤링 중 오류가 발생했습니다: {e}")
         
     finally:
-        if 'driver' in locals() and driver:
-            driver.quit()
+        pool.release(driver)
         return scraped_data
 
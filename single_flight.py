@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+프로세스 내 single-flight: 같은 키의 작업이 이미 실행 중이면 새로 시작하지 않고
+그 작업의 결과(Future)를 함께 기다린다.
+
+    flight = SingleFlight()
+    results = flight.do(("scrape", keyword, count), crawl_all_sites, keyword, count)
+
+리더(처음 호출한 쪽)가 예외를 내면 기다리던 호출자들도 같은 예외를 받는다.
+결과 객체는 공유되므로 호출자는 결과를 수정하지 말고 새 객체를 만들어 써야 한다.
+"""
+import threading
+from concurrent.futures import Future
+from typing import Callable, Dict, Hashable
+
+
+class SingleFlight:
+    def __init__(self):
+        self._calls: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self.stats = {"leaders": 0, "coalesced": 0}
+
+    def do(self, key: Hashable, fn: Callable, *args, **kwargs):
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+                self.stats["leaders"] += 1
+            else:
+                self.stats["coalesced"] += 1
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {**self.stats, "in_flight": len(self._calls)}
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+
+import pytest
+
+import admission
+from admission import AdmissionRejected
+
+
+@pytest.fixture(autouse=True)
+def budget(monkeypatch):
+    monkeypatch.setattr(admission, "BROWSER_BUDGET", 2)
+    monkeypatch.setattr(admission, "ADMISSION_QUEUE_MAX", 1)
+    monkeypatch.setattr(admission, "SOURCE_BUDGETS", {"detail": 1})
+    held = []
+    yield held
+    for source in held:
+        admission.release(source)
+
+
+def test_acquire_within_budget_then_times_out(budget):
+    for source in ("a", "b"):
+        assert admission.acquire(source, timeout=0.1) == 0.0
+        budget.append(source)
+    with pytest.raises(AdmissionRejected) as exc:
+        admission.acquire("a", timeout=0.05)
+    assert exc.value.status == 503
+    assert exc.value.partial == []
+    assert admission.admission_stats()["in_use"] == 2
+
+
+def test_per_source_budget(budget):
+    admission.acquire("detail", timeout=0.1)
+    budget.append("detail")
+    with pytest.raises(AdmissionRejected):
+        admission.acquire("detail", timeout=0.05)
+    admission.acquire("list", timeout=0.1)
+    budget.append("list")
+
+
+def test_waiter_gets_released_slot_and_full_queue_rejects(budget):
+    for source in ("a", "b"):
+        admission.acquire(source, timeout=0.1)
+    waited = []
+    waiter = threading.Thread(target=lambda: waited.append(admission.acquire("c", timeout=5)))
+    waiter.start()
+    while admission.admission_stats()["queue_depth"] < 1:
+        time.sleep(0.01)
+
+    # 대기열(ADMISSION_QUEUE_MAX=1)이 차 있으면 기다리지 않고 바로 거절
+    with pytest.raises(AdmissionRejected, match="queue full"):
+        admission.acquire("d", timeout=5)
+
+    admission.release("a")
+    waiter.join(5)
+    budget.extend(["b", "c"])
+    assert waited and waited[0] > 0
+
+
+def test_release_of_unheld_source_is_ignored():
+    before = admission.admission_stats()["in_use"]
+    admission.release("never-acquired")
+    assert admission.admission_stats()["in_use"] == before
+
+
+def test_parse_budgets():
+    assert admission._parse_budgets("jobplanet_detail=3, inflearn=1,bad,x=y") == {"jobplanet_detail": 3, "inflearn": 1}
+
+
+def test_detached_driver_keeps_slot_until_quit():
+    import driver_watchdog
+
+    class FakeDriver:
+        quit_called = False
+
+        def quit(self):
+            self.quit_called = True
+
+    admission.acquire("jobkorea", timeout=0.1)
+    driver = FakeDriver()
+    driver_watchdog.hold_admission(driver, "jobkorea")
+    assert admission.admission_stats()["in_use_by_source"] == {"jobkorea": 1}
+
+    driver_watchdog.quit_driver(driver)
+    assert driver.quit_called
+    assert admission.admission_stats()["in_use_by_source"] == {}
+
+
+def test_registered_source_budget_defaults_to_pool_size(budget, monkeypatch):
+    monkeypatch.setattr(admission, "BROWSER_BUDGET", 6)
+    admission.register_source("jobkorea", 1)
+    admission.register_source("detail", 5)   # BROWSER_BUDGETS 에 명시된 값이 우선
+    assert admission.SOURCE_BUDGETS == {"detail": 1, "jobkorea": 1}
+
+    admission.acquire("jobkorea", timeout=0.1)
+    budget.append("jobkorea")
+    with pytest.raises(AdmissionRejected):
+        admission.acquire("jobkorea", timeout=0.05)
+    # 다른 소스는 전역 자리가 남아 있으므로 바로 받는다
+    assert admission.acquire("incruit", timeout=0.05) == 0.0
+    budget.append("incruit")
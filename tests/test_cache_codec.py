@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+import json
+
+import pytest
+
+import cache_codec
+
+ENTRY = {
+    "count": 2,
+    "saved_at": 1700000000.5,
+    "id": "abc123",
+    "keyword": "백엔드 개발",
+    "results": {"jobplanet": [{"company": "(주)테스트", "title": "파이썬 개발자", "skills": None, "dday": 3}]},
+}
+
+
+@pytest.mark.parametrize("codec", sorted(cache_codec.CODECS))
+def test_round_trip(codec):
+    data = cache_codec.encode(ENTRY, codec)
+    assert data.startswith(cache_codec.MAGIC + cache_codec.CODECS[codec][0])
+    assert cache_codec.decode(data) == ENTRY
+
+
+def test_default_codec_is_compressed_and_never_marshal():
+    assert cache_codec.CACHE_CODEC in cache_codec.CODECS
+    assert "marshal" not in cache_codec.CODECS
+    assert len(cache_codec.encode(ENTRY)) < len(json.dumps(ENTRY, ensure_ascii=False, indent=2).encode("utf-8"))
+
+
+def test_legacy_indented_json_is_read():
+    data = json.dumps(ENTRY, ensure_ascii=False, indent=2).encode("utf-8")
+    assert cache_codec.decode(data) == ENTRY
+
+
+@pytest.mark.parametrize("data", [
+    cache_codec.MAGIC + b"?" + b"payload",
+    cache_codec.MAGIC + b"J" + b"not zlib",
+    b"{broken json",
+])
+def test_corrupt_data_raises_value_error(data):
+    with pytest.raises(ValueError):
+        cache_codec.decode(data)
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+import threading
+
+import pytest
+
+import crawl_jobs
+import posting_store
+from crawl_jobs import CrawlJobQueue, StoredCrawlJob
+
+
+@pytest.fixture(autouse=True)
+def job_db(tmp_path, monkeypatch):
+    monkeypatch.setattr(posting_store, "POSTING_DB", str(tmp_path / "postings.db"))
+    monkeypatch.setattr(crawl_jobs, "CRAWL_EVENT_POLL_SEC", 0.02)
+
+
+def test_job_runs_and_same_key_is_coalesced():
+    release = threading.Event()
+
+    def work(keyword, progress, emit):
+        progress(jobkorea="running")
+        emit("site", {"site": "jobkorea", "jobs": [keyword]})
+        release.wait(5)
+        return {"results": [keyword]}
+
+    queue = CrawlJobQueue(workers=1)
+    job = queue.submit("k", work, "python", meta={"keyword": "python", "count": 1})
+    assert queue.submit("k", work, "python") is job
+    release.set()
+
+    events = []
+    while not events or events[-1][0] != "done":
+        events += job.wait_events(len(events), timeout=5)
+    assert [name for name, _ in events] == ["site", "done"]
+    assert job.state == "done" and job.result == {"results": ["python"]}
+    assert queue.snapshot()["coalesced"] == 1
+
+
+def test_other_worker_reads_status_events_and_result_from_store():
+    release = threading.Event()
+
+    def work(progress, emit):
+        progress(jobplanet="running")
+        emit("posting", {"site": "jobplanet", "job": {"title": "공고"}})
+        release.wait(5)
+        return {"results": {"jobplanet": []}}
+
+    runner, reader = CrawlJobQueue(), CrawlJobQueue()
+    job = runner.submit("k", work, meta={"keyword": "python", "count": 3})
+
+    remote = reader.get(job.id)
+    assert isinstance(remote, StoredCrawlJob)
+    assert remote.wait_events(0, timeout=5) == [("posting", {"site": "jobplanet", "job": {"title": "공고"}})]
+    status = reader.get(job.id).status()   # 요청마다 저장소에서 다시 읽는다
+    assert status["keyword"] == "python"
+    assert status["progress"] == {"jobplanet": "running"}
+    assert remote.wait_events(1, timeout=0.05) == []
+
+    release.set()
+    assert reader.get(job.id).wait_events(1, timeout=5) == [("done", {"results": {"jobplanet": []}})]
+    finished = reader.get(job.id)
+    assert finished.state == "done"
+    assert finished.result == {"results": {"jobplanet": []}}
+    assert reader.get("missing") is None
+
+
+def test_failure_keeps_error_status():
+    class Busy(RuntimeError):
+        status = 503
+
+    def work(progress, emit):
+        raise Busy("full")
+
+    queue = CrawlJobQueue()
+    job = queue.submit("k", work)
+    assert job.wait_events(0, timeout=5) == [("error", {"error": "full", "status": 503})]
+    remote = CrawlJobQueue().get(job.id)
+    assert (remote.state, remote.error, remote.error_status) == ("error", "full", 503)
+
+
+def test_vanished_or_stalled_job_is_reported_lost(monkeypatch):
+    release = threading.Event()
+
+    def work(progress, emit):
+        release.wait(5)
+        return {}
+
+    runner, reader = CrawlJobQueue(), CrawlJobQueue()
+    job = runner.submit("k", work)
+    try:
+        while reader.get(job.id).state != "running":
+            pass
+        assert reader.lost(job.id) is None
+
+        # 실행하던 워커가 죽은 채 오래 지남
+        monkeypatch.setattr(crawl_jobs, "CRAWL_JOB_STALL_SEC", 0)
+        assert "중단" in reader.lost(job.id)
+
+        # ttl 이 지나 다른 워커의 _expire 가 행을 지움
+        CrawlJobQueue(ttl=-1)._expire()
+        assert reader.get(job.id) is None
+        assert "만료" in reader.lost(job.id)
+        assert reader.lost("missing") is not None
+    finally:
+        release.set()
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+import math
+import time
+
+from deadline import MIN_WAIT_SEC, Deadline, ensure
+
+
+def test_unlimited_deadline():
+    deadline = Deadline()
+    assert deadline.remaining() == math.inf
+    assert not deadline.expired()
+    assert deadline.timeout() is None
+    assert deadline.cap(10) == 10
+
+
+def test_cap_takes_the_shorter_of_timeout_and_remaining():
+    deadline = Deadline(5)
+    assert 0 < deadline.remaining() <= 5
+    assert 4 < deadline.cap(10) <= 5
+    assert deadline.cap(0.5) == 0.5
+    assert deadline.cap(0) == MIN_WAIT_SEC
+    assert 4 < deadline.timeout() <= 5
+
+
+def test_expired_deadline_still_allows_minimal_wait():
+    deadline = Deadline(0.01)
+    time.sleep(0.02)
+    assert deadline.expired()
+    assert deadline.remaining() == 0.0
+    assert deadline.timeout() == 0.0
+    assert deadline.cap(10) == MIN_WAIT_SEC
+
+
+def test_ensure():
+    deadline = Deadline(5)
+    assert ensure(deadline) is deadline
+    assert ensure(None).timeout() is None
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+import dedup
+
+
+def job(company, title, link, deadline=""):
+    return {"company": company, "title": title, "link": link, "deadline": deadline}
+
+
+def test_same_posting_across_sites_is_merged_into_first_site():
+    results = {
+        "incruit": [job("테스트 주식회사", "파이썬 백엔드 개발자", "https://incruit/1")],
+        "jobplanet": [job("(주)테스트", "[테스트] 파이썬 백엔드 개발자", "https://jobplanet/1", "2030.01.31")],
+        "jobkorea": [job("㈜테스트", "파이썬 백엔드 개발자 (경력무관)", "https://jobkorea/1", "2030.01.31")],
+    }
+    merged = dedup.merge_results(results)
+
+    assert [len(merged[site]) for site in ("jobplanet", "jobkorea", "incruit")] == [1, 0, 0]
+    rep = merged["jobplanet"][0]
+    assert [s["site"] for s in rep["sources"]] == ["jobplanet", "jobkorea", "incruit"]
+    assert "_deadline" not in rep
+    # 공유되는 원본은 건드리지 않는다
+    assert "sources" not in results["jobplanet"][0]
+
+
+def test_different_deadlines_across_sites_stay_separate():
+    merged = dedup.merge_results({
+        "jobplanet": [job("테스트", "개발자", "https://jobplanet/1", "2030.01.31")],
+        "jobkorea": [job("테스트", "개발자", "https://jobkorea/1", "2030.03.31")],
+    })
+    assert len(merged["jobplanet"]) == 1 and len(merged["jobkorea"]) == 1
+
+
+def test_same_site_postings_need_matching_deadline_or_link():
+    merged = dedup.merge_results({"jobkorea": [
+        job("테스트", "개발자", "https://jobkorea/1"),
+        job("테스트", "개발자", "https://jobkorea/2"),                  # 마감일 모름: 다른 공고
+        job("테스트", "개발자", "https://jobkorea/3", "2030.01.31"),
+        job("테스트", "개발자", "https://jobkorea/4", "2030.01.31"),    # 같은 마감일: 같은 공고
+        job("테스트", "개발자", "https://jobkorea/1"),                  # 같은 링크
+    ]})
+    links = [j["link"] for j in merged["jobkorea"]]
+    assert links == ["https://jobkorea/1", "https://jobkorea/2", "https://jobkorea/3"]
+    assert [s["link"] for s in merged["jobkorea"][2]["sources"]] == ["https://jobkorea/3", "https://jobkorea/4"]
+
+
+def test_collapse_keeps_unknown_deadline_postings_with_distinct_links():
+    jobs = [
+        job("테스트", "개발자", "https://jobkorea/1"),
+        job("테스트", "개발자", "https://jobkorea/2"),
+        job("테스트", "개발자", "https://jobkorea/1"),
+        job("테스트", "개발자", "https://jobkorea/3", "2030.01.31"),
+        job("테스트", "개발자", "https://jobkorea/4", "2030.01.31"),
+    ]
+    assert [j["link"] for j in dedup.collapse(jobs)] == [
+        "https://jobkorea/1", "https://jobkorea/2", "https://jobkorea/3",
+    ]
+
+
+def test_fingerprint_ignores_corp_markers_and_brackets():
+    a = job("(주)테스트", "[채용] 파이썬 개발자", "x", "2030.01.31")
+    b = job("테스트", "파이썬  개발자", "y", "2030.01.31")
+    assert dedup.fingerprint(a) == dedup.fingerprint(b)
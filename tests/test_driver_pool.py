@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+import time
+
+import pytest
+
+import admission
+import driver_pool
+from driver_pool import DriverPool
+from driver_watchdog import quit_driver
+
+
+class FakeSwitchTo:
+    def window(self, handle):
+        pass
+
+    def default_content(self):
+        pass
+
+
+class FakeDriver:
+    def __init__(self):
+        self.window_handles = ["main"]
+        self.switch_to = FakeSwitchTo()
+        self.healthy = True
+        self.quits = 0
+
+    def execute_script(self, script):
+        return 1 if self.healthy else 0
+
+    def close(self):
+        pass
+
+    def delete_all_cookies(self):
+        pass
+
+    def get(self, url):
+        pass
+
+    def quit(self):
+        self.quits += 1
+
+
+@pytest.fixture(autouse=True)
+def budget(monkeypatch):
+    monkeypatch.setattr(admission, "BROWSER_BUDGET", 10)
+    monkeypatch.setattr(admission, "SOURCE_BUDGETS", {})
+    monkeypatch.setattr(admission, "ADMISSION_WAIT_SEC", 1.0)
+
+
+@pytest.fixture
+def factory():
+    created = []
+
+    def make():
+        created.append(FakeDriver())
+        return created[-1]
+
+    make.created = created
+    return make
+
+
+def in_use() -> int:
+    return admission.admission_stats()["in_use"]
+
+
+def test_reuses_idle_driver_and_creates_up_to_size(factory):
+    pool = DriverPool("t", factory, size=2, idle_timeout=0)
+    first = pool.acquire(timeout=0.1)
+    pool.release(first)
+    assert pool.acquire(timeout=0.1) is first
+    second = pool.acquire(timeout=0.1)
+    assert second is not first
+    assert (pool.stats["created"], pool.stats["reused"], pool.alive()) == (2, 1, 2)
+    assert in_use() == 2
+    pool.release(first)
+    pool.release(second)
+    assert in_use() == 0
+    assert [d.quits for d in factory.created] == [0, 0]
+
+
+def test_unhealthy_idle_driver_is_replaced(factory):
+    pool = DriverPool("t", factory, size=1, idle_timeout=0)
+    driver = pool.acquire(timeout=0.1)
+    pool.release(driver)
+    driver.healthy = False
+    fresh = pool.acquire(timeout=0.1)
+    assert fresh is not driver and driver.quits == 1
+    assert pool.alive() == 1
+    pool.release(fresh)
+
+
+def test_exhausted_pool_times_out_and_frees_admission(factory):
+    pool = DriverPool("t", factory, size=1, idle_timeout=0)
+    driver = pool.acquire(timeout=0.1)
+    start = time.monotonic()
+    with pytest.raises(TimeoutError):
+        pool.acquire(timeout=0.05)
+    assert time.monotonic() - start < 1.0
+    assert in_use() == 1
+    pool.release(driver)
+    assert in_use() == 0
+
+
+def test_discard_and_recycle_drop_driver_and_free_admission(factory, monkeypatch):
+    pool = DriverPool("t", factory, size=2, idle_timeout=0)
+    driver = pool.acquire(timeout=0.1)
+    pool.release(driver, discard=True)
+    assert driver.quits == 1
+    assert (pool.alive(), pool.stats["discarded"], in_use()) == (0, 1, 0)
+
+    monkeypatch.setattr(driver_pool, "should_recycle", lambda d: "navigations 200 >= 200")
+    driver = pool.acquire(timeout=0.1)
+    pool.release(driver)
+    assert driver.quits == 1
+    assert (pool.alive(), pool.stats["recycled"], in_use()) == (0, 1, 0)
+
+
+def test_detach_keeps_admission_until_quit(factory):
+    pool = DriverPool("t", factory, size=1, idle_timeout=0)
+    driver = pool.detach(pool.acquire(timeout=0.1))
+    assert pool.alive() == 0
+    assert in_use() == 1
+
+    # 풀 한도에서는 빠졌으므로 새로 빌릴 수 있다
+    other = pool.acquire(timeout=0.1)
+    assert other is not driver
+    pool.release(other)
+    assert in_use() == 1
+
+    quit_driver(driver)
+    assert driver.quits == 1
+    assert in_use() == 0
+
+
+def test_evict_idle_closes_expired_drivers(factory):
+    pool = DriverPool("t", factory, size=2, idle_timeout=0.05)
+    driver = pool.acquire(timeout=0.1)
+    pool.release(driver)
+    pool.evict_idle()
+    assert driver.quits == 0 and pool.alive() == 1
+
+    time.sleep(0.1)
+    pool.evict_idle()
+    assert driver.quits == 1
+    assert (pool.alive(), pool.stats["evicted"]) == (0, 1)
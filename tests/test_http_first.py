@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+pytest.importorskip("bs4")
+pytest.importorskip("selenium")
+
+from bs4 import BeautifulSoup  # noqa: E402
+
+import http_fetch  # noqa: E402
+import jk_crawler  # noqa: E402
+import scraper  # noqa: E402
+
+
+class FakeResponse:
+    def __init__(self, html, url):
+        self.content = html.encode("utf-8")
+        self.url = url
+
+    def raise_for_status(self):
+        pass
+
+
+@pytest.fixture
+def serve(monkeypatch):
+    """다음 HTTP 응답 본문을 정한다 (throttle 은 건너뛴다)."""
+    page = {}
+
+    class FakeSession:
+        def get(self, url, timeout=None):
+            return FakeResponse(page["html"], url)
+
+    monkeypatch.setattr(http_fetch, "get_session", lambda host: FakeSession())
+    monkeypatch.setattr(http_fetch, "throttle", lambda url: 0.0)
+    monkeypatch.setattr(http_fetch, "HTTP_FIRST", True)
+    return lambda html: page.__setitem__("html", html)
+
+
+def card(n):
+    return (f'<li class="list-post"><div class="post"><a href="/Recruit/GI_Read/{n}">백엔드 개발자 {n}</a>'
+            f'<a href="/Company/{n}">회사 {n}</a><span>서울 · 신입 · D-3 마감 예정 공고입니다</span></div></li>')
+
+
+def test_raw_cards_from_empty_results_page():
+    soup = BeautifulSoup("<html><body><div class='list-empty'>검색결과가 없습니다</div></body></html>", "html.parser")
+    assert jk_crawler.raw_cards_from_soup(soup, "https://www.jobkorea.co.kr/Search/", 20) == []
+
+
+def test_no_results_page_returns_empty_list_not_js_fallback(serve):
+    serve("<html><body><div class='list-empty'>검색결과가 없습니다</div></body></html>")
+    assert jk_crawler.collect_from_http("희귀한키워드", 1, 20) == []
+
+
+def test_short_last_page_is_parsed(serve):
+    serve(f"<html><body><ul>{card(1)}{card(2)}</ul></body></html>")
+    jobs = jk_crawler.collect_from_http("python", 3, 20)
+    assert [j.url for j in jobs] == [
+        "https://www.jobkorea.co.kr/Recruit/GI_Read/1", "https://www.jobkorea.co.kr/Recruit/GI_Read/2",
+    ]
+
+
+def test_js_shell_still_falls_back(serve):
+    serve("<html><body><div id='app'></div><script src='/bundle.js'></script></body></html>")
+    assert jk_crawler.collect_from_http("python", 1, 20) is None
+
+
+def test_empty_results_stop_pipeline_without_browser(serve, monkeypatch):
+    serve("<html><body><p>검색 결과가 없습니다.</p></body></html>")
+    monkeypatch.setattr(jk_crawler, "HTTP_FIRST", True)
+    monkeypatch.setattr(jk_crawler, "driver_pool", lambda: pytest.fail("브라우저로 대체하면 안 된다"))
+    items, driver = jk_crawler._crawl_core("희귀한키워드", 20)
+    assert items == [] and driver is None
+
+
+def test_incruit_no_results_page(serve):
+    serve("<html><body><div class='result_none'>'희귀한키워드'에 대한 검색결과가 없습니다.</div></body></html>")
+    assert scraper.scrape_incruit_http("희귀한키워드", 10) == []
+
+    serve("<html><body><div id='app'></div></body></html>")
+    assert scraper.scrape_incruit_http("python", 10) is None
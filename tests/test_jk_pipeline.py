@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+import time
+
+import pytest
+
+pytest.importorskip("selenium")
+pytest.importorskip("webdriver_manager")
+
+import jk_crawler  # noqa: E402
+from admission import AdmissionRejected  # noqa: E402
+from deadline import Deadline  # noqa: E402
+
+
+def pages(*sizes, fail_at=None, error=RuntimeError):
+    """페이지 번호 → Job 목록 대신 문자열 목록을 돌려주는 fetch_page."""
+    calls = []
+
+    def fetch(page):
+        calls.append(page)
+        if page == fail_at:
+            raise error("jk", "full") if error is AdmissionRejected else error("boom")
+        if page > len(sizes):
+            return []
+        return [f"p{page}-{i}" for i in range(sizes[page - 1])]
+    return fetch, calls
+
+
+def test_single_page_search_does_not_prefetch():
+    fetch, calls = pages(jk_crawler.PAGE_SIZE, jk_crawler.PAGE_SIZE)
+    out, _, need_js = jk_crawler._pipelined_pages(fetch, 5, depth=3)
+    assert len(out) == 5 and not need_js
+    assert calls == [1]
+
+
+def test_error_after_results_returns_collected():
+    fetch, _ = pages(jk_crawler.PAGE_SIZE, fail_at=2)
+    out, page, _ = jk_crawler._pipelined_pages(fetch, jk_crawler.PAGE_SIZE * 2, depth=2)
+    assert len(out) == jk_crawler.PAGE_SIZE and page == 2
+
+    fetch, _ = pages(fail_at=1)
+    with pytest.raises(RuntimeError):
+        jk_crawler._pipelined_pages(fetch, 10, depth=2)
+
+
+def test_admission_rejection_carries_collected_jobs():
+    fetch, _ = pages(jk_crawler.PAGE_SIZE, fail_at=2, error=AdmissionRejected)
+    with pytest.raises(AdmissionRejected) as exc:
+        jk_crawler._pipelined_pages(fetch, jk_crawler.PAGE_SIZE * 2, depth=2)
+    assert len(exc.value.partial) == jk_crawler.PAGE_SIZE
+
+
+def test_deadline_stops_waiting_for_slow_page():
+    def fetch(page):
+        if page > 1:
+            time.sleep(1)
+        return [f"p{page}-{i}" for i in range(jk_crawler.PAGE_SIZE)]
+
+    start = time.monotonic()
+    out, _, _ = jk_crawler._pipelined_pages(fetch, jk_crawler.PAGE_SIZE * 3, depth=2, deadline=Deadline(0.3))
+    assert len(out) == jk_crawler.PAGE_SIZE
+    assert time.monotonic() - start < 0.9
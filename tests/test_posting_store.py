@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+from datetime import date, timedelta
+
+import pytest
+
+import posting_store
+
+
+@pytest.fixture
+def db(tmp_path):
+    return str(tmp_path / "postings.db")
+
+
+def posting(n, **fields):
+    return {
+        "title": f"공고 {n}", "company": f"회사 {n}",
+        "url": f"https://www.jobkorea.co.kr/Recruit/GI_Read/{n}?Oem_Code=C1&rPageCode=SL",
+        "location": "서울", "career": "신입", "deadline": "", "deadline_norm": "", "dday": None,
+        **fields,
+    }
+
+
+def test_posting_key_drops_tracking_query():
+    assert posting_store.posting_key("https://m.jobkorea.co.kr/Recruit/GI_Read/123?x=1#top") == \
+        "https://www.jobkorea.co.kr/Recruit/GI_Read/123"
+    assert posting_store.posting_key("https://other.site/a#b") == "https://other.site/a"
+
+
+def test_upsert_is_idempotent_and_updates_fields(db):
+    assert posting_store.upsert([posting(1), posting(2)], "Python", path=db) == 2
+    assert posting_store.upsert([posting(1, title="수정된 공고")], "python", path=db) == 1
+
+    assert posting_store.stats(path=db) == {"postings": 2, "keywords": 1}
+    titles = {row["url"]: row["title"] for row in posting_store.find("python", path=db)}
+    assert titles["https://www.jobkorea.co.kr/Recruit/GI_Read/1"] == "수정된 공고"
+
+
+def test_known_is_scoped_to_keyword_and_newbie(db):
+    posting_store.upsert([posting(1), posting(2)], "python", newbie=True, path=db)
+    urls = [posting(1)["url"], posting(3)["url"]]
+
+    assert posting_store.known("python", True, urls, path=db) == {"https://www.jobkorea.co.kr/Recruit/GI_Read/1"}
+    assert posting_store.known("python", False, urls, path=db) == set()
+    assert posting_store.known("java", True, urls, path=db) == set()
+    assert posting_store.known("python", True, [], path=db) == set()
+
+
+def test_dday_only_posting_gets_deadline_and_is_recomputed(db):
+    posting_store.upsert([posting(1, dday=3), posting(2, dday=30), posting(3)], "python", path=db)
+
+    found = {row["url"][-1]: row for row in posting_store.find("python", path=db)}
+    assert found["1"]["deadline_norm"] == (date.today() + timedelta(days=3)).isoformat()
+    assert found["1"]["dday"] == 3
+    assert found["3"]["dday"] is None
+
+    within = posting_store.find("python", dday_within=7, path=db)
+    assert [row["url"][-1] for row in within] == ["1"]
+
+
+def test_find_limit_and_keyword_filter(db):
+    posting_store.upsert([posting(i) for i in range(5)], "python", path=db)
+    posting_store.upsert([posting(9)], "java", path=db)
+
+    assert len(posting_store.find("python", limit=3, path=db)) == 3
+    assert [row["url"][-1] for row in posting_store.find("java", path=db)] == ["9"]
+    assert len(posting_store.find(path=db)) == 6
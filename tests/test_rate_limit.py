@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+import time
+
+import rate_limit
+from rate_limit import TokenBucket
+
+
+def test_burst_is_free_then_waits_at_rate():
+    bucket = TokenBucket(rate=20.0, burst=3)
+    assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+
+    start = time.monotonic()
+    waited = bucket.acquire()
+    assert 0.03 < waited <= 0.05 + 1e-3
+    assert time.monotonic() - start >= waited * 0.9
+    assert bucket.stats["calls"] == 4
+    assert bucket.stats["waited"] == 1
+
+
+def test_tokens_refill_over_time():
+    bucket = TokenBucket(rate=50.0, burst=1)
+    bucket.acquire()
+    time.sleep(0.05)
+    assert bucket.acquire() == 0.0
+
+
+def test_burst_and_rate_have_floors():
+    bucket = TokenBucket(rate=0, burst=0)
+    assert bucket.capacity == 1
+    assert bucket.rate > 0
+
+
+def test_host_key():
+    assert rate_limit.host_key("https://www.jobkorea.co.kr/Search/?stext=python") == "jobkorea"
+    assert rate_limit.host_key("jobkorea") == "jobkorea"
+    assert rate_limit.host_key("https://example.com/") is None
+    assert rate_limit.throttle("https://example.com/") == 0.0
+
+
+def test_parse_rates_skips_bad_items():
+    assert rate_limit._parse_rates("jobkorea=2:4, bad, incruit=x:1, jobplanet=0.5") == {
+        "jobkorea": (2.0, 4), "jobplanet": (0.5, 1),
+    }
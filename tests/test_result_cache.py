@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+import os
+import time
+
+import pytest
+
+import cache_codec
+import result_cache
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(result_cache, "CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+
+RESULTS = {"jobkorea": [{"title": f"공고 {i}", "link": f"https://x/{i}"} for i in range(5)]}
+
+
+def test_save_then_lookup_slices_smaller_counts():
+    entry = result_cache.save("scrape_jobkorea", "Python", 5, RESULTS)
+    assert entry["keyword"] == "python"
+
+    results, state, result_set = result_cache.lookup("scrape_jobkorea", "  python ", 3, fresh_for=60)
+    assert state == "fresh"
+    assert result_set == entry["id"]
+    assert results == {"jobkorea": RESULTS["jobkorea"][:3]}
+
+
+def test_lookup_misses_when_more_is_wanted_or_expired():
+    entry = result_cache.save("scrape_jobkorea", "python", 5, RESULTS)
+    assert result_cache.lookup("scrape_jobkorea", "python", 6, fresh_for=60) == (None, None, None)
+
+    # 90초 전에 저장된 항목으로 바꿔 쓴다
+    entry["saved_at"] -= 90
+    with open(result_cache.cache_path("scrape_jobkorea", "python"), "wb") as f:
+        f.write(cache_codec.encode(entry))
+    assert result_cache.lookup("scrape_jobkorea", "python", 5, fresh_for=60, stale_for=60)[1] == "stale"
+    assert result_cache.lookup("scrape_jobkorea", "python", 5, fresh_for=60, stale_for=10)[1] is None
+
+
+def test_keywords_differing_only_in_symbols_do_not_collide():
+    result_cache.save("scrape_jobkorea", "node.js", 5, RESULTS)
+    assert result_cache.cache_path("scrape_jobkorea", "node.js") != result_cache.cache_path("scrape_jobkorea", "node_js")
+    assert result_cache.read_entry("scrape_jobkorea", "node_js") is None
+    assert result_cache.read_entry("scrape_jobkorea", "node.js")["results"] == RESULTS
+
+
+def test_legacy_file_with_other_keyword_is_rejected(cache_dir):
+    # 예전 이름 규칙에서는 'node.js' 와 'node_js' 가 같은 파일을 썼다
+    legacy = result_cache._legacy_paths("scrape_jobkorea", "node_js")[0]
+    entry = {"count": 5, "saved_at": time.time(), "id": "old", "keyword": "node.js", "results": RESULTS}
+    with open(legacy, "wb") as f:
+        f.write(cache_codec.encode(entry))
+
+    assert result_cache.read_entry("scrape_jobkorea", "node_js") is None
+    assert result_cache.read_entry("scrape_jobkorea", "node.js")["id"] == "old"
+
+
+def test_save_replaces_legacy_file_and_delete_removes_all():
+    legacy = result_cache._legacy_paths("scrape_jobkorea", "python")[1]
+    with open(legacy, "wb") as f:
+        f.write(cache_codec.encode({"count": 1, "keyword": "python", "results": RESULTS}, "json"))
+
+    result_cache.save("scrape_jobkorea", "python", 5, RESULTS)
+    assert not os.path.exists(legacy)
+    assert result_cache.delete("scrape_jobkorea", "python")
+    assert result_cache.read_entry("scrape_jobkorea", "python") is None
+    assert not result_cache.delete("scrape_jobkorea", "python")
+
+
+def test_sweep_removes_expired_and_lru_overflow(cache_dir, monkeypatch):
+    for i in range(4):
+        result_cache.save("scrape_jobkorea", f"kw{i}", 5, RESULTS)
+    expired = result_cache.cache_path("scrape_jobkorea", "kw0")
+    old = time.time() - result_cache.CACHE_TTL_SEC - 10
+    os.utime(expired, (old, old))
+    stale_tmp = cache_dir / "scrape_jobkorea_x.cache.1.2.tmp"
+    stale_tmp.write_bytes(b"")
+    os.utime(stale_tmp, (old, old))
+
+    monkeypatch.setattr(result_cache, "CACHE_MAX_ENTRIES", 2)
+    removed = result_cache.sweep()
+
+    assert removed == {"expired": 1, "lru": 1}
+    assert not os.path.exists(expired)
+    assert not stale_tmp.exists()
+    assert len(list(cache_dir.glob("*.cache"))) == 2
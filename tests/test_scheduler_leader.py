@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+import json
+import time
+
+import pytest
+
+from scheduler_leader import LeaderElection
+
+
+@pytest.fixture
+def lease_path(tmp_path):
+    return str(tmp_path / "scheduler_leader.json")
+
+
+def node(path, owner, events=None, lease=30.0):
+    events = [] if events is None else events
+    election = LeaderElection(
+        path=path, lease=lease, heartbeat=1,
+        on_elected=lambda: events.append((owner, "elected")),
+        on_demoted=lambda: events.append((owner, "demoted")),
+    )
+    election.owner = owner   # start() 없이 tick() 만 직접 돌린다
+    return election
+
+
+def test_first_node_wins_and_others_follow(lease_path):
+    events = []
+    a, b = node(lease_path, "a", events), node(lease_path, "b", events)
+
+    assert a.tick() is True
+    assert b.tick() is False
+    assert a.tick() is True
+    assert events == [("a", "elected")]
+    assert b.current["owner"] == "a"
+    assert a.still_leader() and not b.still_leader()
+
+
+def test_stale_lease_is_taken_over(lease_path):
+    events = []
+    a, b = node(lease_path, "a", events, lease=0.2), node(lease_path, "b", events, lease=0.2)
+    assert a.tick()
+    time.sleep(0.3)   # a 가 heartbeat 를 멈춤
+
+    assert b.tick() is True
+    assert not a.still_leader()
+    assert a.tick() is False
+    assert events == [("a", "elected"), ("b", "elected"), ("a", "demoted")]
+
+
+def test_stop_releases_lease_for_next_heartbeat(lease_path):
+    a, b = node(lease_path, "a"), node(lease_path, "b")
+    assert a.tick()
+    a.stop()
+    assert not a.is_leader
+    assert b.tick() is True
+
+
+def test_corrupt_lease_is_treated_as_missing(lease_path):
+    with open(lease_path, "w") as f:
+        f.write("{not json")
+    a = node(lease_path, "a")
+    assert a.tick() is True
+    with open(lease_path) as f:
+        assert json.load(f)["owner"] == "a"
+
+
+def test_unwritable_lease_demotes(tmp_path):
+    a = node(str(tmp_path / "missing-dir" / "lease.json"), "a")
+    assert a.tick() is False
+    assert a.stats["errors"] == 1
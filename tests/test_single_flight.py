@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+
+import pytest
+
+from single_flight import SingleFlight
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def work(x):
+        calls.append(x)
+        started.set()
+        release.wait(5)
+        return [x]
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(flight.do("k", work, 1)))
+    leader.start()
+    assert started.wait(5)
+    followers = [threading.Thread(target=lambda: results.append(flight.do("k", work, 2))) for _ in range(3)]
+    for t in followers:
+        t.start()
+    while flight.snapshot()["coalesced"] < 3:
+        time.sleep(0.01)
+    release.set()
+    for t in [leader] + followers:
+        t.join(5)
+
+    assert calls == [1]
+    assert results == [[1]] * 4
+    assert flight.snapshot() == {"leaders": 1, "coalesced": 3, "in_flight": 0}
+
+
+def test_exception_reaches_waiters_and_key_is_freed():
+    flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+
+    def fail():
+        started.set()
+        release.wait(5)
+        raise ValueError("boom")
+
+    errors = []
+
+    def call():
+        try:
+            flight.do("k", fail)
+        except ValueError as e:
+            errors.append(str(e))
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    assert started.wait(5)
+    follower = threading.Thread(target=call)
+    follower.start()
+    while flight.snapshot()["coalesced"] < 1:
+        time.sleep(0.01)
+    release.set()
+    leader.join(5)
+    follower.join(5)
+
+    assert errors == ["boom", "boom"]
+    # 끝난 호출은 다시 실행된다 (결과를 캐시하지 않는다)
+    assert flight.do("k", lambda: "again") == "again"
+
+
+def test_different_keys_run_separately():
+    flight = SingleFlight()
+    assert flight.do("a", lambda: 1) == 1
+    assert flight.do("b", lambda: 2) == 2
+    with pytest.raises(KeyError):
+        flight.do("c", {}.__getitem__, "missing")
+    assert flight.snapshot()["leaders"] == 3